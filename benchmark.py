@@ -0,0 +1,150 @@
+"""Benchmark the suite against the offline fixture storefront.
+
+Runs every module on its own, then the full EcommerceTestSuite, once per
+catalog size, and records wall time, WebDriver round trips and peak Python
+memory. Results go to reports/benchmark/benchmark.json.
+
+    python benchmark.py --sizes 24 96 384
+"""
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+from decimal import Decimal
+from config.config import Config
+from utils.fixture_server import FixtureStorefront
+from utils.driver_pool import DriverPool
+from utils.driver_tracer import CommandTracer
+from utils.result_sink import ResultSink
+from utils.scheduler import run_module
+from main import EcommerceTestSuite, select_modules
+
+
+def configure_for_benchmark(latency):
+    """Keep benchmark runs reproducible and away from the real reports"""
+    Config.REPORT_DIR = os.path.join(Config.REPORT_DIR, "benchmark")
+    Config.RESULTS_STREAM_PATH = os.path.join(Config.REPORT_DIR, "results.jsonl")
+    Config.PARALLEL_MODE = "threads"  # Round trips are only traced in this process
+    Config.PERF_HISTORY_ENABLED = False
+    Config.LINK_CACHE_ENABLED = False
+    Config.FIXTURE_LATENCY = latency
+    Config.LINK_CHECK_RATE_PER_HOST = Config.LINK_CHECK_BURST = Config.FIXTURE_RATE_PER_HOST
+    Config.setup_directories()
+
+
+def measure(label, catalog_size, run):
+    """Run once and return wall time, round trips and peak traced memory"""
+    tracer = CommandTracer.shared()
+    round_trips = tracer.round_trips
+    tracemalloc.reset_peak()
+    start = time.perf_counter()
+    run()
+    wall_time = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    return {
+        "run": label,
+        "catalog_size": catalog_size,
+        "wall_time": round(wall_time, 3),
+        "round_trips": tracer.round_trips - round_trips,
+        "peak_memory_mb": round(peak / (1024 * 1024), 2)
+    }
+
+
+def benchmark_size(catalog_size, include_modules=True, include_suite=True):
+    rows = []
+    with FixtureStorefront(catalog_size=catalog_size) as storefront:
+        Config.set_base_url(storefront.url)
+        print(f"\n📦 Catalog of {catalog_size} products at {storefront.url}")
+
+        if include_modules:
+            # One warm browser for all module runs, so launch cost is only paid once
+            driver_pool = DriverPool(max_size=1)
+            sink = ResultSink.install(Config.RESULTS_STREAM_PATH, rotate=True)
+            try:
+                for spec in select_modules():
+                    rows.append(measure(spec.name, catalog_size, lambda: run_module(spec, driver_pool)))
+            finally:
+                sink.close()
+                driver_pool.shutdown()
+
+        if include_suite:
+            rows.append(measure("Full Suite", catalog_size, lambda: EcommerceTestSuite().run_full_suite()))
+    return rows
+
+
+def benchmark_price_diff(sku_count, seed=0):
+    """Time loading and diffing two price snapshots of ``sku_count`` SKUs"""
+    from utils.price_snapshots import PriceSnapshotStore
+
+    rng = random.Random(seed)
+    with tempfile.TemporaryDirectory() as root:
+        store = PriceSnapshotStore(root=root)
+        old = [(f"SKU-{i}", Decimal(rng.randint(100, 999999)).scaleb(-2), None) for i in range(sku_count)]
+        # ~1% price changes, 0.1% removed and 0.1% new SKUs
+        new = [(sku, price + Decimal("1.01") if i % 100 == 0 else price, detail)
+               for i, (sku, price, detail) in enumerate(old) if i % 1000 != 1]
+        new += [(f"NEW-{i}", Decimal("9.99"), None) for i in range(sku_count // 1000)]
+        old_id = store.record("benchmark", old).id
+        new_id = store.record("benchmark", new).id
+
+        def run():
+            reader = PriceSnapshotStore(root=root)
+            diff = reader.diff(reader.load(old_id), reader.load(new_id))
+            print(f"💰 {sku_count} SKUs: {len(diff['changed'])} changed, {len(diff['added'])} new, "
+                  f"{len(diff['removed'])} removed")
+
+        # tracemalloc slows this allocation-heavy loop several times over, so time it untraced
+        tracing = tracemalloc.is_tracing()
+        tracemalloc.stop()
+        try:
+            row = measure("Price Snapshot Diff", sku_count, run)
+        finally:
+            if tracing:
+                tracemalloc.start()
+        row["peak_memory_mb"] = None
+        return row
+
+
+def print_table(rows):
+    print(f"\n{'run':<20} {'catalog':>8} {'wall':>9} {'trips':>7} {'peak MB':>8}")
+    for row in rows:
+        print(f"{row['run']:<20} {row['catalog_size']:>8} {row['wall_time']:>8.2f}s "
+              f"{row['round_trips']:>7} {'-' if row['peak_memory_mb'] is None else format(row['peak_memory_mb'], '.2f'):>8}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the suite against the local fixture storefront")
+    parser.add_argument("--sizes", type=int, nargs="+", default=Config.BENCHMARK_CATALOG_SIZES,
+                        help="catalog sizes to run against")
+    parser.add_argument("--latency", type=float, default=Config.FIXTURE_LATENCY,
+                        help="seconds of latency added to every fixture response")
+    parser.add_argument("--modules-only", action="store_true", help="skip the full suite runs")
+    parser.add_argument("--suite-only", action="store_true", help="skip the per-module runs")
+    parser.add_argument("--price-diff", type=int, nargs="?", const=Config.BENCHMARK_PRICE_DIFF_SKUS, default=0,
+                        metavar="SKUS", help="also time loading and diffing two price snapshots of this many SKUs")
+    args = parser.parse_args(argv)
+
+    configure_for_benchmark(args.latency)
+    tracemalloc.start()
+    rows = []
+    for catalog_size in args.sizes:
+        rows.extend(benchmark_size(catalog_size, include_modules=not args.suite_only,
+                                   include_suite=not args.modules_only))
+    if args.price_diff:
+        rows.append(benchmark_price_diff(args.price_diff))
+    tracemalloc.stop()
+
+    output_path = os.path.join(Config.REPORT_DIR, "benchmark.json")
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump({"generated": time.strftime("%Y-%m-%d %H:%M:%S"), "latency": args.latency,
+                   "results": rows}, f, indent=2)
+    print_table(rows)
+    print(f"\n📄 Benchmark written to {output_path}")
+    print("   Peak memory covers Python allocations only; browser processes are not included.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+"""Command-line entry point for the suite.
+
+    python -m cli list
+    python -m cli run                                   # everything (like main.py)
+    python -m cli run -m links price                    # HTTP-only checks, no browser import
+    python -m cli run -m functional -t login search
+    python -m cli run -m data --queries queries.csv --categories laptops phones
+    python -m cli run --fixture                         # against the offline fixture storefront
+    python -m cli benchmark --sizes 24 96
+    python -m cli coordinator | worker ...              # see distributed.py
+    python -m cli import-times                          # fail if startup exceeds Config.IMPORT_BUDGETS
+    python -m cli report --from reports/results.jsonl   # rebuild reports from a (crashed) run's stream
+
+Test modules are only imported once selected, so a links-only run never
+loads selenium or the browser modules. Keep imports at the top of this file
+to the standard library and config.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from config.config import Config
+
+PASSTHROUGH_COMMANDS = {"benchmark": "benchmark", "coordinator": "distributed", "worker": "distributed"}
+
+
+def data_set(values):
+    """A single .csv/.json argument is a file path; anything else is a list of values"""
+    if len(values) == 1 and os.path.splitext(values[0])[1].lower() in (".csv", ".json"):
+        return values[0]
+    return values
+
+
+def command_list(args):
+    from main import TEST_MODULES
+
+    for spec in TEST_MODULES:
+        notes = []
+        if spec.enabled_by:
+            notes.append(f"opt-in: {spec.enabled_by}")
+        if spec.exclusive:
+            notes.append("runs alone")
+        print(f"{spec.key:<12} {spec.name:<20} {', '.join(notes)}")
+    return 0
+
+
+def command_run(args):
+    if args.base_url:
+        Config.set_base_url(args.base_url)
+    if args.tests:
+        Config.TEST_SELECTION = args.tests
+    if args.queries:
+        Config.DATA_DRIVEN_QUERIES = data_set(args.queries)
+    if args.categories:
+        Config.DATA_DRIVEN_CATEGORIES = data_set(args.categories)
+    if args.parallel:
+        Config.PARALLEL_MODE = args.parallel
+    if args.workers:
+        Config.PARALLEL_WORKERS = args.workers
+    if args.replay:
+        Config.REPLAY_MODE = args.replay
+    if args.headless:
+        Config.HEADLESS = True
+    if args.incremental:
+        Config.INCREMENTAL_MODE = True
+
+    from main import EcommerceTestSuite, select_modules
+
+    try:
+        modules = select_modules(args.modules)
+    except ValueError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 2
+    print(f"🧩 Modules: {', '.join(spec.name for spec in modules)}")
+    if args.fixture:
+        from utils.fixture_server import FixtureStorefront
+
+        with FixtureStorefront() as storefront:
+            Config.set_base_url(storefront.url)
+            Config.LINK_CHECK_RATE_PER_HOST = Config.LINK_CHECK_BURST = Config.FIXTURE_RATE_PER_HOST
+            summary = EcommerceTestSuite().run_full_suite(modules)
+    else:
+        summary = EcommerceTestSuite().run_full_suite(modules)
+    return 1 if summary is None or summary["failed"] else 0
+
+
+def time_import(target, repeats):
+    """Median import time of ``target`` in fresh interpreters, and the heavy packages it loaded"""
+    probe = ("import sys, time, json\n"
+             "start = time.perf_counter()\n"
+             f"import {target}\n"
+             "elapsed = time.perf_counter() - start\n"
+             f"print(json.dumps([elapsed, [name for name in {Config.IMPORT_HEAVY_PACKAGES!r} if name in sys.modules]]))")
+    times, loaded = [], []
+    for _ in range(repeats):
+        completed = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True,
+                                   cwd=os.path.dirname(os.path.abspath(__file__)))
+        if completed.returncode != 0:
+            error = completed.stderr.strip().splitlines()
+            return {"target": target, "error": error[-1] if error else f"exit code {completed.returncode}"}
+        elapsed, loaded = json.loads(completed.stdout.strip().splitlines()[-1])
+        times.append(elapsed)
+    return {"target": target, "median": round(statistics.median(times), 4), "min": round(min(times), 4),
+            "heavy_imports": loaded}
+
+
+def command_import_times(args):
+    from main import TEST_MODULES
+
+    targets = ["cli", "main"] + [spec.module_path for spec in TEST_MODULES]
+    rows = [time_import(target, args.repeats) for target in targets]
+    failures = []
+    print(f"\n{'import':<32} {'median':>9} {'budget':>8}  heavy imports")
+    for row in rows:
+        budget = Config.IMPORT_BUDGETS.get(row["target"])
+        if "error" in row:
+            print(f"{row['target']:<32} {'-':>9} {'-':>8}  import failed: {row['error']}")
+            if budget is not None:
+                failures.append(f"{row['target']} failed to import")
+            continue
+        print(f"{row['target']:<32} {row['median'] * 1000:>7.1f}ms "
+              f"{f'{budget * 1000:.0f}ms' if budget else '-':>8}  {', '.join(row['heavy_imports']) or '-'}")
+        if budget is not None and row["median"] > budget:
+            failures.append(f"{row['target']} took {row['median'] * 1000:.1f}ms (budget {budget * 1000:.0f}ms)")
+        if budget is not None and row["heavy_imports"]:
+            failures.append(f"{row['target']} loads {', '.join(row['heavy_imports'])} at import time")
+
+    Config.setup_directories()
+    output_path = os.path.join(Config.REPORT_DIR, "import_times.json")
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump({"python": sys.version.split()[0], "repeats": args.repeats, "results": rows,
+                   "failures": failures}, f, indent=2)
+    for failure in failures:
+        print(f"❌ {failure}")
+    print(f"\n📄 Import times written to {output_path}")
+    return 1 if failures else 0
+
+
+def stream_span(path):
+    """Seconds between the first and last result timestamps in a result stream"""
+    from utils.result_sink import iter_results
+
+    stamps = [time.mktime(time.strptime(result["timestamp"], "%Y-%m-%d %H:%M:%S"))
+              for result in iter_results(path) if result.get("timestamp")]
+    return max(stamps) - min(stamps) if stamps else 0.0
+
+
+def command_report(args):
+    if not os.path.exists(args.source):
+        print(f"❌ No result stream at {args.source}", file=sys.stderr)
+        return 2
+    from main import TEST_MODULES
+    from utils.reporting import ReportGenerator
+    from utils.result_sink import iter_results
+
+    Config.setup_directories()
+    summary = ReportGenerator().generate_reports(iter_results(args.source), stream_span(args.source),
+                                                 module_order=[spec.name for spec in TEST_MODULES])
+    print(f"📊 {summary['total']} tests: {summary['passed']} passed, {summary['failed']} failed "
+          f"({summary['success_rate']:.1f}%)")
+    return 1 if summary["failed"] else 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m cli", description="Smart E-Commerce Testing Suite")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("list", help="list the test modules that can be selected")
+
+    run = subparsers.add_parser("run", help="run the suite or selected modules")
+    run.add_argument("-m", "--modules", nargs="+", metavar="MODULE",
+                     help="module keys or names to run (default: all enabled modules; see 'list')")
+    run.add_argument("-t", "--tests", nargs="+", metavar="NAME",
+                     help="only run tests whose name contains one of these (case-insensitive)")
+    run.add_argument("--queries", nargs="+", metavar="QUERY",
+                     help="data-driven search queries, or one .csv/.json file")
+    run.add_argument("--categories", nargs="+", metavar="CATEGORY",
+                     help="data-driven categories, or one .csv/.json file")
+    run.add_argument("--base-url", help="storefront to test (default: Config.BASE_URL)")
+    run.add_argument("--fixture", action="store_true", help="serve and test the offline fixture storefront")
+    run.add_argument("--parallel", choices=["threads", "processes", "distributed"])
+    run.add_argument("--workers", type=int, help="modules run concurrently")
+    run.add_argument("--replay", choices=["off", "record", "replay"])
+    run.add_argument("--headless", action="store_true")
+    run.add_argument("--incremental", action="store_true", help="reuse verdicts for unchanged pages")
+
+    report = subparsers.add_parser("report", help="render reports from a result stream without running tests")
+    report.add_argument("--from", dest="source", default=Config.RESULTS_STREAM_PATH, metavar="RESULTS_JSONL",
+                        help="results.jsonl stream to render (default: the last run's)")
+
+    import_times = subparsers.add_parser("import-times", help="benchmark import time of the entry points")
+    import_times.add_argument("--repeats", type=int, default=Config.IMPORT_TIME_REPEATS)
+
+    for command, module in PASSTHROUGH_COMMANDS.items():
+        subparsers.add_parser(command, help=f"see {module}.py --help", add_help=False)
+    return parser
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] in PASSTHROUGH_COMMANDS:
+        # Delegate to the existing scripts with their own arguments
+        import importlib
+
+        module = importlib.import_module(PASSTHROUGH_COMMANDS[argv[0]])
+        module.main(argv if module.__name__ == "distributed" else argv[1:])
+        return 0
+
+    args = build_parser().parse_args(argv)
+    commands = {"list": command_list, "run": command_run, "report": command_report, "import-times": command_import_times}
+    return commands[args.command](args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
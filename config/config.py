@@ -5,14 +5,85 @@ class Config:
     # Browser Configuration
     BROWSER = "chrome"
     HEADLESS = False
-    IMPLICIT_WAIT = 10
+    IMPLICIT_WAIT = 10          # Explicit wait timeout used by WebDriverWait
+    DRIVER_IMPLICIT_WAIT = 0    # Global implicit wait on pooled drivers
+    LOCATOR_TIMEOUT = 5         # Seconds to wait for any fallback locator to match
+    LOCATOR_POLL_INTERVAL = 0.1
     PAGE_LOAD_TIMEOUT = 30
+    DRIVER_POOL_MAX_SIZE = 2  # Browser sessions shared across all modules
+    
+    # WebDriver command tracing
+    TRACE_WEBDRIVER = True
+    TRACE_TOP_N = 25
+    
+    # Parallel Execution
+    PARALLEL_WORKERS = 2
+    PARALLEL_MODE = "threads"  # "threads", "processes" or "distributed"
+    PERFORMANCE_RUNS_ALONE = True  # Keep performance timings free of contention
+    TEST_SELECTION = None  # Test name substrings to run within selected modules (cli.py --tests); None runs all
+    
+    # Distributed execution (PARALLEL_MODE = "distributed"; see distributed.py)
+    COORDINATOR_HOST = "127.0.0.1"   # Use "0.0.0.0" to accept workers from other hosts
+    COORDINATOR_PORT = 8765
+    DISTRIBUTED_LOCAL_WORKERS = 2    # Worker processes started by the coordinator; 0 waits for remote ones
+    DISTRIBUTED_HEARTBEAT = 5        # Seconds between worker heartbeats
+    DISTRIBUTED_LEASE_TIMEOUT = 30   # Silent workers lose their task after this long
+    DISTRIBUTED_MAX_ATTEMPTS = 2
+    DISTRIBUTED_IDLE_TIMEOUT = 300   # Fail outstanding work if no worker has been heard from
+    DISTRIBUTED_CONNECT_RETRIES = 5
+    DISTRIBUTED_RESULT_RETRIES = 3   # Tries to deliver a result before the worker abandons the attempt
+    DISTRIBUTED_DATA_SHARDS = 4      # Tasks a shardable module (Data Driven) is split into
+    REMOTE_WEBDRIVER_URL = None      # e.g. "http://grid:4444/wd/hub"; workers use webdriver.Remote when set
+    # Run settings the coordinator sends with every task, so cli.py overrides reach every worker
+    DISTRIBUTED_FORWARDED_SETTINGS = ["TEST_SELECTION", "DATA_DRIVEN_QUERIES", "DATA_DRIVEN_CATEGORIES",
+                                      "HEADLESS", "INCREMENTAL_MODE", "FAST_MODE", "PRICE_CHECK_MODE",
+                                      "LINK_DISCOVERY_MODE", "LOAD_PROFILE", "LINK_CHECK_RATE_PER_HOST",
+                                      "LINK_CHECK_BURST"]
     
     # Test URLs - Using demo e-commerce site
     BASE_URL = "https://demo.nopcommerce.com"
     LOGIN_URL = f"{BASE_URL}/login"
     PRODUCTS_URL = f"{BASE_URL}/electronics"
     SEARCH_URL = f"{BASE_URL}/search"
+    # Category listing pages checked for product card consistency
+    UI_CHECK_URLS = [
+        PRODUCTS_URL,
+        f"{BASE_URL}/books",
+        f"{BASE_URL}/jewelry",
+        f"{BASE_URL}/gift-cards"
+    ]
+    
+    # Data-driven sharding (modules/data_driven.py)
+    DATA_DRIVEN_WORKERS = 2
+    DATA_DRIVEN_QUERIES = None      # None uses TestData.PRODUCTS; or a .csv/.json file path
+    DATA_DRIVEN_CATEGORIES = None   # None uses TestData.CATEGORIES; or a .csv/.json file path
+    
+    # Offline fixture storefront (utils/fixture_server.py) and benchmark harness
+    FIXTURE_HOST = "127.0.0.1"
+    FIXTURE_PORT = 0             # 0 picks a free port
+    FIXTURE_CATALOG_SIZE = 48
+    FIXTURE_PAGE_SIZE = 12       # Products per category listing page
+    FIXTURE_LATENCY = 0.0        # Seconds added to every response
+    FIXTURE_RATE_PER_HOST = 200  # LINK_CHECK_RATE_PER_HOST for --fixture runs; the local server isn't shared
+    # Extra footer links: path -> (status, delay seconds)
+    FIXTURE_LINKS = {
+        "/shipping-returns": (200, 0.0),
+        "/slow-page": (200, 1.0),
+        "/missing-page": (404, 0.0),
+        "/server-error": (500, 0.0)
+    }
+    BENCHMARK_CATALOG_SIZES = [24, 96, 384]
+    BENCHMARK_PRICE_DIFF_SKUS = 100000  # benchmark.py --price-diff
+    # Import-time budgets in seconds (python -m cli import-times); these entry points must
+    # start without loading any of IMPORT_HEAVY_PACKAGES
+    IMPORT_BUDGETS = {"cli": 0.05, "main": 0.15, "modules.broken_links": 0.1,
+                      "modules.price_consistency": 0.1, "modules.load_testing": 0.1}
+    IMPORT_HEAVY_PACKAGES = ["selenium", "PIL", "lxml", "requests"]
+    IMPORT_TIME_REPEATS = 5
+    
+    # Record/replay (utils/record_replay.py): "off", "record" (live site, archived) or "replay" (archive only)
+    REPLAY_MODE = "off"
+    REPLAY_LATENCY = None        # None, "recorded" (original timings) or seconds per response
     
     # Test Credentials - You'll need to register these first or use guest checkout
     TEST_EMAIL = "test@example.com"  # Update with actual registered email
@@ -21,10 +92,112 @@ class Config:
     # Performance Thresholds
     MAX_PAGE_LOAD_TIME = 5
     ACCEPTABLE_LOAD_TIME = 3
+    # Per-metric (acceptable, maximum) limits in seconds
+    PERFORMANCE_THRESHOLDS = {
+        "ttfb": (0.8, 1.8),
+        "first_contentful_paint": (1.8, 3.0),
+        "largest_contentful_paint": (2.5, 4.0),
+        "dom_content_loaded": (2.0, 4.0),
+        "load": (ACCEPTABLE_LOAD_TIME, MAX_PAGE_LOAD_TIME)
+    }
+    PERFORMANCE_WATERFALL_SIZE = 10  # Slowest resources kept per page
+    PERFORMANCE_LOAD_EVENT_WAIT = 5  # Seconds to wait for loadEventEnd before a sample has no load time
+    
+    # Load Time Sampling
+    PERFORMANCE_CACHE_MODES = ["cold", "warm"]
+    PERFORMANCE_WARMUP_SAMPLES = 1   # Leading samples discarded per page and mode
+    PERFORMANCE_MIN_SAMPLES = 5
+    PERFORMANCE_MAX_SAMPLES = 20
+    PERFORMANCE_TARGET_CI = 0.05     # Stop once the 95% CI is within 5% of the mean
+    PERFORMANCE_THRESHOLD_PERCENTILE = "p95"  # "median", "p95" or "p99"
+    
+    # Performance History and Regression Detection
+    PERF_HISTORY_ENABLED = True
+    PERF_BASELINE_RUNS = 10       # Previous runs forming the rolling baseline
+    PERF_BASELINE_MIN_RUNS = 3    # Runs needed before regressions are flagged
+    PERF_REGRESSION_Z = 3.0       # Standard deviations above baseline mean
+    PERF_REGRESSION_MIN_DELTA = 0.10  # And at least 10% slower
+    PERF_TREND_POINTS = 20
+    
+    # Link Checking
+    LINK_CHECK_WORKERS = 16          # Concurrency across hosts; never raises the load on any one host
+    LINK_CHECK_RATE_PER_HOST = 5     # Requests per second to any one host, per budget (crawl / check)
+    LINK_CHECK_BURST = 5
+    LINK_CHECK_TIMEOUT = 10
+    LINK_CHECK_MAX_LINKS = 5000
+    LINK_DISCOVERY_MODE = "crawl"  # "crawl" (HTTP + lxml) or "homepage" (Selenium)
+    CRAWL_MAX_DEPTH = 2
+    CRAWL_MAX_PAGES = 200
+    CRAWL_USER_AGENT = "SmartEcommerceTesting/1.0"
+    
+    # Link Status Cache (persists between runs)
+    LINK_CACHE_ENABLED = True
+    LINK_CACHE_TTL = 24 * 60 * 60  # Seconds a healthy result is trusted without a request
+    LINK_CACHE_STALE_FACTOR = 7    # Stale entries kept for revalidation up to TTL * factor
+    LINK_CACHE_MAX_ENTRIES = 50000
+    
+    # Price Checking
+    PRICE_CHECK_MODE = "http"  # "http" (requests + lxml) or "browser" (Selenium click-through)
+    PRICE_FETCH_WORKERS = 8
+    PRICE_FETCH_RATE_PER_HOST = 20
+    PRICE_MAX_LISTING_PAGES = 50
+    PRICE_BROWSER_MAX_PRODUCTS = 3  # Products clicked through in browser mode; None checks the whole first page
+    PRICE_LOCALE = "en_US"         # Decides the decimal separator when parsing prices; None guesses per value
+    PRICE_SNAPSHOTS_ENABLED = True  # Keep each run's SKU prices and report changes since the last run
+    PRICE_SNAPSHOT_SCALE = 4       # Decimal places stored exactly
+    PRICE_DIFF_REPORT_LIMIT = 10   # Changed/new/removed SKUs named in the result message
+    
+    # Fast mode: block resources that DOM and text checks never look at
+    FAST_MODE = True
+    BLOCKED_RESOURCE_PATTERNS = {
+        "image": ["*.png*", "*.jpg*", "*.jpeg*", "*.gif*", "*.webp*", "*.svg*", "*.ico*"],
+        "font": ["*.woff*", "*.woff2*", "*.ttf*", "*.otf*", "*.eot*"],
+        "media": ["*.mp4*", "*.webm*", "*.mp3*", "*.ogg*"],
+        "tracker": ["*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+                    "*facebook.net*", "*hotjar.com*"]
+    }
+    # Module name -> blocked categories; modules not listed (Performance) load everything
+    FAST_MODE_POLICIES = {
+        "Functional Testing": ["image", "font", "media", "tracker"],
+        "UI Consistency": ["font", "media", "tracker"],  # Card checks need images to lay out
+        "Price Consistency": ["image", "font", "media", "tracker"],
+        "Data Driven": ["font", "media", "tracker"]
+    }
+    
+    # Incremental reruns: reuse passing verdicts for pages whose relevant markup is unchanged
+    INCREMENTAL_MODE = False
+    INCREMENTAL_MAX_AGE = 24 * 3600  # Seconds before a reused verdict must be re-earned
+    
+    # HTTP load generation (modules/load_testing.py); only point it at a store you operate
+    LOAD_TEST_ENABLED = False
+    LOAD_PROFILE = [(30, 20), (60, 20), (10, 0)]  # (seconds, virtual users to ramp to) per stage
+    LOAD_THINK_TIME = 1.0        # Mean pause between iterations of one virtual user
+    LOAD_REQUEST_TIMEOUT = 30
+    LOAD_PRODUCT_SLUG = "apple-macbook-pro-13-inch"
+    LOAD_MAX_ERROR_RATE = 0.01
+    LOAD_P95_THRESHOLD = 2.0     # Seconds
+    
+    # Screenshots
+    SCREENSHOT_FORMAT = "jpeg"  # "jpeg", "webp" or "png"; PNG is used when Pillow is not installed
+    SCREENSHOT_QUALITY = 70
+    SCREENSHOT_THUMB_WIDTH = 320
     
     # Paths
     SCREENSHOT_DIR = "screenshots"
+    SCREENSHOT_THUMB_DIR = os.path.join(SCREENSHOT_DIR, "thumbs")
     REPORT_DIR = "reports"
+    CACHE_DIR = ".cache"
+    LINK_CACHE_PATH = os.path.join(CACHE_DIR, "link_status.json")
+    PERF_HISTORY_PATH = os.path.join(REPORT_DIR, "performance_history.db")
+    RESOURCE_SIZE_CACHE_PATH = os.path.join(CACHE_DIR, "resource_sizes.json")
+    REPLAY_ARCHIVE_DIR = os.path.join(CACHE_DIR, "recordings", "default")
+    INCREMENTAL_CACHE_PATH = os.path.join(CACHE_DIR, "verdicts.json")
+    PRICE_SNAPSHOT_DIR = os.path.join(CACHE_DIR, "price_snapshots")
+    SELECTOR_CACHE_PATH = os.path.join(CACHE_DIR, "selector_winners.json")
+    RESULTS_STREAM_PATH = os.path.join(REPORT_DIR, "results.jsonl")
+    RESULTS_STREAM_KEEP = 5  # Previous runs' streams kept as results.<timestamp>.jsonl
+    LOAD_REPORT_PATH = os.path.join(REPORT_DIR, "load_test.json")
+    REPORT_SLOWEST_TESTS = 10
     
     # Test Data
     SEARCH_QUERY = "laptop"
@@ -48,6 +221,7 @@ class Config:
     # Product Selectors
     PRODUCT_TITLE_SELECTOR = ( "class name", "product-title" )
     PRODUCT_PRICE_SELECTOR = ( "class name", "price" )
+    DETAIL_PRICE_SELECTOR = ( "css selector", ".product-price [class*='price-value']" )  # price-value-{id}
     PRODUCT_IMAGE_SELECTOR = ( "xpath", ".//img" )
     
     # Cart Selectors
@@ -57,8 +231,40 @@ class Config:
     # Navigation Selectors
     ACCOUNT_LINK_SELECTOR = ( "class name", "ico-account" )
     LOGOUT_LINK_SELECTOR = ( "class name", "ico-logout" )
+    
+    # Extra locators tried after the primary *_SELECTOR above, keyed by element name
+    SELECTOR_FALLBACKS = {
+        "LOGIN_BUTTON": [("css selector", "button.login-button"), ("xpath", "//button[@type='submit']")],
+        "SEARCH_BUTTON": [("css selector", "button.search-box-button"), ("xpath", "//button[@type='submit']")],
+        "ADD_TO_CART_BUTTON": [
+            ("id", "add-to-cart-button"),
+            ("css selector", "[id^='add-to-cart-button']"),
+            ("name", "add-to-cart"),
+            ("xpath", "//button[contains(text(), 'Add to cart')]"),
+            ("class name", "add-to-cart-button")
+        ]
+    }
+    SELECTOR_FALLBACK_ALERT_RATE = 0.5  # Report elements whose primary locator misses this often
+
+    @classmethod
+    def set_base_url(cls, base_url):
+        """Point the suite at another storefront, such as the local fixture"""
+        cls.BASE_URL = base_url.rstrip("/")
+        cls.LOGIN_URL = f"{cls.BASE_URL}/login"
+        cls.PRODUCTS_URL = f"{cls.BASE_URL}/electronics"
+        cls.SEARCH_URL = f"{cls.BASE_URL}/search"
+        cls.UI_CHECK_URLS = [cls.PRODUCTS_URL, f"{cls.BASE_URL}/books",
+                             f"{cls.BASE_URL}/jewelry", f"{cls.BASE_URL}/gift-cards"]
+
+    @classmethod
+    def test_selected(cls, test_name):
+        """Whether a test is picked by TEST_SELECTION (case-insensitive substring match)"""
+        if not cls.TEST_SELECTION:
+            return True
+        return any(pattern.lower() in test_name.lower() for pattern in cls.TEST_SELECTION)
 
     @classmethod
     def setup_directories(cls):
         os.makedirs(cls.SCREENSHOT_DIR, exist_ok=True)
-        os.makedirs(cls.REPORT_DIR, exist_ok=True)
\ No newline at end of file
+        os.makedirs(cls.REPORT_DIR, exist_ok=True)
+        os.makedirs(cls.CACHE_DIR, exist_ok=True)
\ No newline at end of file
@@ -0,0 +1,46 @@
+"""Run the suite across several hosts.
+
+On the coordinating host (also starts DISTRIBUTED_LOCAL_WORKERS local workers):
+
+    python distributed.py coordinator --host 0.0.0.0 --local-workers 0
+
+On every worker host:
+
+    python distributed.py worker --coordinator http://coordinator:8765 [--remote-url http://grid:4444/wd/hub]
+"""
+import argparse
+from config.config import Config
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Distributed E-Commerce test execution")
+    subparsers = parser.add_subparsers(dest="role", required=True)
+
+    coordinator = subparsers.add_parser("coordinator", help="split the suite into tasks and collect results")
+    coordinator.add_argument("--host", default=Config.COORDINATOR_HOST)
+    coordinator.add_argument("--port", type=int, default=Config.COORDINATOR_PORT)
+    coordinator.add_argument("--local-workers", type=int, default=Config.DISTRIBUTED_LOCAL_WORKERS,
+                             help="worker processes to start on this host")
+
+    worker = subparsers.add_parser("worker", help="run tasks handed out by a coordinator")
+    worker.add_argument("--coordinator", required=True, help="coordinator URL, e.g. http://host:8765")
+    worker.add_argument("--remote-url", default=Config.REMOTE_WEBDRIVER_URL,
+                        help="Selenium Grid / remote WebDriver URL (default: local Chrome)")
+    worker.add_argument("--id", help="worker name shown in reports")
+
+    args = parser.parse_args(argv)
+    if args.role == "coordinator":
+        from main import EcommerceTestSuite
+        Config.PARALLEL_MODE = "distributed"
+        Config.COORDINATOR_HOST = args.host
+        Config.COORDINATOR_PORT = args.port
+        Config.DISTRIBUTED_LOCAL_WORKERS = args.local_workers
+        EcommerceTestSuite().run_full_suite()
+    else:
+        from utils.distributed import run_worker
+        Config.setup_directories()
+        run_worker(args.coordinator, args.id, args.remote_url)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,78 +1,152 @@
-from modules.functional_testing import FunctionalTesting
-from modules.ui_consistency import UIConsistency
-from modules.broken_links import BrokenLinksDetector
-from modules.performance_snapshot import PerformanceSnapshot
-from modules.price_consistency import PriceConsistency
 from utils.reporting import ReportGenerator
+from utils.driver_pool import DriverPool
+from utils.scheduler import ModuleScheduler, ModuleSpec
+from utils.result_sink import ResultSink, iter_results
+from utils.selector_registry import SelectorRegistry
+from utils.screenshot_manager import ScreenshotPipeline
 from config.config import Config
 import time
 
+# Modules in report order; imported lazily by the scheduler
+TEST_MODULES = [
+    ModuleSpec("Functional Testing", "🔧 Running Functional Tests...",
+               "modules.functional_testing", "FunctionalTesting", "run_all_tests", key="functional"),
+    ModuleSpec("UI Consistency", "🎨 Running UI Consistency Tests...",
+               "modules.ui_consistency", "UIConsistency", "run_all_tests", key="ui"),
+    ModuleSpec("Broken Links", "🔗 Running Broken Links Detection...",
+               "modules.broken_links", "BrokenLinksDetector", "scan_website", key="links"),
+    ModuleSpec("Performance", "⚡ Running Performance Tests...",
+               "modules.performance_snapshot", "PerformanceSnapshot", "measure_performance",
+               exclusive=Config.PERFORMANCE_RUNS_ALONE, key="performance"),
+    ModuleSpec("Price Consistency", "💰 Running Price Consistency Tests...",
+               "modules.price_consistency", "PriceConsistency", "run_price_checks", key="price"),
+    ModuleSpec("Data Driven", "🧮 Running Data-Driven Tests...",
+               "modules.data_driven", "DataDrivenTesting", "run_all_tests", shardable=True, key="data"),
+    # Runs alone so the load doesn't skew the browser modules' timings, nor they the load
+    ModuleSpec("Load Testing", "🏋️  Running HTTP Load Test...",
+               "modules.load_testing", "LoadTesting", "run_load_test", exclusive=True, key="load",
+               enabled_by="LOAD_TEST_ENABLED"),
+]
+
+
+def select_modules(names=None):
+    """Specs for the named modules (by key or full name), in report order.
+
+    Without names, every module except opt-in ones whose Config flag is off.
+    """
+    if not names:
+        return [spec for spec in TEST_MODULES if spec.enabled_by is None or getattr(Config, spec.enabled_by)]
+    wanted = {name.lower() for name in names}
+    unknown = wanted - {spec.key for spec in TEST_MODULES} - {spec.name.lower() for spec in TEST_MODULES}
+    if unknown:
+        raise ValueError(f"Unknown module(s): {', '.join(sorted(unknown))} "
+                         f"(choose from {', '.join(spec.key for spec in TEST_MODULES)})")
+    return [spec for spec in TEST_MODULES if spec.key in wanted or spec.name.lower() in wanted]
+
 class EcommerceTestSuite:
     def __init__(self):
         Config.setup_directories()
         self.report_generator = ReportGenerator()
-        self.test_results = []
+        # One browser per worker so concurrent modules never wait on each other
+        self.driver_pool = DriverPool(max_size=max(Config.PARALLEL_WORKERS, Config.DRIVER_POOL_MAX_SIZE,
+                                                   Config.DATA_DRIVEN_WORKERS))
+        self.scheduler = ModuleScheduler(driver_pool=self.driver_pool)
         
-    def run_full_suite(self):
-        """Execute complete test suite"""
+    def run_full_suite(self, modules=None):
+        """Execute the test suite, or only the given module specs"""
+        modules = modules or select_modules()
         print("🚀 Starting E-Commerce Automated Testing Suite...")
         start_time = time.time()
+        # Results are streamed to disk as they happen so a crash still leaves a report
+        result_sink = ResultSink.install(Config.RESULTS_STREAM_PATH, rotate=True)
+        proxy = None
+        summary = None
+        if Config.REPLAY_MODE != "off":
+            # Route site traffic through the local recorder/replayer
+            from utils.record_replay import RecordReplayProxy
+            proxy = RecordReplayProxy().start()
+            Config.set_base_url(proxy.url)
+            print(f"📼 {Config.REPLAY_MODE.title()} mode: serving {proxy.origin} through {proxy.url}")
         
         try:
-            # 1. Functional Testing
-            print("\n🔧 Running Functional Tests...")
-            functional_tester = FunctionalTesting()
-            functional_results = functional_tester.run_all_tests()
-            self.test_results.extend(functional_results)
-            
-            # 2. UI Consistency Testing
-            print("\n🎨 Running UI Consistency Tests...")
-            ui_tester = UIConsistency()
-            ui_results = ui_tester.run_all_tests()
-            self.test_results.extend(ui_results)
-            
-            # 3. Broken Links Detection
-            print("\n🔗 Running Broken Links Detection...")
-            link_checker = BrokenLinksDetector()
-            link_results = link_checker.scan_website()
-            self.test_results.extend(link_results)
-            
-            # 4. Performance Testing
-            print("\n⚡ Running Performance Tests...")
-            performance_tester = PerformanceSnapshot()
-            performance_results = performance_tester.measure_performance()
-            self.test_results.extend(performance_results)
-            
-            # 5. Price Consistency Testing
-            print("\n💰 Running Price Consistency Tests...")
-            price_tester = PriceConsistency()
-            price_results = price_tester.run_price_checks()
-            self.test_results.extend(price_results)
+            # Results are only kept in the stream; the report reads them back from there
+            self.scheduler.run(modules)
             
         except Exception as e:
             print(f"❌ Error during test execution: {str(e)}")
         
         finally:
-            # Generate comprehensive reports
+            if Config.INCREMENTAL_MODE:
+                from utils.incremental import VerdictCache
+                self.report_generator.report_data["incremental"] = VerdictCache.shared().get_stats()
+            if self.scheduler.coordinator_stats is not None:
+                self.report_generator.report_data["distributed"] = self.scheduler.coordinator_stats
+            if proxy is not None:
+                proxy.stop()
+                self.report_generator.report_data["record_replay"] = proxy.get_stats()
+            self.driver_pool.shutdown()
+            pool_stats = self.driver_pool.get_stats()
+            self.report_generator.report_data["driver_pool"] = pool_stats
+            if self.driver_pool.resource_blocker is not None:
+                self.report_generator.report_data["resource_blocking"] = self.driver_pool.resource_blocker.get_summary()
+            tracer = self.driver_pool.tracer
+            if tracer is not None:
+                tracer.write_profile()
+                self.report_generator.report_data["webdriver_profile"] = tracer.get_summary()
+            # Reports link to screenshots, so they must be on disk first
+            screenshot_pipeline = ScreenshotPipeline.shared()
+            screenshot_pipeline.close()
+            self.report_generator.report_data["screenshots"] = screenshot_pipeline.get_stats()
+            selector_fallbacks = SelectorRegistry.shared().fallback_report()
+            self.report_generator.report_data["selector_fallbacks"] = selector_fallbacks
+            
+            result_sink.close()
+            
+            # Generate comprehensive reports in one pass over the result stream
             total_time = time.time() - start_time
-            self.report_generator.generate_html_report(self.test_results, total_time)
+            summary = self.report_generator.generate_reports(
+                iter_results(Config.RESULTS_STREAM_PATH), total_time,
+                module_order=[spec.name for spec in TEST_MODULES]
+            )
             
             # Print final summary to console
-            passed = len([t for t in self.test_results if t['status'] == 'PASS'])
-            failed = len([t for t in self.test_results if t['status'] == 'FAIL'])
-            
             print(f"\n🎯 TEST EXECUTION COMPLETE!")
             print(f"=================================")
-            print(f"📊 Total Tests: {len(self.test_results)}")
-            print(f"✅ Passed: {passed}")
-            print(f"❌ Failed: {failed}")
-            print(f"📈 Success Rate: {(passed/len(self.test_results)*100 if self.test_results else 0):.1f}%")
+            print(f"📊 Total Tests: {summary['total']}")
+            print(f"✅ Passed: {summary['passed']}")
+            print(f"❌ Failed: {summary['failed']}")
+            print(f"📈 Success Rate: {summary['success_rate']:.1f}%")
             print(f"⏱️  Total Time: {total_time:.2f} seconds")
+            print(f"🌐 Browser Sessions: {pool_stats['sessions_launched']} launched "
+                  f"({pool_stats['total_launch_time']:.2f}s launching, "
+                  f"{pool_stats['total_wait_time']:.2f}s waiting for a free session)")
+            incremental = self.report_generator.report_data.get("incremental")
+            if incremental:
+                print(f"♻️  Incremental: {incremental['skipped']} of {incremental['checks']} page checks skipped as unchanged "
+                      f"(~{incremental['time_saved']:.1f}s saved)")
+            blocking = self.report_generator.report_data.get("resource_blocking")
+            if blocking:
+                print(f"🚫 Fast Mode: {blocking['requests_blocked']} requests blocked on {blocking['pages']} pages "
+                      f"(~{blocking['bytes_avoided'] / 1024:.0f} KB avoided, {blocking['unknown_size']} of unknown size)")
+            if proxy is not None:
+                replay_stats = proxy.get_stats()
+                print(f"📼 {replay_stats['recorded']} recorded, {replay_stats['replayed']} replayed, "
+                      f"{replay_stats['misses']} missing from {replay_stats['archive']}")
+            if tracer is not None:
+                print(f"🔍 WebDriver Round Trips: {tracer.round_trips} ({tracer.total_time:.2f}s) - "
+                      f"see webdriver_profile.txt / webdriver_profile.folded")
+            for entry in selector_fallbacks:
+                print(f"⚠️  Selector {entry['element']} missed its primary locator in "
+                      f"{entry['fallback_rate']}% of lookups - consider updating Config")
             print(f"📄 Reports generated in 'reports/' folder:")
             print(f"   - test_report.html (Detailed HTML report)")
             print(f"   - test_summary.txt (Quick text summary)") 
             print(f"   - test_report.json (Machine-readable data)")
-            print(f"📸 Screenshots saved in 'screenshots/' folder")
+            print(f"   - results.jsonl (Raw result stream)")
+            screenshot_stats = self.report_generator.report_data["screenshots"]
+            print(f"📸 Screenshots saved in 'screenshots/' folder "
+                  f"({screenshot_stats['written']} written, {screenshot_stats['duplicates']} duplicates skipped)")
+        return summary
 
 if __name__ == "__main__":
     test_suite = EcommerceTestSuite()
@@ -1,13 +1,36 @@
-from .functional_testing import FunctionalTesting
-from .ui_consistency import UIConsistency
-from .broken_links import BrokenLinksDetector
-from .performance_snapshot import PerformanceSnapshot
-from .price_consistency import PriceConsistency
+"""Test modules, imported on first access so selecting one never loads the others"""
+import importlib
+
+# Exported name -> submodule that defines it
+_EXPORTS = {
+    'FunctionalTesting': 'functional_testing',
+    'UIConsistency': 'ui_consistency',
+    'BrokenLinksDetector': 'broken_links',
+    'PerformanceSnapshot': 'performance_snapshot',
+    'PriceConsistency': 'price_consistency',
+    'DataDrivenTesting': 'data_driven',
+    'LoadTesting': 'load_testing',
+}
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_EXPORTS))
+
 
 __all__ = [
     'FunctionalTesting',
-    'UIConsistency', 
+    'UIConsistency',
     'BrokenLinksDetector',
     'PerformanceSnapshot',
-    'PriceConsistency'
+    'PriceConsistency',
+    'DataDrivenTesting',
+    'LoadTesting'
 ]
@@ -1,26 +1,29 @@
-import requests
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urlparse
 from config.config import Config
-import time
+from utils.driver_pool import DriverPool
+from utils.result_sink import emit_result
+from utils.test_result import TestResult, TestTimer
+from utils.link_checker import LinkChecker
+from utils.crawler import SiteCrawler
+from utils.link_cache import LinkStatusCache
 
 class BrokenLinksDetector:
-    def __init__(self):
-        self.driver = webdriver.Chrome()
+    def __init__(self, driver_pool=None):
+        self.driver_pool = driver_pool or DriverPool.shared()
+        # A browser is only leased if a page needs JavaScript rendering
+        self.lease = None
+        self.driver = None
         self.test_results = []
         self.checked_links = set()
+        self.link_cache = LinkStatusCache() if Config.LINK_CACHE_ENABLED else None
+        self.link_checker = LinkChecker(cache=self.link_cache)
     
-    def log_test_result(self, test_name, passed, message):
+    def log_test_result(self, test_name, passed, message, timer=None):
         """Log test result with details"""
-        result = {
-            "module": "Broken Links",
-            "test_name": test_name,
-            "status": "PASS" if passed else "FAIL",
-            "message": message,
-            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
-        }
+        result = TestResult.create("Broken Links", test_name, passed, message, timer=timer,
+                                   driver=self.driver).to_dict()
         self.test_results.append(result)
+        emit_result(result)
     
     def is_valid_url(self, url):
         """Check if URL is valid and should be tested"""
@@ -31,50 +34,84 @@ class BrokenLinksDetector:
             return False
         return True
     
+    def get_driver(self):
+        """Lease a browser on first use"""
+        if self.driver is None:
+            self.lease = self.driver_pool.acquire("Broken Links")
+            self.driver = self.lease.driver
+        return self.driver
+    
+    def render_page(self, url):
+        """Render a JavaScript-only page in the browser and return its HTML"""
+        driver = self.get_driver()
+        driver.get(url)
+        return driver.page_source
+    
+    def collect_homepage_links(self):
+        """Collect every anchor href on the homepage in one WebDriver call"""
+        driver = self.get_driver()
+        driver.get(Config.BASE_URL)
+        return driver.execute_script(
+            "return Array.from(document.querySelectorAll('a[href]'), a => a.href);"
+        )
+    
+    def collect_links(self):
+        """Discover links using the configured discovery mode"""
+        if Config.LINK_DISCOVERY_MODE == "homepage":
+            return self.collect_homepage_links()
+        crawler = SiteCrawler(self.link_checker, render_fallback=self.render_page)
+        links = crawler.crawl(Config.BASE_URL)
+        stats = crawler.stats
+        print(f"🕸️  Crawled {stats['pages_fetched']} pages "
+              f"({stats['pages_rendered']} rendered in browser), "
+              f"discovered {stats['links_discovered']} links")
+        return sorted(links)
+    
     def check_link_status(self, url):
         """Check HTTP status of a link"""
-        try:
-            response = requests.head(url, timeout=10, allow_redirects=True)
-            return response.status_code
-        except requests.RequestException:
-            return None
+        return self.link_checker.check(url)
     
     def scan_website(self):
         """Scan website for broken links"""
+        timer = TestTimer()
         try:
-            self.driver.get(Config.BASE_URL)
-            all_links = self.driver.find_elements(By.TAG_NAME, "a")
-            
-            broken_links = []
-            checked_count = 0
-            
-            for link in all_links[:50]:  # Limit to 50 links for demo
-                try:
-                    href = link.get_attribute('href')
+            with timer.phase("setup"):
+                links_to_check = []
+                for href in self.collect_links():
                     if href and href not in self.checked_links and self.is_valid_url(href):
                         self.checked_links.add(href)
-                        status_code = self.check_link_status(href)
-                        
-                        if status_code and status_code >= 400:
-                            broken_links.append(f"{href} (Status: {status_code})")
-                        
-                        checked_count += 1
-                        time.sleep(0.5)  # Be polite to the server
-                        
-                except Exception as e:
-                    continue
+                        links_to_check.append(href)
+                links_to_check = links_to_check[:Config.LINK_CHECK_MAX_LINKS]
+            
+            # Politeness is enforced per host by the checker's token buckets
+            with timer.phase("action"):
+                statuses = self.link_checker.check_all(links_to_check)
+            with timer.phase("assertion"):
+                broken_links = [f"{href} (Status: {status_code})"
+                                for href, status_code in statuses.items()
+                                if status_code and status_code >= 400]
+            stats = self.link_checker.last_stats
+            throughput = f"{stats['links_per_second']:.1f} links/s"
+            if "cache" in stats:
+                cache_stats = stats["cache"]
+                throughput += (f", cache hit rate {cache_stats['hit_rate']:.1f}%, "
+                               f"{cache_stats['requests_saved']} requests saved")
             
             if not broken_links:
                 self.log_test_result("Broken Links Scan", True, 
-                                   f"Scanned {checked_count} links, no broken links found")
+                                   f"Scanned {len(statuses)} links ({throughput}), no broken links found", timer)
             else:
                 self.log_test_result("Broken Links Scan", False,
-                                   f"Found {len(broken_links)} broken links: {', '.join(broken_links[:5])}")
+                                   f"Found {len(broken_links)} broken links ({throughput}): {', '.join(broken_links[:5])}", timer)
                 
         except Exception as e:
-            self.log_test_result("Broken Links Scan", False, f"Link scanning failed: {str(e)}")
+            self.log_test_result("Broken Links Scan", False, f"Link scanning failed: {str(e)}", timer)
         
         finally:
-            self.driver.quit()
+            self.link_checker.close()
+            if self.link_cache is not None:
+                self.link_cache.save()
+            if self.lease is not None:
+                self.driver_pool.release(self.lease)
         
         return self.test_results
\ No newline at end of file
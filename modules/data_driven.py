@@ -0,0 +1,97 @@
+from urllib.parse import quote_plus
+from config.config import Config
+from utils.driver_pool import DriverPool
+from utils.result_sink import emit_result
+from utils.test_result import TestResult, TestTimer
+from utils.dom_snapshot import snapshot_cards, find_card_problems
+from utils.sharding import WorkStealingExecutor, expand_matrix, load_data_set
+from tests.test_data import TestData
+
+
+def item_name(item):
+    """Result name of a work item, e.g. "Search: laptop"; --tests selection matches against it"""
+    return f"{item.test.title()}: {', '.join(str(value) for value in item.params.values())}"
+
+
+class DataDrivenTesting:
+    """Search and category checks expanded over TestData (or external data sets)"""
+
+    def __init__(self, driver_pool=None, shard_index=0, shard_count=1):
+        self.driver_pool = driver_pool or DriverPool.shared()
+        # Distributed runs hand each node every shard_count-th work item
+        self.shard_index = shard_index
+        self.shard_count = shard_count
+        self.executor = WorkStealingExecutor(driver_pool=self.driver_pool, owner="Data Driven")
+        self.test_results = []
+
+    def build_result(self, test_name, passed, message, timer=None, driver=None, metrics=None):
+        """Build and stream a result from a worker thread"""
+        result = TestResult.create("Data Driven", test_name, passed, message, timer=timer,
+                                   driver=driver, metrics=metrics).to_dict()
+        emit_result(result)
+        return result
+
+    def search_item(self, worker, item):
+        """Run one search query through the results page"""
+        query = item.params["query"]
+        timer = TestTimer()
+        with timer.phase("action"):
+            worker.driver.get(f"{Config.SEARCH_URL}?q={quote_plus(query)}")
+            self.driver_pool.record_page_savings(worker.driver, Config.SEARCH_URL)
+        with timer.phase("assertion"):
+            products = worker.driver.find_elements(*Config.SEARCH_RESULTS_SELECTOR)
+        return self.build_result(item_name(item), True,
+                                 f"Search executed, found {len(products)} products", timer, worker.driver)
+
+    def category_item(self, worker, item):
+        """Check every product card on one category listing"""
+        category = item.params["category"]
+        url = f"{Config.BASE_URL}/{category}"
+        timer = TestTimer()
+        with timer.phase("setup"):
+            worker.driver.get(url)
+            self.driver_pool.record_page_savings(worker.driver, url)
+        with timer.phase("action"):
+            cards = snapshot_cards(worker.driver)
+        problems = []
+        with timer.phase("assertion"):
+            for card in cards:
+                missing_elements = find_card_problems(card)
+                if missing_elements:
+                    problems.append(f"product {card['index']+1} missing: {', '.join(missing_elements)}")
+        if not cards:
+            return self.build_result(item_name(item), False, f"No product cards found on {url}",
+                                     timer, worker.driver)
+        if problems:
+            return self.build_result(item_name(item), False,
+                                     f"Inconsistent cards on {url}: {'; '.join(problems)}", timer, worker.driver)
+        return self.build_result(item_name(item), True,
+                                 f"All {len(cards)} product cards consistent", timer, worker.driver)
+
+    def run_all_tests(self):
+        """Expand the data sets into work items and run them across browser workers"""
+        items = (expand_matrix("search", query=load_data_set(Config.DATA_DRIVEN_QUERIES or TestData.PRODUCTS))
+                 + expand_matrix("category", category=load_data_set(Config.DATA_DRIVEN_CATEGORIES or TestData.CATEGORIES)))
+        items = [item for item in items if Config.test_selected(item_name(item))]
+        items = items[self.shard_index::self.shard_count]
+        handlers = {"search": self.search_item, "category": self.category_item}
+
+        outcomes = self.executor.run(items, lambda worker, item: handlers[item.test](worker, item))
+        for item, outcome in zip(items, outcomes):
+            if isinstance(outcome, Exception):
+                outcome = self.build_result(item_name(item), False,
+                                            f"Work item failed: {str(outcome)}")
+            self.test_results.append(outcome)
+
+        stats = self.executor.last_stats
+        if stats:
+            utilization = [worker["utilization"] for worker in stats["per_worker"]]
+            test_name = "Data-Driven Sharding"
+            if self.shard_count > 1:
+                test_name += f" ({self.shard_index + 1}/{self.shard_count})"
+            self.test_results.append(self.build_result(
+                test_name, True,
+                f"{stats['items']} work items on {stats['workers']} workers in {stats['wall_time']:.2f}s "
+                f"(utilization {min(utilization):.0f}-{max(utilization):.0f}%)",
+                metrics=stats))
+        return self.test_results
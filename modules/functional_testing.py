@@ -1,166 +1,155 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from utils.screenshot_manager import ScreenshotManager
+from utils.driver_pool import DriverPool
+from utils.result_sink import emit_result
+from utils.test_result import TestResult, TestTimer
+from utils.selector_registry import SelectorRegistry
 from config.config import Config
-import time
 
 class FunctionalTesting:
-    def __init__(self):
+    def __init__(self, driver_pool=None):
+        self.driver_pool = driver_pool or DriverPool.shared()
         self.driver = self.setup_driver()
         self.screenshot_manager = ScreenshotManager(self.driver)
         self.wait = WebDriverWait(self.driver, Config.IMPLICIT_WAIT)
+        self.selectors = SelectorRegistry.shared()
         self.test_results = []
     
     def setup_driver(self):
-        """Initialize WebDriver with manual ChromeDriver"""
-        from selenium.webdriver.chrome.options import Options
-        from selenium.webdriver.chrome.service import Service
-        import os
-        
-        options = Options()
-        if Config.HEADLESS:
-            options.add_argument("--headless")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--window-size=1920,1080")
-        
-        # Use manual chromedriver in project folder
-        chromedriver_path = "chromedriver.exe"
-        if os.path.exists(chromedriver_path):
-            service = Service(chromedriver_path)
-            print("✅ Using manual ChromeDriver from project folder")
-        else:
-            raise FileNotFoundError("chromedriver.exe not found in project folder")
-        
-        driver = webdriver.Chrome(service=service, options=options)
-        driver.implicitly_wait(Config.IMPLICIT_WAIT)
-        driver.set_page_load_timeout(Config.PAGE_LOAD_TIMEOUT)
-        return driver
+        """Lease a WebDriver session from the shared pool"""
+        self.lease = self.driver_pool.acquire("Functional Testing")
+        return self.lease.driver
     
-    def log_test_result(self, test_name, passed, message, screenshot_path=None):
+    def log_test_result(self, test_name, passed, message, screenshot_path=None, timer=None, metrics=None):
         """Log test result with details"""
-        result = {
-            "module": "Functional Testing",
-            "test_name": test_name,
-            "status": "PASS" if passed else "FAIL",
-            "message": message,
-            "screenshot": screenshot_path,
-            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
-        }
+        result = TestResult.create("Functional Testing", test_name, passed, message, timer=timer,
+                                   driver=self.driver, screenshot=screenshot_path, metrics=metrics).to_dict()
         self.test_results.append(result)
+        emit_result(result)
         status_icon = "✅" if passed else "❌"
         print(f"{status_icon} {test_name}: {message}")
     
     def test_login(self):
         """Test login functionality - Updated for demo site"""
+        timer = TestTimer()
         try:
-            self.driver.get(Config.LOGIN_URL)
-            
-            # Enter credentials using updated selectors
-            email_field = self.wait.until(EC.presence_of_element_located((By.ID, "Email")))
-            password_field = self.driver.find_element(By.ID, "Password")
-            login_button = self.driver.find_element(By.XPATH, "//button[contains(@class, 'login-button')]")
+            with timer.phase("setup"):
+                self.driver.get(Config.LOGIN_URL)
+                self.driver_pool.record_page_savings(self.driver, Config.LOGIN_URL)
             
-            # For demo site, we might not have valid credentials, so let's test the form
-            email_field.clear()
-            email_field.send_keys(Config.TEST_EMAIL)
-            password_field.send_keys(Config.TEST_PASSWORD)
+            with timer.phase("action"):
+                # Enter credentials using the registry's learned selectors
+                email_field = self.selectors.find(self.driver, "LOGIN_EMAIL", "login", Config.IMPLICIT_WAIT)
+                password_field = self.selectors.find(self.driver, "LOGIN_PASSWORD", "login")
+                # The button must be present, but the demo site is never actually logged into
+                self.selectors.find(self.driver, "LOGIN_BUTTON", "login")
+                
+                # For demo site, we might not have valid credentials, so let's test the form
+                email_field.clear()
+                email_field.send_keys(Config.TEST_EMAIL)
+                password_field.send_keys(Config.TEST_PASSWORD)
             
             # Just verify the form works without actually logging in
-            if email_field.get_attribute('value') == Config.TEST_EMAIL:
-                self.log_test_result("User Login", True, "Login form works correctly (using guest mode for demo)")
+            with timer.phase("assertion"):
+                form_works = email_field.get_attribute('value') == Config.TEST_EMAIL
+            if form_works:
+                self.log_test_result("User Login", True, "Login form works correctly (using guest mode for demo)", timer=timer)
                 return True
             else:
                 raise Exception("Login form not working properly")
             
         except Exception as e:
             screenshot_path = self.screenshot_manager.capture_screenshot("login_failure")
-            self.log_test_result("User Login", False, f"Login test completed (expected for demo): {str(e)}", screenshot_path)
+            self.log_test_result("User Login", False, f"Login test completed (expected for demo): {str(e)}", screenshot_path, timer)
             return False
     
     def test_product_search(self):
         """Test product search functionality"""
+        timer = TestTimer()
         try:
-            self.driver.get(Config.BASE_URL)
-            
-            search_box = self.wait.until(EC.presence_of_element_located((By.ID, "small-searchterms")))
-            search_box.clear()
-            search_box.send_keys(Config.SEARCH_QUERY)
+            with timer.phase("setup"):
+                self.driver.get(Config.BASE_URL)
+                self.driver_pool.record_page_savings(self.driver, Config.BASE_URL)
             
-            # Find and click search button
-            search_button = self.driver.find_element(By.XPATH, "//button[contains(text(), 'Search')]")
-            search_button.click()
+            with timer.phase("action"):
+                search_box = self.selectors.find(self.driver, "SEARCH_BOX", "home", Config.IMPLICIT_WAIT)
+                search_box.clear()
+                search_box.send_keys(Config.SEARCH_QUERY)
+                
+                # Find and click search button
+                search_button = self.selectors.find(self.driver, "SEARCH_BUTTON", "home")
+                search_button.click()
             
             # Verify search results
-            self.wait.until(EC.presence_of_element_located((By.CLASS_NAME, "product-item")))
-            products = self.driver.find_elements(By.CLASS_NAME, "product-item")
+            with timer.phase("assertion"):
+                self.wait.until(EC.presence_of_element_located(Config.SEARCH_RESULTS_SELECTOR))
+                products = self.driver.find_elements(*Config.SEARCH_RESULTS_SELECTOR)
             
             if len(products) > 0:
-                self.log_test_result("Product Search", True, f"Found {len(products)} products for '{Config.SEARCH_QUERY}'")
+                self.log_test_result("Product Search", True, f"Found {len(products)} products for '{Config.SEARCH_QUERY}'", timer=timer)
                 return True
             else:
                 # Even if no products found, search functionality worked
-                self.log_test_result("Product Search", True, f"Search executed, found {len(products)} products for '{Config.SEARCH_QUERY}'")
+                self.log_test_result("Product Search", True, f"Search executed, found {len(products)} products for '{Config.SEARCH_QUERY}'", timer=timer)
                 return True
                 
         except Exception as e:
             screenshot_path = self.screenshot_manager.capture_screenshot("search_failure")
-            self.log_test_result("Product Search", False, f"Search failed: {str(e)}", screenshot_path)
+            self.log_test_result("Product Search", False, f"Search failed: {str(e)}", screenshot_path, timer)
             return False
     
     def test_add_to_cart(self):
         """Test adding product to cart - Improved version"""
+        timer = TestTimer()
         try:
             # Navigate directly to a known product page
-            self.driver.get(f"{Config.BASE_URL}/apple-macbook-pro-13-inch")
+            with timer.phase("setup"):
+                product_url = f"{Config.BASE_URL}/apple-macbook-pro-13-inch"
+                self.driver.get(product_url)
+                self.driver_pool.record_page_savings(self.driver, product_url)
             
-            # Try multiple possible add to cart button selectors
-            add_to_cart_selectors = [
-                (By.ID, "add-to-cart-button"),
-                (By.NAME, "add-to-cart"),
-                (By.XPATH, "//input[@value='Add to cart']"),
-                (By.XPATH, "//button[contains(text(), 'Add to cart')]"),
-                (By.CLASS_NAME, "add-to-cart-button")
-            ]
+            # All registered candidates are checked together, last winner first
+            with timer.phase("action"):
+                resolution = self.selectors.resolve(self.driver, "ADD_TO_CART_BUTTON", "product")
+            # Polls and resolution latency are reported here, not as retries
+            locator_metrics = {"add_to_cart_locator": resolution.to_dict()}
             
-            add_to_cart_btn = None
-            for by, selector in add_to_cart_selectors:
-                try:
-                    add_to_cart_btn = self.driver.find_element(by, selector)
-                    if add_to_cart_btn.is_displayed():
-                        break
-                except:
-                    continue
+            with timer.phase("assertion"):
+                button_visible = resolution.found
+                if button_visible:
+                    product_title = self.driver.find_element(By.TAG_NAME, "h1").text
+                else:
+                    config_options = self.driver.find_elements(By.CLASS_NAME, "attributes")
             
-            if add_to_cart_btn and add_to_cart_btn.is_displayed():
+            if button_visible:
                 # Just verify we found the button without clicking (for demo)
-                product_title = self.driver.find_element(By.TAG_NAME, "h1").text
-                self.log_test_result("Add to Cart", True, f"Add to cart button found for '{product_title}'")
+                self.log_test_result("Add to Cart", True, f"Add to cart button found for '{product_title}' in {resolution.latency:.2f}s", timer=timer, metrics=locator_metrics)
                 return True
             else:
                 # If no add to cart button, check if it's a configurable product
-                config_options = self.driver.find_elements(By.CLASS_NAME, "attributes")
                 if config_options:
-                    self.log_test_result("Add to Cart", True, "Product requires configuration before adding to cart")
+                    self.log_test_result("Add to Cart", True, "Product requires configuration before adding to cart", timer=timer, metrics=locator_metrics)
                 else:
-                    self.log_test_result("Add to Cart", False, "No add to cart button found and product doesn't require configuration")
+                    self.log_test_result("Add to Cart", False, "No add to cart button found and product doesn't require configuration", timer=timer, metrics=locator_metrics)
                 return False
                 
         except Exception as e:
             screenshot_path = self.screenshot_manager.capture_screenshot("add_to_cart_failure")
-            self.log_test_result("Add to Cart", False, f"Add to cart test error: {str(e)}", screenshot_path)
+            self.log_test_result("Add to Cart", False, f"Add to cart test error: {str(e)}", screenshot_path, timer)
             return False
     
     def run_all_tests(self):
         """Execute all functional tests"""
         print("Starting functional tests...")
         
-        self.test_login()
-        self.test_product_search() 
-        self.test_add_to_cart()
+        for test_name, test in (("User Login", self.test_login), ("Product Search", self.test_product_search),
+                                ("Add to Cart", self.test_add_to_cart)):
+            if Config.test_selected(test_name):
+                test()
         
-        self.driver.quit()
+        self.selectors.save()
+        self.driver_pool.release(self.lease)
         return self.test_results
\ No newline at end of file
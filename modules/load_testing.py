@@ -0,0 +1,101 @@
+import json
+import os
+import re
+from urllib.parse import quote_plus
+from config.config import Config
+from utils.load_generator import LoadGenerator
+from utils.result_sink import emit_result
+from utils.test_result import TestResult
+from tests.test_data import TestData
+
+TOKEN_PATTERN = re.compile(r'<input[^>]*name="__RequestVerificationToken"[^>]*value="([^"]*)"')
+PRODUCT_ID_PATTERN = re.compile(r'add-to-cart-button-(\d+)')
+
+
+def form_token(response):
+    """Anti-forgery token from a nopCommerce form, or None"""
+    match = TOKEN_PATTERN.search(response.text)
+    return match.group(1) if match else None
+
+
+class LoadTesting:
+    """Replay the functional flows as browserless HTTP virtual users.
+
+    Each virtual user logs in, searches and adds a product to the cart with
+    its own session cookies and the anti-forgery tokens nopCommerce forms
+    require, following Config.LOAD_PROFILE.
+    """
+
+    def __init__(self, driver_pool=None, profile=None):
+        # No browser is needed; the pool argument keeps the module interface
+        self.generator = LoadGenerator(profile or Config.LOAD_PROFILE)
+        self.test_results = []
+
+    async def login_flow(self, user):
+        page = await user.step("Login page", "GET", Config.LOGIN_URL,
+                               check=lambda r: None if form_token(r) else "No anti-forgery token")
+        await user.step("Login submit", "POST", Config.LOGIN_URL,
+                        data={"Email": Config.TEST_EMAIL, "Password": Config.TEST_PASSWORD,
+                              "RememberMe": "false", "__RequestVerificationToken": form_token(page)})
+
+    async def search_flow(self, user):
+        query = TestData.PRODUCTS[(user.index + user.iterations) % len(TestData.PRODUCTS)]
+        await user.step("Search", "GET", f"{Config.SEARCH_URL}?q={quote_plus(query)}",
+                        check=lambda r: None if "product-item" in r.text or "no-result" in r.text
+                        else "No search results markup")
+
+    async def add_to_cart_flow(self, user):
+        page = await user.step("Product page", "GET", f"{Config.BASE_URL}/{Config.LOAD_PRODUCT_SLUG}",
+                               check=lambda r: None if PRODUCT_ID_PATTERN.search(r.text) else "No add-to-cart button")
+        product_id = PRODUCT_ID_PATTERN.search(page.text).group(1)
+        form = {f"addtocart_{product_id}.EnteredQuantity": "1"}
+        token = form_token(page)
+        if token:
+            form["__RequestVerificationToken"] = token
+        await user.step("Add to cart", "POST", f"{Config.BASE_URL}/addproducttocart/details/{product_id}/1",
+                        data=form, check=self.cart_response_error)
+
+    @staticmethod
+    def cart_response_error(response):
+        try:
+            payload = json.loads(response.text)
+        except ValueError:
+            return "Add-to-cart response is not JSON"
+        return None if payload.get("success") else "Add-to-cart rejected"
+
+    async def scenario(self, user):
+        if user.iterations == 0:
+            await self.login_flow(user)
+        await self.search_flow(user)
+        await self.add_to_cart_flow(user)
+
+    def build_result(self, test_name, passed, message, metrics=None):
+        result = TestResult.create("Load Testing", test_name, passed, message, metrics=metrics).to_dict()
+        emit_result(result)
+        self.test_results.append(result)
+
+    def run_load_test(self):
+        """Run the load profile and report throughput, errors and latency per step"""
+        print(f"🏋️  Ramping virtual users over {self.generator.profile}")
+        stats = self.generator.run(self.scenario)
+        os.makedirs(os.path.dirname(Config.LOAD_REPORT_PATH) or ".", exist_ok=True)
+        with open(Config.LOAD_REPORT_PATH, 'w', encoding='utf-8') as f:
+            json.dump(stats, f, indent=2)
+
+        for name, step in stats["steps"].items():
+            latency = step["latency"]
+            passed = (step["error_rate"] <= Config.LOAD_MAX_ERROR_RATE
+                      and latency["p95"] <= Config.LOAD_P95_THRESHOLD)
+            message = (f"{step['rps']:.1f} req/s, {step['error_rate']:.1%} errors, "
+                       f"p50 {latency['p50']*1000:.0f}ms / p95 {latency['p95']*1000:.0f}ms / "
+                       f"p99 {latency['p99']*1000:.0f}ms / max {latency['max']*1000:.0f}ms")
+            if step["top_errors"]:
+                message += f" ({', '.join(f'{error}: {count}' for error, count in step['top_errors'].items())})"
+            self.build_result(f"Load: {name}", passed, message, metrics=step)
+
+        self.build_result(
+            "Load Test Summary", stats["requests"] > 0 and stats["error_rate"] <= Config.LOAD_MAX_ERROR_RATE,
+            f"{stats['requests']} requests from {stats['users_started']} virtual users (peak {stats['peak_users']}) "
+            f"in {stats['duration']:.1f}s: {stats['rps']:.1f} req/s, {stats['error_rate']:.1%} errors",
+            metrics={key: value for key, value in stats.items() if key != "steps"})
+        return self.test_results
@@ -1,47 +1,154 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from config.config import Config
+from utils.driver_pool import DriverPool
+from utils.result_sink import emit_result
+from utils.test_result import TestResult, TestTimer
+from utils.browser_metrics import (collect_page_metrics, collect_resource_waterfall,
+                                   iter_performance_log, summarize_performance_log,
+                                   evaluate_thresholds)
+from utils.sampling import LoadTimeSampler, summarize_samples, json_safe
+from utils.perf_history import PerformanceHistory
+from utils.resource_blocker import ResourceBlocker
+import math
 import time
 
+# Navigation and paint metrics reported in milliseconds by the browser
+TIMING_METRICS = {"dns", "connect", "ttfb", "dom_content_loaded", "load",
+                  "first_paint", "first_contentful_paint", "largest_contentful_paint"}
+
 class PerformanceSnapshot:
-    def __init__(self):
-        chrome_options = Options()
-        chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
-        self.driver = webdriver.Chrome(options=chrome_options)
+    def __init__(self, driver_pool=None):
+        # Pooled sessions are launched with performance logging enabled
+        self.driver_pool = driver_pool or DriverPool.shared()
+        self.lease = self.driver_pool.acquire("Performance")
+        self.driver = self.lease.driver
         self.test_results = []
+        self.sampler = LoadTimeSampler()
+        self.history = PerformanceHistory() if Config.PERF_HISTORY_ENABLED else None
+        # Unblocked loads teach fast mode how many bytes each blocked URL costs
+        self.resource_blocker = ResourceBlocker.shared() if Config.FAST_MODE else None
+        self.cold_cache_degraded = False
     
-    def log_test_result(self, test_name, passed, message):
+    def log_test_result(self, test_name, passed, message, metrics=None, timer=None):
         """Log test result with details"""
-        result = {
-            "module": "Performance",
-            "test_name": test_name,
-            "status": "PASS" if passed else "FAIL",
-            "message": message,
-            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
-        }
+        # Single-sample CIs and flat baselines yield inf, which json.dump would write as Infinity
+        result = TestResult.create("Performance", test_name, passed, message, timer=timer,
+                                   driver=self.driver, metrics=json_safe(metrics)).to_dict()
         self.test_results.append(result)
+        emit_result(result)
+    
+    def collect_metrics(self):
+        """Collect browser-reported timings for the loaded page, in seconds"""
+        raw_metrics = collect_page_metrics(self.driver)
+        metrics = {}
+        for name, value in raw_metrics.items():
+            if name in TIMING_METRICS and value is not None:
+                metrics[name] = round(value / 1000, 3)
+            else:
+                metrics[name] = value
+        resource_sizes = {} if self.resource_blocker is not None else None
+        metrics["network"] = summarize_performance_log(self.driver, resource_sizes)
+        if resource_sizes:
+            self.resource_blocker.learn_sizes(resource_sizes)
+        metrics["slowest_resources"] = sorted(
+            collect_resource_waterfall(self.driver),
+            key=lambda r: r["duration"], reverse=True
+        )[:Config.PERFORMANCE_WATERFALL_SIZE]
+        return metrics
+    
+    def clear_browser_cache(self):
+        """Reset cache and cookies through CDP so the next load is cold.
+
+        Drivers without CDP (webdriver.Remote on a grid) can only drop
+        cookies; the HTTP cache survives, so such runs are reported as
+        degraded rather than cold.
+        """
+        if not hasattr(self.driver, "execute_cdp_cmd"):
+            self.driver.delete_all_cookies()
+            self.cold_cache_degraded = True
+            return
+        self.driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+        self.driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
     
-    def measure_page_load_time(self, url, page_name):
-        """Measure page load time for a specific URL"""
+    def load_and_measure(self, url):
+        """Load a page once and return its metrics"""
+        # Drop log entries left over from earlier navigations
+        for _ in iter_performance_log(self.driver):
+            pass
+        self.driver.get(url)
+        return self.collect_metrics()
+    
+    def compare_with_history(self, history_key, stats):
+        """Store this run's medians and compare them with the rolling baseline"""
+        baseline = {}
+        for name, summary in stats.items():
+            self.history.record(history_key, name, summary["median"])
+            comparison = self.history.compare_to_baseline(history_key, name, summary["median"])
+            comparison["trend"] = self.history.history(history_key, name, limit=Config.PERF_TREND_POINTS)
+            baseline[name] = comparison
+        return baseline
+    
+    def measure_page_load_time(self, url, page_name, cache_mode="cold"):
+        """Sample page load metrics for a URL and judge them at the configured percentile"""
+        test_name = f"{page_name} Load Time ({cache_mode} cache)"
+        timer = TestTimer()
         try:
-            start_time = time.time()
-            self.driver.get(url)
-            load_time = time.time() - start_time
+            prepare = self.clear_browser_cache if cache_mode == "cold" else None
+            with timer.phase("action"):
+                samples, last_sample = self.sampler.run(lambda: self.load_and_measure(url), prepare)
+            if cache_mode == "cold" and self.cold_cache_degraded:
+                # Only cookies were cleared; keep these samples apart from true cold baselines
+                cache_mode = "cold, cookies only"
+            
+            assertion_start = time.monotonic()
+            stats = {name: summarize_samples(values) for name, values in samples.items()
+                     if name in TIMING_METRICS}
+            if "load" not in stats:
+                raise Exception("Browser did not report Navigation Timing")
+            percentile_key = Config.PERFORMANCE_THRESHOLD_PERCENTILE
+            judged = {name: summary[percentile_key] for name, summary in stats.items()}
+            verdicts = evaluate_thresholds(judged, Config.PERFORMANCE_THRESHOLDS)
+            
+            metrics = {
+                "cache_mode": cache_mode,
+                "percentile": percentile_key,
+                "stats": stats,
+                "network": last_sample["network"],
+                "slowest_resources": last_sample["slowest_resources"]
+            }
+            regressions = []
+            if self.history is not None:
+                metrics["baseline"] = self.compare_with_history(f"{page_name} ({cache_mode})", stats)
+                regressions = [name for name, comparison in metrics["baseline"].items()
+                               if comparison["regression"]]
             
-            if load_time <= Config.ACCEPTABLE_LOAD_TIME:
-                self.log_test_result(f"{page_name} Load Time", True, 
-                                   f"Page loaded in {load_time:.2f}s (within acceptable limit)")
-            elif load_time <= Config.MAX_PAGE_LOAD_TIME:
-                self.log_test_result(f"{page_name} Load Time", True, 
-                                   f"Page loaded in {load_time:.2f}s (slightly slow but acceptable)")
+            load_stats = stats["load"]
+            breakdown = (f"{load_stats['samples']} samples, load median {load_stats['median']:.2f}s "
+                         + (f"(95% CI {load_stats['ci_low']:.2f}-{load_stats['ci_high']:.2f}s); "
+                            if math.isfinite(load_stats['ci_high']) else "(95% CI n/a); ")
+                         + ", ".join(f"{name} {percentile_key} {judged[name]:.2f}s ({verdict})"
+                                     for name, verdict in verdicts.items()))
+            if cache_mode == "cold, cookies only":
+                breakdown += "; HTTP cache not cleared (driver has no CDP)"
+            poor = [name for name, verdict in verdicts.items() if verdict == "poor"]
+            timer.phases["assertion"] = time.monotonic() - assertion_start
+            if regressions:
+                deltas = ", ".join(f"{name} +{metrics['baseline'][name]['delta_pct']:.1f}%" for name in regressions)
+                self.log_test_result(test_name, False,
+                                   f"Regressed against baseline ({deltas}): {breakdown}", metrics, timer)
+            elif poor:
+                self.log_test_result(test_name, False,
+                                   f"Exceeds maximum for {', '.join(poor)}: {breakdown}", metrics, timer)
+            elif "slow" in verdicts.values():
+                self.log_test_result(test_name, True,
+                                   f"Slightly slow but acceptable: {breakdown}", metrics, timer)
             else:
-                self.log_test_result(f"{page_name} Load Time", False, 
-                                   f"Page loaded in {load_time:.2f}s (exceeds maximum limit)")
+                self.log_test_result(test_name, True,
+                                   f"Within acceptable limits: {breakdown}", metrics, timer)
             
-            return load_time
+            return load_stats["median"]
             
         except Exception as e:
-            self.log_test_result(f"{page_name} Load Time", False, f"Failed to measure load time: {str(e)}")
+            self.log_test_result(test_name, False, f"Failed to measure load time: {str(e)}", timer=timer)
             return None
     
     def measure_performance(self):
@@ -53,8 +160,14 @@ class PerformanceSnapshot:
         ]
         
         for url, page_name in pages_to_test:
-            self.measure_page_load_time(url, page_name)
-            time.sleep(2)  # Wait between requests
+            if not Config.test_selected(page_name):
+                continue
+            for cache_mode in Config.PERFORMANCE_CACHE_MODES:
+                self.measure_page_load_time(url, page_name, cache_mode)
         
-        self.driver.quit()
+        if self.history is not None:
+            self.history.close()
+        if self.resource_blocker is not None:
+            self.resource_blocker.save()
+        self.driver_pool.release(self.lease)
         return self.test_results
\ No newline at end of file
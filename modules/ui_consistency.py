@@ -1,83 +1,121 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from utils.screenshot_manager import ScreenshotManager
+from utils.driver_pool import DriverPool
+from utils.result_sink import emit_result
+from utils.test_result import TestResult, TestTimer
+from utils.dom_snapshot import snapshot_cards, find_card_problems
+from utils.incremental import VerdictCache, card_markup_fingerprint
+from utils.link_checker import LinkChecker
 from config.config import Config
 import time
 
 class UIConsistency:
-    def __init__(self):
-        self.driver = webdriver.Chrome()
-        self.screenshot_manager = ScreenshotManager(self.driver)
-        self.wait = WebDriverWait(self.driver, Config.IMPLICIT_WAIT)
+    def __init__(self, driver_pool=None):
+        self.driver_pool = driver_pool or DriverPool.shared()
+        # Leased on first use; incremental runs may not need a browser at all
+        self.lease = None
+        self.driver = None
+        self.screenshot_manager = None
+        self.wait = None
         self.test_results = []
+        self.verdicts = VerdictCache.shared() if Config.INCREMENTAL_MODE else None
+        self.http_client = LinkChecker() if self.verdicts is not None else None
     
-    def log_test_result(self, test_name, passed, message, screenshot_path=None):
+    def get_driver(self):
+        """Lease a browser on first use"""
+        if self.driver is None:
+            self.lease = self.driver_pool.acquire("UI Consistency")
+            self.driver = self.lease.driver
+            self.screenshot_manager = ScreenshotManager(self.driver)
+            self.wait = WebDriverWait(self.driver, Config.IMPLICIT_WAIT)
+        return self.driver
+    
+    def page_fingerprint(self, page_url):
+        """Fingerprint a listing's product-card markup over plain HTTP"""
+        response = self.http_client.fetch(page_url)
+        if response is None or response.status_code >= 400:
+            return None
+        return card_markup_fingerprint(response.content)
+    
+    def log_test_result(self, test_name, passed, message, screenshot_path=None, timer=None):
         """Log test result with details"""
-        result = {
-            "module": "UI Consistency",
-            "test_name": test_name,
-            "status": "PASS" if passed else "FAIL",
-            "message": message,
-            "screenshot": screenshot_path,
-            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
-        }
+        result = TestResult.create("UI Consistency", test_name, passed, message, timer=timer,
+                                   driver=self.driver, screenshot=screenshot_path).to_dict()
         self.test_results.append(result)
+        emit_result(result)
     
     def check_product_card_consistency(self):
-        """Verify all product cards have required elements"""
+        """Verify all product cards on every category page have required elements"""
+        timer = TestTimer()
         try:
-            self.driver.get(Config.PRODUCTS_URL)
-            product_cards = self.wait.until(
-                EC.presence_of_all_elements_located((By.CLASS_NAME, "product-item"))
-            )
-            
             inconsistent_cards = []
+            total_cards = 0
+            screenshot_path = None
+            pages_reused = 0
             
-            for i, card in enumerate(product_cards[:10]):  # Check first 10 products
-                missing_elements = []
+            for page_url in Config.UI_CHECK_URLS:
+                page_fingerprint = None
+                if self.verdicts is not None:
+                    with timer.phase("setup"):
+                        page_fingerprint = self.page_fingerprint(page_url)
+                    cached = self.verdicts.reusable("UI Consistency", page_url, page_fingerprint)
+                    if cached:
+                        total_cards += cached["cards"]
+                        pages_reused += 1
+                        continue
                 
-                # Check for product image
-                try:
-                    image = card.find_element(By.TAG_NAME, "img")
-                    if not image.is_displayed():
-                        missing_elements.append("image")
-                except:
-                    missing_elements.append("image")
+                page_start = time.monotonic()
+                page_problems = len(inconsistent_cards)
+                with timer.phase("setup"):
+                    self.get_driver().get(page_url)
+                    self.wait.until(EC.presence_of_element_located((By.CLASS_NAME, "product-item")))
+                    self.driver_pool.record_page_savings(self.driver, page_url)
                 
-                # Check for product title
-                try:
-                    title = card.find_element(By.CLASS_NAME, "product-title")
-                    if not title.text.strip():
-                        missing_elements.append("title")
-                except:
-                    missing_elements.append("title")
+                # One round trip returns every card's parts as plain data
+                with timer.phase("action"):
+                    cards = snapshot_cards(self.driver)
                 
-                # Check for price
-                try:
-                    price = card.find_element(By.CLASS_NAME, "price")
-                    if not price.text.strip():
-                        missing_elements.append("price")
-                except:
-                    missing_elements.append("price")
+                with timer.phase("assertion"):
+                    for card in cards:
+                        total_cards += 1
+                        missing_elements = find_card_problems(card)
+                        if missing_elements:
+                            inconsistent_cards.append(
+                                f"{page_url} product {card['index']+1} missing: {', '.join(missing_elements)}"
+                            )
+                            if screenshot_path is None:
+                                # Clip to the first broken card while its page is still loaded
+                                card_element = self.driver.find_elements(By.CLASS_NAME, "product-item")[card['index']]
+                                screenshot_path = self.screenshot_manager.capture_screenshot("ui_inconsistent_card", card_element)
                 
-                if missing_elements:
-                    inconsistent_cards.append(f"Product {i+1} missing: {', '.join(missing_elements)}")
+                if self.verdicts is not None:
+                    page_passed = len(inconsistent_cards) == page_problems
+                    self.verdicts.store("UI Consistency", page_url, page_fingerprint, page_passed,
+                                        f"{len(cards)} cards checked", time.monotonic() - page_start, cards=len(cards))
             
+            reused = f" ({pages_reused} unchanged pages reused from the last run)" if pages_reused else ""
             if not inconsistent_cards:
                 self.log_test_result("Product Card Consistency", True, 
-                                   f"All {len(product_cards)} product cards have consistent UI elements")
+                                   f"All {total_cards} product cards across {len(Config.UI_CHECK_URLS)} pages have consistent UI elements{reused}",
+                                   timer=timer)
             else:
                 self.log_test_result("Product Card Consistency", False,
-                                   f"Inconsistent cards found: {', '.join(inconsistent_cards)}")
+                                   f"Inconsistent cards found: {', '.join(inconsistent_cards)}", screenshot_path, timer)
                 
         except Exception as e:
-            screenshot_path = self.screenshot_manager.capture_screenshot("ui_consistency_failure")
-            self.log_test_result("Product Card Consistency", False, f"UI check failed: {str(e)}", screenshot_path)
+            screenshot_path = None
+            if self.driver is not None:
+                screenshot_path = self.screenshot_manager.capture_screenshot("ui_consistency_failure")
+            self.log_test_result("Product Card Consistency", False, f"UI check failed: {str(e)}", screenshot_path, timer)
     
     def run_all_tests(self):
         """Execute all UI consistency tests"""
         self.check_product_card_consistency()
-        self.driver.quit()
+        if self.verdicts is not None:
+            self.verdicts.save()
+            self.http_client.close()
+        if self.lease is not None:
+            self.driver_pool.release(self.lease)
         return self.test_results
\ No newline at end of file
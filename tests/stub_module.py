@@ -0,0 +1,34 @@
+"""Browserless stand-in for a test module, used by the distributed tests"""
+import os
+import time
+from utils.result_sink import emit_result
+from utils.test_result import TestResult
+
+
+class StubModule:
+    """Emits one timed result per run.
+
+    With ``kill_marker`` the first run to find no marker file creates it,
+    reports a result and then dies without completing, like a worker host
+    that crashed mid-task.
+    """
+
+    def __init__(self, driver_pool=None, label="stub", shard_index=None, shard_count=None,
+                 kill_marker=None, duration=0.2):
+        self.label = label
+        self.shard_index = shard_index
+        self.kill_marker = kill_marker
+        self.duration = duration
+
+    def run(self):
+        started = time.time()
+        if self.kill_marker and not os.path.exists(self.kill_marker):
+            open(self.kill_marker, 'w').close()
+            emit_result(TestResult.create(self.label, "Partial", True, "never completed").to_dict())
+            os._exit(1)
+        time.sleep(self.duration)
+        result = TestResult.create(self.label, f"{self.label} run", True, "ok",
+                                   metrics={"shard": self.shard_index, "pid": os.getpid(),
+                                            "started": started, "ended": time.time()}).to_dict()
+        emit_result(result)
+        return [result]
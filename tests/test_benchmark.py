@@ -0,0 +1,23 @@
+import benchmark
+
+
+def test_measure_reports_wall_time_and_round_trips():
+    row = benchmark.measure("Noop", 12, lambda: None)
+    assert row["run"] == "Noop" and row["catalog_size"] == 12
+    assert row["wall_time"] >= 0 and row["round_trips"] == 0
+    assert row["peak_memory_mb"] is not None
+
+
+def test_price_diff_benchmark(capsys):
+    row = benchmark.benchmark_price_diff(2000)
+
+    assert row["run"] == "Price Snapshot Diff" and row["catalog_size"] == 2000
+    assert row["peak_memory_mb"] is None
+    # 1% changed, 0.1% removed and 0.1% new
+    assert "20 changed, 2 new, 2 removed" in capsys.readouterr().out
+
+
+def test_print_table_handles_untraced_rows(capsys):
+    benchmark.print_table([{"run": "Price Snapshot Diff", "catalog_size": 10, "wall_time": 0.5,
+                            "round_trips": 0, "peak_memory_mb": None}])
+    assert "-" in capsys.readouterr().out.splitlines()[-1]
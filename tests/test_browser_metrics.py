@@ -0,0 +1,28 @@
+from utils.browser_metrics import collect_page_metrics
+
+
+class FakeDriver:
+    """Returns queued Navigation Timing snapshots, repeating the last one"""
+
+    def __init__(self, *snapshots):
+        self.snapshots = list(snapshots)
+        self.calls = 0
+
+    def execute_script(self, script):
+        self.calls += 1
+        return dict(self.snapshots.pop(0) if len(self.snapshots) > 1 else self.snapshots[0])
+
+    def execute_async_script(self, script):
+        return None
+
+
+def test_waits_for_the_load_event():
+    driver = FakeDriver({"ttfb": 20.0, "load": None}, {"ttfb": 20.0, "load": None}, {"ttfb": 20.0, "load": 350.0})
+    metrics = collect_page_metrics(driver, load_wait=2)
+    assert metrics["load"] == 350.0 and driver.calls == 3
+
+
+def test_unfinished_load_is_reported_as_missing():
+    driver = FakeDriver({"ttfb": 20.0, "load": None})
+    metrics = collect_page_metrics(driver, load_wait=0.1)
+    assert metrics["load"] is None and metrics["ttfb"] == 20.0
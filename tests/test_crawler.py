@@ -0,0 +1,32 @@
+from utils.crawler import CrawlFrontier, normalize_url
+
+
+def test_normalize_url_canonicalises_equivalent_links():
+    base = "https://Shop.Example.com/catalog/index.html"
+    same = [
+        "https://shop.example.com:443/catalog/item?b=2&a=1#reviews",
+        "HTTPS://SHOP.EXAMPLE.COM/catalog/item?a=1&b=2",
+        "item?a=1&b=2",
+    ]
+    assert {normalize_url(url, base=base) for url in same} == {"https://shop.example.com/catalog/item?a=1&b=2"}
+
+
+def test_normalize_url_keeps_meaningful_differences():
+    assert normalize_url("http://localhost:8080") == "http://localhost:8080/"
+    assert normalize_url("http://localhost:80/") == "http://localhost/"
+    assert normalize_url("http://host/p?flag=") == "http://host/p?flag="
+    assert normalize_url("http://host/p?a=1") != normalize_url("http://host/p?a=2")
+
+
+def test_frontier_yields_each_url_once_in_breadth_first_order():
+    frontier = CrawlFrontier()
+    assert frontier.add(normalize_url("http://host/"), 0)
+    assert frontier.add(normalize_url("http://host/a#top"), 1)
+    assert not frontier.add(normalize_url("HTTP://HOST:80/a"), 2)
+    assert frontier.add(normalize_url("http://host/b"), 1)
+
+    assert len(frontier) == 3
+    assert [frontier.pop() for _ in range(3)] == [("http://host/", 0), ("http://host/a", 1), ("http://host/b", 1)]
+    # Popped URLs stay seen, so cycles back to them are ignored
+    assert not frontier.add("http://host/", 3)
+    assert len(frontier) == 0
@@ -0,0 +1,56 @@
+from config.config import Config
+from modules.data_driven import DataDrivenTesting, item_name
+from utils.sharding import expand_matrix
+
+
+class FakePool:
+    """Driver pool whose sessions are never used by the stubbed handlers"""
+
+    def acquire(self, owner):
+        raise AssertionError("no browser expected")
+
+    def release(self, lease):
+        pass
+
+
+def stubbed_module(monkeypatch, **config):
+    for name, value in config.items():
+        monkeypatch.setattr(Config, name, value)
+    tester = DataDrivenTesting(driver_pool=FakePool())
+    ran = []
+
+    def handler(worker, item):
+        ran.append(item_name(item))
+        return tester.build_result(item_name(item), True, "ok")
+
+    tester.search_item = tester.category_item = handler
+    return tester, ran
+
+
+def test_item_name_matches_result_names():
+    search, = expand_matrix("search", query=["laptop"])
+    category, = expand_matrix("category", category=["books"])
+    assert item_name(search) == "Search: laptop"
+    assert item_name(category) == "Category: books"
+
+
+def test_test_selection_matches_result_names(monkeypatch):
+    tester, ran = stubbed_module(monkeypatch, TEST_SELECTION=["Search: laptop"],
+                                 DATA_DRIVEN_QUERIES=["laptop", "phone"], DATA_DRIVEN_CATEGORIES=["books"])
+    tester.run_all_tests()
+    assert ran == ["Search: laptop"]
+
+
+def test_failed_item_keeps_its_result_name(monkeypatch):
+    tester, _ = stubbed_module(monkeypatch, TEST_SELECTION=None,
+                               DATA_DRIVEN_QUERIES=["laptop"], DATA_DRIVEN_CATEGORIES=["books"])
+
+    def crash(worker, item):
+        raise RuntimeError("page gone")
+
+    tester.search_item = crash
+    results = {result["test_name"]: result for result in tester.run_all_tests()}
+
+    assert results["Search: laptop"]["status"] == "FAIL"
+    assert "page gone" in results["Search: laptop"]["message"]
+    assert results["Category: books"]["status"] == "PASS"
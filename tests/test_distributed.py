@@ -0,0 +1,55 @@
+from config.config import Config
+from utils.distributed import Coordinator, DistributedWorker, RemoteResultSink
+from utils.result_sink import ResultSink, iter_results
+from utils.scheduler import ModuleSpec
+
+
+def stub_spec(name, **options):
+    kwargs = dict(options.pop("kwargs", {}), label=name)
+    return ModuleSpec(name, name, "tests.stub_module", "StubModule", "run", kwargs=kwargs, **options)
+
+
+def test_two_workers_survive_a_killed_worker(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, "DISTRIBUTED_DATA_SHARDS", 3)
+    specs = [
+        stub_spec("Sharded", shardable=True),
+        stub_spec("Victim", kwargs={"kill_marker": str(tmp_path / "killed")}),
+        stub_spec("Plain"),
+        stub_spec("Exclusive", exclusive=True),
+    ]
+    coordinator = Coordinator(host="127.0.0.1", port=0, local_workers=2, lease_timeout=2, max_attempts=2)
+    stream = str(tmp_path / "results.jsonl")
+    sink = ResultSink.install(stream)
+    try:
+        counts = coordinator.run(specs)
+    finally:
+        sink.close()
+    results = list(iter_results(stream))
+    assert counts == {"Sharded": 3, "Victim": 1, "Plain": 1, "Exclusive": 1}
+
+    by_module = {}
+    for result in results:
+        by_module.setdefault(result["module"], []).append(result)
+    # Every shard ran exactly once
+    assert sorted(r["metrics"]["shard"] for r in by_module["Sharded"]) == [0, 1, 2]
+    # The killed attempt's partial result was dropped and the task rerun elsewhere
+    assert [r["test_name"] for r in by_module["Victim"]] == ["Victim run"]
+    stats = coordinator.get_stats()
+    assert stats["reassigned"] == 1
+    assert sum(worker["lost"] for worker in stats["workers"].values()) == 1
+    # The exclusive module started only after everything else had finished
+    exclusive, = by_module["Exclusive"]
+    others = [r for r in results if r["module"] != "Exclusive"]
+    assert exclusive["metrics"]["started"] >= max(r["metrics"]["ended"] for r in others)
+    assert all(r["status"] == "PASS" for r in results)
+
+
+def test_undeliverable_result_abandons_attempt_without_raising(monkeypatch):
+    monkeypatch.setattr(Config, "DISTRIBUTED_HEARTBEAT", 0.01)
+    # Nothing listens on port 9 of localhost, so every POST fails
+    sink = RemoteResultSink(DistributedWorker("http://127.0.0.1:9", "w"), {"task": "Plain", "attempt": 1})
+
+    sink.emit({"module": "Plain", "test_name": "t", "status": "PASS"})
+    sink.emit({"module": "Plain", "test_name": "u", "status": "PASS"})
+
+    assert sink.abandoned and sink.total == 0
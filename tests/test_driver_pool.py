@@ -0,0 +1,118 @@
+import threading
+import time
+import pytest
+from config.config import Config
+from utils.driver_pool import DriverPool
+
+
+@pytest.fixture(autouse=True)
+def plain_pool(monkeypatch):
+    # No command tracing or resource blocking on the fake drivers
+    monkeypatch.setattr(Config, "TRACE_WEBDRIVER", False)
+    monkeypatch.setattr(Config, "FAST_MODE", False)
+
+
+class FakeSwitch:
+    def window(self, handle):
+        pass
+
+
+class FakeDriver:
+    """Enough of a WebDriver for the pool: handles, reset calls and quit"""
+
+    def __init__(self):
+        self.alive = True
+        self.quit_called = False
+        self.switch_to = FakeSwitch()
+        self.pages = []
+
+    @property
+    def window_handles(self):
+        if not self.alive:
+            raise ConnectionError("session gone")
+        return ["main"]
+
+    def delete_all_cookies(self):
+        pass
+
+    def execute_script(self, script):
+        pass
+
+    def get(self, url):
+        self.pages.append(url)
+
+    def quit(self):
+        self.quit_called = True
+
+
+def make_pool(max_size=1):
+    drivers = []
+
+    def factory():
+        drivers.append(FakeDriver())
+        return drivers[-1]
+
+    return DriverPool(max_size=max_size, driver_factory=factory), drivers
+
+
+def test_released_driver_is_reset_and_reused():
+    pool, drivers = make_pool()
+    first = pool.acquire("A")
+    pool.release(first)
+    second = pool.acquire("B")
+
+    assert second.driver is first.driver and len(drivers) == 1
+    assert first.driver.pages == ["about:blank"]
+    pool.release(second)
+    pool.release(second)  # Double release is ignored
+    assert len(pool.idle_drivers) == 1
+
+
+def test_acquire_blocks_at_capacity_until_release():
+    pool, drivers = make_pool(max_size=1)
+    lease = pool.acquire("A")
+    acquired = []
+    waiter = threading.Thread(target=lambda: acquired.append(pool.acquire("B")))
+    waiter.start()
+    time.sleep(0.1)
+    assert not acquired
+
+    pool.release(lease)
+    waiter.join(timeout=2)
+    assert acquired and acquired[0].driver is lease.driver and len(drivers) == 1
+    assert acquired[0].wait_time >= 0.05
+
+
+def test_unhealthy_idle_driver_is_replaced():
+    pool, drivers = make_pool()
+    lease = pool.acquire("A")
+    pool.release(lease)
+    lease.driver.alive = False
+
+    replacement = pool.acquire("B")
+
+    assert replacement.driver is not lease.driver and lease.driver.quit_called
+    assert len(drivers) == 2 and pool.get_stats()["sessions_recycled"] == 1
+
+
+def test_driver_that_fails_reset_is_discarded():
+    pool, drivers = make_pool()
+    lease = pool.acquire("A")
+    lease.driver.alive = False
+    pool.release(lease)
+    assert pool.idle_drivers == [] and pool.created_count == 0
+
+
+def test_failed_launch_frees_its_slot():
+    attempts = []
+
+    def factory():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RuntimeError("chrome not found")
+        return FakeDriver()
+
+    pool = DriverPool(max_size=1, driver_factory=factory)
+    with pytest.raises(RuntimeError):
+        pool.acquire("A")
+    assert pool.acquire("A").driver is not None
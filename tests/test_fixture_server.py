@@ -0,0 +1,77 @@
+import http.client
+import re
+import statistics
+import time
+import pytest
+from utils.fixture_server import FixtureCatalog, FixtureStorefront, form_token
+
+
+@pytest.fixture
+def storefront():
+    with FixtureStorefront(catalog_size=40, port=0, latency=0, links={"/broken": (404, 0.0)}) as storefront:
+        yield storefront
+
+
+def connect(storefront):
+    host, port = storefront.server.server_address[:2]
+    return http.client.HTTPConnection(host, port, timeout=5)
+
+
+def get(connection, path, headers=None):
+    connection.request("GET", path, headers=headers or {})
+    response = connection.getresponse()
+    return response, response.read().decode("utf-8", "replace")
+
+
+def test_catalog_is_deterministic():
+    first, second = FixtureCatalog(50, seed=1), FixtureCatalog(50, seed=1)
+    assert first.products == second.products
+    assert first.by_slug["apple-macbook-pro-13-inch"]["price"] == "1800.00"
+    assert all(first.by_category[category] for category in first.by_category)
+
+
+def test_pages_use_module_selectors(storefront):
+    connection = connect(storefront)
+    _, listing = get(connection, "/electronics")
+    assert "product-item" in listing and "product-title" in listing
+    response, product = get(connection, "/apple-macbook-pro-13-inch")
+    assert response.status == 200
+    assert 'class="price-value-1">$1800.00' in product
+    response, _ = get(connection, "/broken")
+    assert response.status == 404
+
+
+def test_etag_revalidation(storefront):
+    connection = connect(storefront)
+    response, _ = get(connection, "/books")
+    response, body = get(connection, "/books", {"If-None-Match": response.getheader("ETag")})
+    assert response.status == 304 and body == ""
+
+
+def test_forms_require_the_issued_token(storefront):
+    connection = connect(storefront)
+    response, page = get(connection, "/login")
+    cookie = response.getheader("Set-Cookie").split(";")[0]
+    token = re.search(r'name="__RequestVerificationToken" type="hidden" value="([^"]*)"', page).group(1)
+    assert token == form_token(cookie.split("=", 1)[1])
+
+    def post(token):
+        connection.request("POST", "/login", body=f"Email=a%40b.c&__RequestVerificationToken={token}",
+                           headers={"Cookie": cookie, "Content-Type": "application/x-www-form-urlencoded"})
+        response = connection.getresponse()
+        response.read()
+        return response.status
+
+    assert post("forged") == 400
+    assert post(token) == 302
+
+
+def test_keep_alive_responses_are_not_delayed(storefront):
+    # Nagle plus delayed ACK would add ~40ms to every response on a reused connection
+    connection = connect(storefront)
+    timings = []
+    for _ in range(10):
+        start = time.perf_counter()
+        get(connection, "/electronics")
+        timings.append(time.perf_counter() - start)
+    assert statistics.median(timings) < 0.02
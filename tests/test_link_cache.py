@@ -0,0 +1,58 @@
+import time
+
+from utils.link_cache import LinkStatusCache
+
+
+def age(cache, url, seconds):
+    cache.entries[url]["checked_at"] = time.time() - seconds
+
+
+def test_fresh_stale_and_failed_lookups(tmp_path):
+    cache = LinkStatusCache(path=str(tmp_path / "links.json"), ttl=100)
+    cache.store("http://host/fresh", 200)
+    cache.store("http://host/stale", 200, etag='"v1"', last_modified="Mon, 01 Jan 2024 00:00:00 GMT")
+    cache.store("http://host/broken", 404, etag='"v1"')
+    age(cache, "http://host/stale", 101)
+
+    assert cache.lookup("http://host/missing") == (None, False)
+    assert cache.lookup("http://host/fresh")[1]
+    stale, fresh = cache.lookup("http://host/stale")
+    assert not fresh
+    assert cache.conditional_headers(stale) == {
+        "If-None-Match": '"v1"', "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT"}
+    # Failures are never served fresh and never revalidated
+    broken, fresh = cache.lookup("http://host/broken")
+    assert not fresh and cache.conditional_headers(broken) == {}
+
+    assert cache.mark_revalidated("http://host/stale") == 200
+    assert cache.lookup("http://host/stale")[1]
+    stats = cache.get_stats()
+    assert (stats["lookups"], stats["fresh_hits"], stats["revalidated"]) == (5, 2, 1)
+
+
+def test_save_evicts_expired_and_excess_entries(tmp_path, monkeypatch):
+    monkeypatch.setattr("config.config.Config.LINK_CACHE_STALE_FACTOR", 2)
+    cache = LinkStatusCache(path=str(tmp_path / "links.json"), ttl=100, max_entries=2)
+    for index in range(4):
+        cache.store(f"http://host/{index}", 200)
+        age(cache, f"http://host/{index}", index * 10)
+    cache.store("http://host/expired", 200)
+    age(cache, "http://host/expired", 201)
+
+    cache.save()
+    assert sorted(cache.entries) == ["http://host/0", "http://host/1"]
+
+
+def test_save_is_atomic_and_reloads(tmp_path):
+    path = tmp_path / "nested" / "links.json"
+    cache = LinkStatusCache(path=str(path), ttl=100)
+    cache.store("http://host/", 200, final_url="http://host/home")
+    cache.save()
+
+    assert not (tmp_path / "nested" / "links.json.tmp").exists()
+    reloaded = LinkStatusCache(path=str(path), ttl=100)
+    entry, fresh = reloaded.lookup("http://host/")
+    assert fresh and entry["final_url"] == "http://host/home"
+
+    path.write_text("{not json")
+    assert LinkStatusCache(path=str(path)).entries == {}
@@ -0,0 +1,58 @@
+import json
+import random
+import pytest
+from config.config import Config
+from modules.load_testing import LoadTesting
+from utils.fixture_server import FixtureStorefront
+from utils.load_generator import LatencyHistogram
+
+
+def test_histogram_percentiles_within_one_percent():
+    rng = random.Random(0)
+    values = sorted(rng.lognormvariate(-3, 1) for _ in range(20000))
+    histogram = LatencyHistogram()
+    for value in values:
+        histogram.record(value)
+
+    for p in (50, 90, 99, 99.9):
+        exact = values[int(p / 100 * len(values) + 0.5) - 1]
+        assert exact <= histogram.percentile(p) <= exact * 1.01 + 1e-6
+
+
+def test_histogram_bucket_error_bound():
+    # The median of {value, 1s} is reported as the top of value's bucket
+    for micros in range(1000, 300000, 37):
+        histogram = LatencyHistogram()
+        histogram.record(micros / 1_000_000)
+        histogram.record(1.0)
+        assert micros / 1_000_000 <= histogram.percentile(50) <= micros * 1.008 / 1_000_000
+
+
+@pytest.fixture
+def fixture_store(monkeypatch, tmp_path):
+    for name in ("BASE_URL", "LOGIN_URL", "PRODUCTS_URL", "SEARCH_URL", "UI_CHECK_URLS"):
+        monkeypatch.setattr(Config, name, getattr(Config, name))
+    monkeypatch.setattr(Config, "LOAD_THINK_TIME", 0.05)
+    monkeypatch.setattr(Config, "LOAD_REPORT_PATH", str(tmp_path / "load_test.json"))
+    with FixtureStorefront(catalog_size=24, port=0, latency=0) as storefront:
+        Config.set_base_url(storefront.url)
+        yield storefront
+
+
+def test_short_load_profile_against_fixture(fixture_store):
+    results = LoadTesting(profile=[(1, 4), (1, 4)]).run_load_test()
+
+    with open(Config.LOAD_REPORT_PATH, encoding="utf-8") as f:
+        stats = json.load(f)
+    assert stats["errors"] == 0 and stats["peak_users"] == 4
+    steps = stats["steps"]
+    # Every user logs in once, then searches and adds to cart on each iteration
+    assert steps["Login page"]["requests"] == steps["Login submit"]["requests"] == stats["users_started"]
+    iterations = steps["Search"]["requests"]
+    assert iterations >= stats["users_started"]
+    assert steps["Product page"]["requests"] == steps["Add to cart"]["requests"] == iterations
+    assert stats["requests"] == sum(step["requests"] for step in steps.values())
+    for step in steps.values():
+        latency = step["latency"]
+        assert latency["min"] <= latency["p50"] <= latency["p90"] <= latency["p99"] <= latency["max"]
+    assert all(result["status"] == "PASS" for result in results)
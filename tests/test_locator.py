@@ -0,0 +1,44 @@
+from utils.locator import RESOLVE_SCRIPT, resolve_first_visible
+
+
+class FakeDriver:
+    """Returns the queued script results in order, then keeps returning the last one"""
+
+    def __init__(self, *matches):
+        self.matches = list(matches)
+        self.calls = []
+
+    def execute_script(self, script, *args):
+        self.calls.append((script, args))
+        return self.matches.pop(0) if len(self.matches) > 1 else self.matches[0]
+
+
+CANDIDATES = [("id", "buy"), ("css selector", ".buy-button"), ("xpath", "//button")]
+
+
+def test_first_match_resolves_in_one_round_trip():
+    driver = FakeDriver([1, "element"])
+    resolution = resolve_first_visible(driver, CANDIDATES, timeout=1)
+
+    assert resolution.found and resolution.element == "element"
+    assert resolution.locator == ("css selector", ".buy-button") and resolution.index == 1
+    assert resolution.polls == 1
+    script, args = driver.calls[0]
+    assert script == RESOLVE_SCRIPT
+    assert args == ([["id", "buy"], ["css selector", ".buy-button"], ["xpath", "//button"]],)
+
+
+def test_polls_until_an_element_appears():
+    driver = FakeDriver(None, None, [0, "element"])
+    resolution = resolve_first_visible(driver, CANDIDATES, timeout=5, poll_interval=0.01)
+
+    assert resolution.found and resolution.index == 0 and resolution.polls == 3
+
+
+def test_gives_up_after_the_timeout():
+    driver = FakeDriver(None)
+    resolution = resolve_first_visible(driver, CANDIDATES, timeout=0.05, poll_interval=0.01)
+
+    assert not resolution.found
+    assert resolution.polls > 1 and resolution.latency >= 0.05
+    assert resolution.to_dict()["locator"] is None
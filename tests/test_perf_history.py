@@ -0,0 +1,54 @@
+import pytest
+
+from utils.perf_history import PerformanceHistory, sparkline
+
+
+@pytest.fixture
+def history(tmp_path):
+    store = PerformanceHistory(path=str(tmp_path / "history.db"))
+    yield store
+    store.close()
+
+
+def record_previous_runs(store, values):
+    current = store.run_id
+    for index, value in enumerate(values):
+        store.run_id = f"previous_{index}"
+        store.record("Home", "load_ms", value, recorded_at=1000 + index)
+    store.run_id = current
+
+
+def test_baseline_excludes_the_current_run(history):
+    record_previous_runs(history, [100, 102, 98, 101])
+    # The current run's own (slow) sample must not dilute its baseline
+    history.record("Home", "load_ms", 200, recorded_at=2000)
+
+    comparison = history.compare_to_baseline("Home", "load_ms", 200)
+    assert comparison["baseline_mean"] == pytest.approx(100.25)
+    assert comparison["regression"]
+    assert history.history("Home", "load_ms") == [100, 102, 98, 101, 200]
+
+
+def test_no_verdict_until_enough_previous_runs(history):
+    record_previous_runs(history, [100, 100])
+    history.record("Home", "load_ms", 100)
+    history.record("Home", "load_ms", 100)
+
+    comparison = history.compare_to_baseline("Home", "load_ms", 500)
+    assert comparison["baseline_mean"] is None and not comparison["regression"]
+
+
+def test_small_slowdowns_are_not_regressions(history, monkeypatch):
+    monkeypatch.setattr("config.config.Config.PERF_BASELINE_RUNS", 3)
+    record_previous_runs(history, [500, 100, 100, 100])
+
+    # Only the last three previous runs count, and a 5% change stays under the minimum delta
+    comparison = history.compare_to_baseline("Home", "load_ms", 105)
+    assert comparison["baseline_mean"] == 100
+    assert comparison["z_score"] == float("inf") and not comparison["regression"]
+
+
+def test_sparkline():
+    assert sparkline([]) == ""
+    assert sparkline([1, 1]) == "▁▁"
+    assert sparkline([0, 7, 14]) == "▁▄█"
@@ -0,0 +1,56 @@
+from decimal import Decimal
+import pytest
+from config.config import Config
+from utils.price_snapshots import PriceSnapshotStore, parse_price
+
+
+@pytest.mark.parametrize("text, locale", [
+    ("$1,800.00", "en_US"),
+    ("1.800,00 €", "de_DE"),
+    ("CHF 1'800.00", "de_CH"),
+])
+def test_parse_price_formats(text, locale):
+    assert parse_price(text, locale) == Decimal("1800.00")
+
+
+@pytest.mark.parametrize("text", ["$1,800.00", "1.800,00 €", "CHF 1'800.00"])
+def test_parse_price_falls_back_when_text_does_not_follow_locale(text, monkeypatch):
+    monkeypatch.setattr(Config, "PRICE_LOCALE", "en_US")
+    assert parse_price(text) == Decimal("1800.00")
+    assert parse_price(text, "de_DE") == Decimal("1800.00")
+    assert parse_price(text, None) == Decimal("1800.00")
+
+
+def test_parse_price_without_number():
+    assert parse_price("Call for price") is None
+    assert parse_price(None) is None
+
+
+def test_diff_reports_changes_new_and_removed(tmp_path):
+    store = PriceSnapshotStore(root=str(tmp_path))
+    old = store.record("electronics", [("a", Decimal("10.00"), None), ("b", Decimal("5.49"), None),
+                                       ("c", Decimal("1.00"), None)])
+    new = store.record("electronics", [("a", Decimal("10.00"), None), ("b", Decimal("5.99"), None),
+                                       ("d", Decimal("2.00"), None)])
+
+    diff = PriceSnapshotStore(root=str(tmp_path)).diff(old, new)
+
+    assert diff["changed"] == [("b", Decimal("5.49"), Decimal("5.99"))]
+    assert diff["added"] == ["d"]
+    assert diff["removed"] == ["c"]
+
+
+def test_diff_across_scale_change(tmp_path):
+    old = PriceSnapshotStore(root=str(tmp_path), scale=2).record("books", [("a", Decimal("10.00"), None)])
+    store = PriceSnapshotStore(root=str(tmp_path), scale=4)
+    new = store.record("books", [("a", Decimal("10.00"), None)])
+
+    assert store.diff(old, new)["changed"] == []
+    assert store.latest("books", before=new.id).scale == 2
+
+
+def test_record_rejects_inexact_price_without_writing(tmp_path):
+    store = PriceSnapshotStore(root=str(tmp_path), scale=2)
+    with pytest.raises(ValueError):
+        store.record("books", [("a", Decimal("1.005"), None)])
+    assert store.snapshots() == []
@@ -0,0 +1,86 @@
+import http.client
+import pytest
+from utils.fixture_server import FixtureStorefront
+from utils.record_replay import RecordReplayProxy, ResponseArchive
+
+
+def request(proxy, method, path, headers=None):
+    host, port = proxy.server.server_address[:2]
+    connection = http.client.HTTPConnection(host, port, timeout=5)
+    connection.request(method, path, headers=headers or {})
+    response = connection.getresponse()
+    body = response.read()
+    connection.close()
+    return response, body
+
+
+@pytest.fixture
+def storefront():
+    with FixtureStorefront(catalog_size=24, port=0, latency=0) as storefront:
+        yield storefront
+
+
+def test_record_then_replay_round_trip(storefront, tmp_path):
+    archive_dir = str(tmp_path / "recording")
+    origin = storefront.url
+    with RecordReplayProxy("record", origin, archive_dir, port=0) as recorder:
+        _, live_home = request(recorder, "GET", "/")
+        _, live_product = request(recorder, "GET", "/apple-macbook-pro-13-inch")
+        # A HEAD while recording must not replace the GET recording with an empty body
+        request(recorder, "HEAD", "/")
+    assert recorder.get_stats()["recorded"] == 3
+    storefront.stop()
+
+    assert set(ResponseArchive(archive_dir).entries) == {"GET /", "GET /apple-macbook-pro-13-inch"}
+    with RecordReplayProxy("replay", origin, archive_dir, port=0) as replayer:
+        response, home = request(replayer, "GET", "/")
+        assert response.status == 200 and home == live_home
+        assert request(replayer, "GET", "/apple-macbook-pro-13-inch")[1] == live_product
+
+        response, body = request(replayer, "HEAD", "/")
+        assert response.status == 200 and body == b""
+        assert int(response.getheader("Content-Length")) == len(live_home)
+
+        response, body = request(replayer, "GET", "/never-recorded")
+        assert response.status == 502 and b"Not in recording" in body
+    stats = replayer.get_stats()
+    assert stats["replayed"] == 3 and stats["misses"] == 1
+
+
+def test_replay_rewrites_origin_urls(tmp_path):
+    origin = "https://shop.example.com"
+    archive = ResponseArchive(str(tmp_path))
+    archive.put("GET /", 302, [("Content-Type", "text/html"), ("Location", f"{origin}/login")],
+                f'<a href="{origin}/books">Books</a> <img src="//shop.example.com/a.png">'.encode(), 0.01)
+    archive.save()
+
+    with RecordReplayProxy("replay", origin, str(tmp_path), port=0) as proxy:
+        local = proxy.url
+        response, body = request(proxy, "GET", "/")
+    assert response.status == 302
+    assert response.getheader("Location") == f"{local}/login"
+    assert body.decode() == f'<a href="{local}/books">Books</a> <img src="//{local.split("//")[1]}/a.png">'
+
+
+def test_cookie_domain_and_secure_are_stripped():
+    proxy = RecordReplayProxy("replay", "https://shop.example.com")
+    value = proxy.strip_cookie_scope("Set-Cookie", "id=1; Domain=.example.com; Path=/; Secure; HttpOnly")
+    assert value == "id=1; Path=/; HttpOnly"
+    assert proxy.strip_cookie_scope("Location", "https://shop.example.com/; Secure") == \
+        "https://shop.example.com/; Secure"
+
+
+def test_index_survives_a_recording_that_never_stops(storefront, tmp_path):
+    archive_dir = str(tmp_path / "recording")
+    recorder = RecordReplayProxy("record", storefront.url, archive_dir, port=0).start()
+    request(recorder, "GET", "/books")
+    # Simulate a crash: the server goes away without stop() saving index.json
+    recorder.server.shutdown()
+    recorder.server.server_close()
+
+    archive = ResponseArchive(archive_dir)
+    entry, body = archive.get("GET /books")
+    assert entry["status"] == 200 and b"product-item" in body
+
+    archive.save()
+    assert ResponseArchive(archive_dir).get("GET /books")[0] == entry
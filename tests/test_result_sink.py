@@ -0,0 +1,45 @@
+import os
+from config.config import Config
+from utils.result_sink import ResultSink, iter_results, rotate_stream
+
+
+def test_rotate_keeps_previous_streams(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, "RESULTS_STREAM_KEEP", 2)
+    path = tmp_path / "results.jsonl"
+    for stamp in range(3):
+        old = tmp_path / f"results.2026010{stamp}-000000.jsonl"
+        old.write_text("{}\n")
+        os.utime(old, (1767225600 + stamp * 86400,) * 2)
+    path.write_text('{"status": "FAIL"}\n')
+
+    rotated = rotate_stream(str(path))
+
+    assert not path.exists()
+    assert sorted(os.listdir(tmp_path)) == ["results.20260102-000000.jsonl", os.path.basename(rotated)]
+
+
+def test_sink_rotates_instead_of_truncating(tmp_path):
+    path = str(tmp_path / "results.jsonl")
+    sink = ResultSink.install(path)
+    sink.emit({"module": "M", "test_name": "first", "status": "PASS"})
+    sink.close()
+
+    sink = ResultSink.install(path, rotate=True)
+    sink.emit({"module": "M", "test_name": "second", "status": "PASS"})
+    sink.close()
+
+    assert [r["test_name"] for r in iter_results(path)] == ["second"]
+    previous = [name for name in os.listdir(tmp_path) if name != "results.jsonl"]
+    assert [r["test_name"] for r in iter_results(str(tmp_path / previous[0]))] == ["first"]
+
+
+def test_rotations_within_one_second_do_not_overwrite(tmp_path):
+    path = tmp_path / "results.jsonl"
+    rotated = []
+    for run in range(3):
+        path.write_text(f'{{"run": {run}}}\n')
+        os.utime(path, (1767225600, 1767225600))  # Same mtime for every run
+        rotated.append(rotate_stream(str(path), keep=5))
+
+    assert len(set(rotated)) == 3
+    assert sorted(next(iter_results(name))["run"] for name in rotated) == [0, 1, 2]
@@ -0,0 +1,19 @@
+import json
+import math
+from utils.sampling import json_safe, percentile, summarize_samples
+
+
+def test_summary_of_single_sample_serialises_as_strict_json():
+    summary = summarize_samples([1.5])
+    assert math.isinf(summary["ci_high"])
+
+    safe = json_safe({"stats": {"load": summary}, "trend": [1.0, float("nan")]})
+    text = json.dumps(safe, allow_nan=False)
+    assert json.loads(text)["stats"]["load"]["ci_high"] is None
+    assert safe["trend"] == [1.0, None] and safe["stats"]["load"]["median"] == 1.5
+
+
+def test_summary_confidence_interval():
+    summary = summarize_samples([1.0, 1.0, 1.0])
+    assert summary["ci_low"] == summary["ci_high"] == 1.0
+    assert percentile([1, 2, 3, 4], 50) == 2.5
@@ -0,0 +1,43 @@
+from utils.result_sink import ResultSink, iter_results
+from utils.scheduler import ModuleScheduler, ModuleSpec, run_module
+
+
+def stub_spec(name, duration=0.05, **options):
+    return ModuleSpec(name, name, "tests.stub_module", "StubModule", "run",
+                      kwargs={"label": name, "duration": duration}, **options)
+
+
+def run_specs(tmp_path, specs, workers=2):
+    stream = str(tmp_path / "results.jsonl")
+    sink = ResultSink.install(stream)
+    try:
+        counts = ModuleScheduler(workers=workers, mode="threads", driver_pool=object()).run(specs)
+    finally:
+        sink.close()
+    return counts, list(iter_results(stream))
+
+
+def test_crashing_module_becomes_a_fail_result(tmp_path):
+    broken = ModuleSpec("Broken", "Broken", "tests.stub_module", "MissingClass", "run")
+    counts, results = run_specs(tmp_path, [broken, stub_spec("Fine")])
+
+    assert counts == {"Broken": 1, "Fine": 1}
+    crash, = [result for result in results if result["module"] == "Broken"]
+    assert crash["status"] == "FAIL" and crash["test_name"] == "Broken Execution"
+    assert "Module crashed" in crash["message"]
+
+
+def test_counts_follow_spec_order_and_exclusive_runs_last(tmp_path):
+    specs = [stub_spec("Exclusive", exclusive=True), stub_spec("Slow", duration=0.2), stub_spec("Fast")]
+    counts, results = run_specs(tmp_path, specs)
+
+    assert list(counts) == ["Exclusive", "Slow", "Fast"]
+    # Stream order is completion order: the concurrent batch first, the exclusive module alone after it
+    assert [result["module"] for result in results] == ["Fast", "Slow", "Exclusive"]
+    exclusive = results[-1]["metrics"]
+    assert all(exclusive["started"] >= result["metrics"]["ended"] for result in results[:-1])
+
+
+def test_run_module_returns_crash_result_list():
+    results = run_module(ModuleSpec("Broken", "Broken", "no.such.module", "X", "run"), driver_pool=object())
+    assert len(results) == 1 and results[0]["status"] == "FAIL"
@@ -0,0 +1,62 @@
+import pytest
+
+from utils.selector_registry import SelectorRegistry
+
+PRIMARY = ["class name", "product-title"]
+FALLBACK = ["css selector", "h2.title a"]
+
+
+class FakeDriver:
+    """Pretends only the given locators are visible on the page"""
+
+    def __init__(self, *visible):
+        self.visible = [list(locator) for locator in visible]
+
+    def execute_script(self, script, candidates):
+        for index, locator in enumerate(candidates):
+            if locator in self.visible:
+                return [index, f"element:{locator[1]}"]
+        return None
+
+
+@pytest.fixture
+def registry(tmp_path, monkeypatch):
+    monkeypatch.setattr("config.config.Config.SELECTOR_FALLBACKS", {"PRODUCT_TITLE": [FALLBACK]})
+    monkeypatch.setattr("config.config.Config.SELECTOR_FALLBACK_ALERT_RATE", 0.5)
+    return SelectorRegistry(path=str(tmp_path / "selectors.json"))
+
+
+def test_fallback_winner_is_learned_per_page_type_and_persisted(registry):
+    assert registry.candidates("PRODUCT_TITLE", "search") == [tuple(PRIMARY), tuple(FALLBACK)]
+    assert registry.find(FakeDriver(FALLBACK), "PRODUCT_TITLE", "search", timeout=0) == "element:h2.title a"
+
+    assert registry.candidates("PRODUCT_TITLE", "search")[0] == tuple(FALLBACK)
+    assert registry.candidates("PRODUCT_TITLE", "category")[0] == tuple(PRIMARY)
+
+    registry.save()
+    reloaded = SelectorRegistry(path=registry.path)
+    assert reloaded.candidates("PRODUCT_TITLE", "search")[0] == tuple(FALLBACK)
+    assert reloaded.usage["PRODUCT_TITLE"] == {"lookups": 1, "fallbacks": 1, "misses": 0}
+
+
+def test_unknown_element_and_total_miss(registry):
+    with pytest.raises(KeyError):
+        registry.candidates("NOT_A_THING", "search")
+    with pytest.raises(Exception, match="No locator matched for PRODUCT_TITLE"):
+        registry.find(FakeDriver(), "PRODUCT_TITLE", "search", timeout=0)
+    assert "search" not in registry.winners
+
+
+def test_fallback_report_threshold(registry):
+    primary_page = FakeDriver(PRIMARY, ["id", "small-searchterms"])
+    fallback_page = FakeDriver(FALLBACK)
+    registry.resolve(primary_page, "PRODUCT_TITLE", "home", timeout=0)
+    registry.resolve(fallback_page, "PRODUCT_TITLE", "search", timeout=0)
+    registry.resolve(primary_page, "SEARCH_BOX", "home", timeout=0)
+    registry.resolve(primary_page, "SEARCH_BOX", "home", timeout=0)
+    registry.resolve(FakeDriver(), "SEARCH_BOX", "home", timeout=0)
+
+    # PRODUCT_TITLE misses its primary half the time (at the threshold); SEARCH_BOX only a third
+    report = registry.fallback_report()
+    assert [entry["element"] for entry in report] == ["PRODUCT_TITLE"]
+    assert report[0]["fallback_rate"] == 50.0 and report[0]["primary"] == PRIMARY
@@ -0,0 +1,83 @@
+import json
+import threading
+import time
+import pytest
+from utils.sharding import WorkStealingExecutor, expand_matrix, load_data_set
+
+
+def test_expand_matrix_builds_every_combination():
+    items = expand_matrix("search", query=["laptop", "phone"], sort=["price", "name"])
+    assert [item.params for item in items] == [
+        {"query": "laptop", "sort": "price"}, {"query": "laptop", "sort": "name"},
+        {"query": "phone", "sort": "price"}, {"query": "phone", "sort": "name"},
+    ]
+    assert items[0].label == "query=laptop, sort=price"
+
+
+def test_load_data_set_from_list_csv_and_json(tmp_path):
+    assert load_data_set(("a", "b")) == ["a", "b"]
+
+    csv_path = tmp_path / "queries.csv"
+    csv_path.write_text("query,notes\nlaptop,x\n  \nphone ,y\n", encoding="utf-8")
+    assert load_data_set(str(csv_path)) == ["laptop", "phone"]
+    assert load_data_set(str(csv_path), column="notes") == ["x", "y"]
+
+    json_path = tmp_path / "categories.json"
+    json_path.write_text(json.dumps(["books", "jewelry"]), encoding="utf-8")
+    assert load_data_set(str(json_path)) == ["books", "jewelry"]
+    json_path.write_text(json.dumps([{"category": "books"}, {"other": 1}]), encoding="utf-8")
+    assert load_data_set(str(json_path)) == ["books"]
+
+
+def test_load_data_set_rejects_unknown_format(tmp_path):
+    path = tmp_path / "queries.txt"
+    path.write_text("laptop\n", encoding="utf-8")
+    with pytest.raises(ValueError):
+        load_data_set(str(path))
+
+
+def test_executor_spreads_items_and_keeps_order():
+    executor = WorkStealingExecutor(workers=3)
+    threads = set()
+
+    def handler(worker, item):
+        threads.add(threading.current_thread().name)
+        time.sleep(0.01)
+        return item * 2
+
+    assert executor.run(range(12), handler) == [item * 2 for item in range(12)]
+    stats = executor.last_stats
+    assert stats["workers"] == 3 and len(threads) == 3
+    assert sum(worker["items"] for worker in stats["per_worker"]) == 12
+    assert all(worker["items"] == 4 for worker in stats["per_worker"])
+
+
+def test_idle_workers_steal_from_a_slow_worker():
+    executor = WorkStealingExecutor(workers=2)
+
+    def handler(worker, item):
+        # Item 0 (dealt to worker 0) is slow; worker 1 should take over worker 0's backlog
+        time.sleep(0.3 if item == 0 else 0.01)
+        return worker.index
+
+    owners = executor.run(range(10), handler)
+    stats = {worker["worker"]: worker for worker in executor.last_stats["per_worker"]}
+    assert stats[1]["stolen"] > 0
+    assert owners[0] == 0 and owners.count(1) > 5
+
+
+def test_exceptions_are_returned_per_item():
+    executor = WorkStealingExecutor(workers=2)
+
+    def handler(worker, item):
+        if item == 2:
+            raise RuntimeError("boom")
+        return item
+
+    outcomes = executor.run(range(4), handler)
+    assert outcomes[:2] == [0, 1] and outcomes[3] == 3
+    assert isinstance(outcomes[2], RuntimeError) and str(outcomes[2]) == "boom"
+
+
+def test_executor_with_no_items():
+    assert WorkStealingExecutor(workers=2).run([], lambda worker, item: item) == []
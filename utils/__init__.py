@@ -1,10 +1,129 @@
-from .reporting import ReportGenerator
-from .screenshot_manager import ScreenshotManager
-from .helpers import wait_for_element, highlight_element
+"""Shared utilities for the suite.
+
+Names are imported on first access, so ``from utils.result_sink import ...``
+or ``utils.LinkChecker`` only loads what is used and HTTP-only runs never
+pay for browser, imaging or reporting imports.
+"""
+import importlib
+
+# Exported name -> submodule that defines it
+_EXPORTS = {
+    'ReportGenerator': 'reporting',
+    'ScreenshotManager': 'screenshot_manager',
+    'ScreenshotPipeline': 'screenshot_manager',
+    'DriverPool': 'driver_pool',
+    'DriverLease': 'driver_pool',
+    'create_chrome_driver': 'driver_pool',
+    'LinkChecker': 'link_checker',
+    'TokenBucket': 'link_checker',
+    'LinkStatusCache': 'link_cache',
+    'SiteCrawler': 'crawler',
+    'CrawlFrontier': 'crawler',
+    'normalize_url': 'crawler',
+    'CatalogScraper': 'catalog_scraper',
+    'snapshot_cards': 'dom_snapshot',
+    'find_card_problems': 'dom_snapshot',
+    'collect_page_metrics': 'browser_metrics',
+    'collect_resource_waterfall': 'browser_metrics',
+    'summarize_performance_log': 'browser_metrics',
+    'LoadTimeSampler': 'sampling',
+    'summarize_samples': 'sampling',
+    'percentile': 'sampling',
+    'PerformanceHistory': 'perf_history',
+    'sparkline': 'perf_history',
+    'ResultSink': 'result_sink',
+    'emit_result': 'result_sink',
+    'iter_results': 'result_sink',
+    'TestResult': 'test_result',
+    'TestTimer': 'test_result',
+    'CommandTracer': 'driver_tracer',
+    'ResourceBlocker': 'resource_blocker',
+    'resolve_first_visible': 'locator',
+    'LocatorResolution': 'locator',
+    'SelectorRegistry': 'selector_registry',
+    'FixtureStorefront': 'fixture_server',
+    'FixtureCatalog': 'fixture_server',
+    'RecordReplayProxy': 'record_replay',
+    'ResponseArchive': 'record_replay',
+    'WorkStealingExecutor': 'sharding',
+    'WorkItem': 'sharding',
+    'expand_matrix': 'sharding',
+    'load_data_set': 'sharding',
+    'VerdictCache': 'incremental',
+    'fingerprint': 'incremental',
+    'AsyncHttpSession': 'async_http',
+    'LoadGenerator': 'load_generator',
+    'LatencyHistogram': 'load_generator',
+    'ramp_target': 'load_generator',
+    'PriceSnapshotStore': 'price_snapshots',
+    'parse_price': 'price_snapshots',
+    'wait_for_element': 'helpers',
+    'highlight_element': 'helpers',
+}
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_EXPORTS))
+
 
 __all__ = [
     'ReportGenerator',
     'ScreenshotManager',
+    'ScreenshotPipeline',
+    'DriverPool',
+    'DriverLease',
+    'create_chrome_driver',
+    'LinkChecker',
+    'TokenBucket',
+    'LinkStatusCache',
+    'SiteCrawler',
+    'CrawlFrontier',
+    'normalize_url',
+    'CatalogScraper',
+    'snapshot_cards',
+    'find_card_problems',
+    'collect_page_metrics',
+    'collect_resource_waterfall',
+    'summarize_performance_log',
+    'LoadTimeSampler',
+    'summarize_samples',
+    'percentile',
+    'PerformanceHistory',
+    'sparkline',
+    'ResultSink',
+    'emit_result',
+    'iter_results',
+    'TestResult',
+    'TestTimer',
+    'CommandTracer',
+    'ResourceBlocker',
+    'resolve_first_visible',
+    'LocatorResolution',
+    'SelectorRegistry',
+    'FixtureStorefront',
+    'FixtureCatalog',
+    'RecordReplayProxy',
+    'ResponseArchive',
+    'WorkStealingExecutor',
+    'WorkItem',
+    'expand_matrix',
+    'load_data_set',
+    'VerdictCache',
+    'fingerprint',
+    'AsyncHttpSession',
+    'LoadGenerator',
+    'LatencyHistogram',
+    'ramp_target',
+    'PriceSnapshotStore',
+    'parse_price',
     'wait_for_element', 
     'highlight_element'
 ]
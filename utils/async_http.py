@@ -0,0 +1,148 @@
+import asyncio
+import ssl
+from http.cookies import SimpleCookie
+from urllib.parse import urlencode, urljoin, urlsplit
+from config.config import Config
+
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+
+
+class AsyncResponse:
+    def __init__(self, status, headers, body, url):
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.url = url
+
+    @property
+    def text(self):
+        return self.body.decode("utf-8", "replace")
+
+
+class AsyncHttpSession:
+    """Minimal HTTP/1.1 client on asyncio streams for load-test virtual users.
+
+    Each session keeps one keep-alive connection per origin and its own
+    cookie jar, like a single shopper's browser, at a fraction of the cost of
+    a thread or a browser. Only what the load flows need is supported:
+    GET/POST, form bodies, Content-Length and chunked responses, and
+    redirects.
+    """
+
+    def __init__(self, timeout=None, user_agent=None):
+        self.timeout = timeout or Config.LOAD_REQUEST_TIMEOUT
+        self.user_agent = user_agent or Config.CRAWL_USER_AGENT
+        self.cookies = {}
+        self.connections = {}
+        self.ssl_context = ssl.create_default_context()
+
+    async def request(self, method, url, data=None, headers=None, max_redirects=5):
+        """Send a request, following redirects; returns the final AsyncResponse"""
+        for _ in range(max_redirects + 1):
+            response = await asyncio.wait_for(self._send(method, url, data, headers), self.timeout)
+            location = response.headers.get("location")
+            if response.status not in REDIRECT_STATUSES or not location:
+                return response
+            url = urljoin(url, location)
+            if response.status in (301, 302, 303):
+                method, data = "GET", None
+        return response
+
+    async def get(self, url, headers=None):
+        return await self.request("GET", url, headers=headers)
+
+    async def post(self, url, data, headers=None):
+        return await self.request("POST", url, data=data, headers=headers)
+
+    async def _connection(self, scheme, host, port):
+        key = (scheme, host, port)
+        connection = self.connections.get(key)
+        if connection is None or connection[1].is_closing():
+            ssl_context = self.ssl_context if scheme == "https" else None
+            connection = await asyncio.open_connection(host, port, ssl=ssl_context)
+            self.connections[key] = connection
+            return connection, False
+        return connection, True
+
+    def _drop(self, key):
+        connection = self.connections.pop(key, None)
+        if connection is not None:
+            connection[1].close()
+
+    async def _send(self, method, url, data, headers):
+        parts = urlsplit(url)
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+        key = (parts.scheme, parts.hostname, port)
+        path = parts.path or "/"
+        if parts.query:
+            path += f"?{parts.query}"
+
+        body = b""
+        request_headers = {"Host": parts.netloc, "User-Agent": self.user_agent, "Accept": "*/*",
+                           "Accept-Encoding": "identity", "Connection": "keep-alive"}
+        if data is not None:
+            body = urlencode(data).encode("utf-8") if isinstance(data, dict) else data
+            request_headers["Content-Type"] = "application/x-www-form-urlencoded"
+        if body or method == "POST":
+            request_headers["Content-Length"] = str(len(body))
+        if self.cookies:
+            request_headers["Cookie"] = "; ".join(f"{name}={value}" for name, value in self.cookies.items())
+        request_headers.update(headers or {})
+        head = f"{method} {path} HTTP/1.1\r\n" + "".join(f"{name}: {value}\r\n" for name, value in request_headers.items())
+        payload = head.encode("latin-1") + b"\r\n" + body
+
+        (reader, writer), reused = await self._connection(*key)
+        try:
+            writer.write(payload)
+            await writer.drain()
+            return await self._read_response(reader, key, method, url)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            self._drop(key)
+            if not reused:
+                raise
+            # The server closed an idle keep-alive connection; retry on a fresh one
+            (reader, writer), _ = await self._connection(*key)
+            writer.write(payload)
+            await writer.drain()
+            return await self._read_response(reader, key, method, url)
+
+    async def _read_response(self, reader, key, method, url):
+        status_line = await reader.readuntil(b"\r\n")
+        status = int(status_line.split()[1])
+        headers = {}
+        while True:
+            line = await reader.readuntil(b"\r\n")
+            if line == b"\r\n":
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            name, value = name.strip().lower(), value.strip()
+            if name == "set-cookie":
+                for morsel in SimpleCookie(value).values():
+                    self.cookies[morsel.key] = morsel.value
+            headers[name] = value
+
+        if method == "HEAD" or status in (204, 304) or 100 <= status < 200:
+            body = b""
+        elif headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await reader.readuntil(b"\r\n")).split(b";")[0], 16)
+                if size == 0:
+                    await reader.readuntil(b"\r\n")
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readexactly(2)
+            body = b"".join(chunks)
+        elif "content-length" in headers:
+            body = await reader.readexactly(int(headers["content-length"]))
+        else:
+            body = await reader.read()
+            headers["connection"] = "close"
+
+        if headers.get("connection", "").lower() == "close":
+            self._drop(key)
+        return AsyncResponse(status, headers, body, url)
+
+    async def close(self):
+        for key in list(self.connections):
+            self._drop(key)
@@ -0,0 +1,139 @@
+import json
+import time
+from config.config import Config
+
+# All times are milliseconds relative to navigation start. Event ends are 0
+# until the event has finished, so those report null rather than a negative time
+NAVIGATION_TIMING_SCRIPT = """
+const nav = performance.getEntriesByType("navigation")[0];
+if (!nav) {
+    return null;
+}
+const paints = {};
+for (const entry of performance.getEntriesByType("paint")) {
+    paints[entry.name] = entry.startTime;
+}
+return {
+    dns: nav.domainLookupEnd - nav.domainLookupStart,
+    connect: nav.connectEnd - nav.connectStart,
+    ttfb: nav.responseStart > 0 ? nav.responseStart - nav.startTime : null,
+    dom_content_loaded: nav.domContentLoadedEventEnd > 0 ? nav.domContentLoadedEventEnd - nav.startTime : null,
+    load: nav.loadEventEnd > 0 ? nav.loadEventEnd - nav.startTime : null,
+    first_paint: paints["first-paint"] ?? null,
+    first_contentful_paint: paints["first-contentful-paint"] ?? null,
+    transfer_size: nav.transferSize
+};
+"""
+
+# LCP entries are only exposed through a buffered PerformanceObserver
+LCP_SCRIPT = """
+const done = arguments[arguments.length - 1];
+let lcp = null;
+try {
+    const observer = new PerformanceObserver((list) => {
+        const entries = list.getEntries();
+        lcp = entries[entries.length - 1].startTime;
+    });
+    observer.observe({type: "largest-contentful-paint", buffered: true});
+    setTimeout(() => { observer.disconnect(); done(lcp); }, 100);
+} catch (e) {
+    done(null);
+}
+"""
+
+RESOURCE_TIMING_SCRIPT = """
+return performance.getEntriesByType("resource").map((entry) => ({
+    name: entry.name,
+    type: entry.initiatorType,
+    start: entry.startTime,
+    duration: entry.duration,
+    transfer_size: entry.transferSize
+}));
+"""
+
+
+def collect_page_metrics(driver, load_wait=None):
+    """Read Navigation Timing, paint and LCP metrics for the current page.
+
+    Waits up to ``load_wait`` seconds for the load event to finish; if it
+    never does, ``load`` is None and samplers skip it.
+    """
+    load_wait = Config.PERFORMANCE_LOAD_EVENT_WAIT if load_wait is None else load_wait
+    deadline = time.monotonic() + load_wait
+    while True:
+        metrics = driver.execute_script(NAVIGATION_TIMING_SCRIPT) or {}
+        if metrics.get("load") is not None or time.monotonic() >= deadline:
+            break
+        time.sleep(0.05)
+    try:
+        metrics["largest_contentful_paint"] = driver.execute_async_script(LCP_SCRIPT)
+    except Exception:
+        metrics["largest_contentful_paint"] = None
+    return metrics
+
+
+def collect_resource_waterfall(driver, limit=None):
+    """Return resource timings ordered by start time, optionally truncated"""
+    resources = sorted(driver.execute_script(RESOURCE_TIMING_SCRIPT) or [], key=lambda r: r["start"])
+    return resources[:limit] if limit else resources
+
+
+def iter_performance_log(driver):
+    """Yield parsed DevTools messages from the performance log.
+
+    Each get_log call drains Chrome's buffer, so reading it after every page
+    keeps the log from accumulating in the browser or in memory.
+    """
+    for entry in driver.get_log("performance"):
+        try:
+            yield json.loads(entry["message"])["message"]
+        except (KeyError, ValueError):
+            continue
+
+
+def summarize_performance_log(driver, resource_sizes=None):
+    """Aggregate network activity from the performance log in one pass.
+
+    If ``resource_sizes`` is a dict it is filled with the transfer size of
+    every request that finished, keyed by URL.
+    """
+    summary = {"requests": 0, "responses": 0, "failed_requests": 0, "encoded_bytes": 0}
+    request_urls = {}
+    for message in iter_performance_log(driver):
+        method = message.get("method")
+        params = message.get("params", {})
+        if method == "Network.requestWillBeSent":
+            summary["requests"] += 1
+            if resource_sizes is not None:
+                request_urls[params.get("requestId")] = params.get("request", {}).get("url")
+        elif method == "Network.responseReceived":
+            summary["responses"] += 1
+        elif method == "Network.loadingFailed":
+            summary["failed_requests"] += 1
+        elif method == "Network.loadingFinished":
+            size = int(params.get("encodedDataLength", 0))
+            summary["encoded_bytes"] += size
+            url = request_urls.get(params.get("requestId"))
+            if url:
+                resource_sizes[url] = size
+    return summary
+
+
+def evaluate_thresholds(metrics, thresholds):
+    """Judge each metric against its (acceptable, maximum) limits.
+
+    Returns {metric: "good" | "slow" | "poor"}; metrics the browser did not
+    report are skipped.
+    """
+    verdicts = {}
+    for name, (acceptable, maximum) in thresholds.items():
+        value = metrics.get(name)
+        if value is None:
+            continue
+        if value <= acceptable:
+            verdicts[name] = "good"
+        elif value <= maximum:
+            verdicts[name] = "slow"
+        else:
+            verdicts[name] = "poor"
+    return verdicts
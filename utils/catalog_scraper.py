@@ -0,0 +1,86 @@
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin
+from config.config import Config
+
+# nopCommerce listing and product detail markup
+PRODUCT_ITEM_XPATH = "//div[contains(concat(' ', normalize-space(@class), ' '), ' product-item ')]"
+PRODUCT_LINK_XPATH = ".//*[contains(@class, 'product-title')]//a"
+# Tried in order so a sale's actual price wins over the struck-out old price
+LISTING_PRICE_XPATHS = [".//*[contains(@class, 'actual-price')]", ".//*[contains(@class, 'prices')]//*[contains(@class, 'price')]"]
+NEXT_PAGE_XPATH = "//*[contains(@class, 'pager')]//li[contains(@class, 'next-page')]/a/@href"
+DETAIL_PRICE_XPATHS = ["//*[contains(@class, 'product-price')]//*[contains(@class, 'price-value')]", "//*[contains(@class, 'price-value')]"]
+
+
+def first_text(node, xpaths):
+    """Return the text of the first non-empty match across candidate XPaths"""
+    for xpath in xpaths:
+        for match in node.xpath(xpath):
+            text = match.text_content().strip()
+            if text:
+                return text
+    return None
+
+
+class CatalogScraper:
+    """Fetch and parse category listings and product pages over plain HTTP"""
+
+    def __init__(self, http_client, workers=None, max_pages=None):
+        self.http_client = http_client
+        self.workers = workers or Config.PRICE_FETCH_WORKERS
+        self.max_pages = max_pages or Config.PRICE_MAX_LISTING_PAGES
+        self.pages_fetched = 0
+
+    def parse(self, response):
+        from lxml import html as lxml_html
+        return lxml_html.fromstring(response.content)
+
+    def scrape_listing(self, category_url):
+        """Follow category pagination and return every product on it.
+
+        Each product is a dict with ``name``, ``url`` and ``listing_price``
+        (the raw price text).
+        """
+        products = []
+        seen_urls = set()
+        page_url = category_url
+        while page_url and self.pages_fetched < self.max_pages:
+            response = self.http_client.fetch(page_url)
+            if response is None or response.status_code >= 400:
+                break
+            self.pages_fetched += 1
+            tree = self.parse(response)
+
+            for item in tree.xpath(PRODUCT_ITEM_XPATH):
+                links = item.xpath(PRODUCT_LINK_XPATH)
+                if not links or not links[0].get("href"):
+                    continue
+                url = urljoin(response.url, links[0].get("href"))
+                if url in seen_urls:
+                    continue
+                seen_urls.add(url)
+                products.append({
+                    "sku": item.get("data-productid") or url,
+                    "name": links[0].text_content().strip(),
+                    "url": url,
+                    "listing_price": first_text(item, LISTING_PRICE_XPATHS)
+                })
+
+            next_links = tree.xpath(NEXT_PAGE_XPATH)
+            page_url = urljoin(response.url, next_links[0]) if next_links else None
+        return products
+
+    def scrape_detail_price(self, product_url):
+        """Return the raw detail-page price text, or None if not in the HTML"""
+        response = self.http_client.fetch(product_url)
+        if response is None or response.status_code >= 400:
+            return None
+        return first_text(self.parse(response), DETAIL_PRICE_XPATHS)
+
+    def scrape_detail_prices(self, products):
+        """Fetch every product's detail page concurrently, filling ``detail_price``"""
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            prices = executor.map(self.scrape_detail_price, [p["url"] for p in products])
+            for product, price in zip(products, prices):
+                product["detail_price"] = price
+        self.pages_fetched += len(products)
+        return products
@@ -0,0 +1,142 @@
+import time
+from collections import deque
+from urllib.parse import urljoin, urlparse, urlunparse, urlencode, parse_qsl
+from urllib.robotparser import RobotFileParser
+from config.config import Config
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def normalize_url(url, base=None):
+    """Canonicalise a URL so equivalent links deduplicate in the frontier"""
+    if base:
+        url = urljoin(base, url)
+    parsed = urlparse(url.strip())
+    scheme = parsed.scheme.lower()
+    host = (parsed.hostname or "").lower()
+    if parsed.port and parsed.port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parsed.port}"
+    path = parsed.path or "/"
+    query = urlencode(sorted(parse_qsl(parsed.query, keep_blank_values=True)))
+    # Fragments never reach the server, so drop them
+    return urlunparse((scheme, host, path, "", query, ""))
+
+
+class CrawlFrontier:
+    """Breadth-first queue of (url, depth) that never yields a URL twice"""
+
+    def __init__(self):
+        self.queue = deque()
+        self.seen = set()
+
+    def add(self, url, depth):
+        if url in self.seen:
+            return False
+        self.seen.add(url)
+        self.queue.append((url, depth))
+        return True
+
+    def pop(self):
+        return self.queue.popleft()
+
+    def __len__(self):
+        return len(self.queue)
+
+
+class SiteCrawler:
+    """Walk a site over plain HTTP, extracting links with lxml.
+
+    Only same-origin pages are crawled; every discovered http(s) link,
+    internal or external, is collected for status checking. Pages whose
+    static HTML has no links but does have scripts are assumed to be
+    rendered client-side and are handed to ``render_fallback``.
+    """
+
+    def __init__(self, link_checker, render_fallback=None, max_depth=None, max_pages=None):
+        self.link_checker = link_checker
+        self.render_fallback = render_fallback
+        self.max_depth = Config.CRAWL_MAX_DEPTH if max_depth is None else max_depth
+        self.max_pages = max_pages or Config.CRAWL_MAX_PAGES
+        self.robots = {}
+        self.stats = {}
+
+    def _robots_for(self, url):
+        parsed = urlparse(url)
+        origin = f"{parsed.scheme}://{parsed.netloc}"
+        if origin not in self.robots:
+            parser = RobotFileParser()
+            response = self.link_checker.fetch(f"{origin}/robots.txt")
+            if response is not None and response.status_code == 200:
+                parser.parse(response.text.splitlines())
+            else:
+                parser.allow_all = True
+            self.robots[origin] = parser
+        return self.robots[origin]
+
+    def can_fetch(self, url):
+        return self._robots_for(url).can_fetch(Config.CRAWL_USER_AGENT, url)
+
+    def extract_links(self, html, page_url):
+        """Return (links, has_scripts) for a page's HTML"""
+        from lxml import html as lxml_html
+
+        try:
+            tree = lxml_html.fromstring(html)
+        except Exception:
+            return [], False
+        base = tree.xpath("string(//base/@href)") or page_url
+        links = []
+        for href in tree.xpath("//a/@href"):
+            if href.startswith(("javascript:", "mailto:", "tel:", "#")):
+                continue
+            try:
+                links.append(normalize_url(href, base))
+            except ValueError:
+                continue  # Malformed host or port
+        return links, bool(tree.xpath("//script"))
+
+    def crawl(self, start_url):
+        """Crawl from start_url and return the set of every discovered link"""
+        start_time = time.monotonic()
+        start_url = normalize_url(start_url)
+        origin = urlparse(start_url).netloc
+        frontier = CrawlFrontier()
+        frontier.add(start_url, 0)
+        discovered = set()
+        pages_fetched = 0
+        rendered_pages = 0
+        blocked_by_robots = 0
+
+        while frontier and pages_fetched < self.max_pages:
+            url, depth = frontier.pop()
+            if not self.can_fetch(url):
+                blocked_by_robots += 1
+                continue
+
+            response = self.link_checker.fetch(url)
+            if response is None or response.status_code >= 400:
+                continue
+            if "html" not in response.headers.get("Content-Type", ""):
+                continue
+            pages_fetched += 1
+
+            links, has_scripts = self.extract_links(response.content, response.url)
+            if not links and has_scripts and self.render_fallback:
+                rendered_pages += 1
+                links, _ = self.extract_links(self.render_fallback(url), url)
+
+            for link in links:
+                if urlparse(link).scheme not in ("http", "https"):
+                    continue
+                discovered.add(link)
+                if depth < self.max_depth and urlparse(link).netloc == origin:
+                    frontier.add(link, depth + 1)
+
+        self.stats = {
+            "pages_fetched": pages_fetched,
+            "pages_rendered": rendered_pages,
+            "blocked_by_robots": blocked_by_robots,
+            "links_discovered": len(discovered),
+            "elapsed": time.monotonic() - start_time
+        }
+        return discovered
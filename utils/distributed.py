@@ -0,0 +1,381 @@
+import json
+import multiprocessing
+import os
+import socket
+import threading
+import time
+import urllib.error
+import urllib.request
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from config.config import Config
+from utils.result_sink import ResultSink, emit_result
+from utils.scheduler import ModuleSpec, crash_result
+
+
+def forwarded_settings():
+    """Config values workers must share with the coordinator, as JSON-safe data.
+
+    Data sets given as file paths are read here, since the file may not
+    exist on a remote worker.
+    """
+    from utils.sharding import load_data_set
+
+    settings = {name: getattr(Config, name) for name in Config.DISTRIBUTED_FORWARDED_SETTINGS}
+    for name in ("DATA_DRIVEN_QUERIES", "DATA_DRIVEN_CATEGORIES"):
+        if isinstance(settings.get(name), str):
+            settings[name] = load_data_set(settings[name])
+    return settings
+
+
+class Task:
+    """One unit of distributed work: a module, or one shard of a shardable module"""
+
+    def __init__(self, task_id, spec):
+        self.id = task_id
+        self.spec = spec
+        self.state = "pending"
+        self.worker = None
+        self.attempt = 0
+        self.heartbeat = None
+        self.buffer = []
+        self.result_count = 0
+
+
+class CoordinatorHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True  # See StorefrontHandler
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        payload = json.loads(self.rfile.read(length) or b"{}")
+        action = getattr(self.server.coordinator, f"on_{self.path.strip('/')}", None)
+        if action is None:
+            self.reply(404, {"error": f"Unknown endpoint {self.path}"})
+            return
+        self.reply(200, action(payload))
+
+    def reply(self, status, payload):
+        body = json.dumps(payload, default=str).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class Coordinator:
+    """Hand module work to worker processes on any host and collect their results.
+
+    Workers pull tasks over HTTP, stream each test result back as it is
+    logged and send heartbeats while they run. Results of an attempt are
+    only committed to the local result stream when the worker reports the
+    task complete. A task whose worker goes silent for longer than the lease
+    timeout is handed to another worker, so a dead node never produces
+    partial or duplicate results. Exclusive modules (Performance) are only
+    handed out once everything else has finished, and then run alone.
+    """
+
+    def __init__(self, host=None, port=None, local_workers=None, lease_timeout=None, max_attempts=None):
+        self.host = host or Config.COORDINATOR_HOST
+        self.port = Config.COORDINATOR_PORT if port is None else port
+        self.local_workers = Config.DISTRIBUTED_LOCAL_WORKERS if local_workers is None else local_workers
+        self.lease_timeout = lease_timeout or Config.DISTRIBUTED_LEASE_TIMEOUT
+        self.settings = forwarded_settings()
+        self.max_attempts = max_attempts or Config.DISTRIBUTED_MAX_ATTEMPTS
+        self.condition = threading.Condition()
+        self.tasks = []
+        self.workers = {}
+        self.reassigned = 0
+        self.last_contact = time.monotonic()
+        self.finished = False
+        self.server = None
+
+    @property
+    def url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def split(self, specs):
+        """Turn specs into tasks, sharding modules that support it"""
+        tasks = []
+        for spec in specs:
+            if spec.shardable and Config.DISTRIBUTED_DATA_SHARDS > 1:
+                for index in range(Config.DISTRIBUTED_DATA_SHARDS):
+                    shard = ModuleSpec(**dict(vars(spec), kwargs=dict(spec.kwargs, shard_index=index,
+                                                                      shard_count=Config.DISTRIBUTED_DATA_SHARDS)))
+                    tasks.append(Task(f"{spec.name} #{index + 1}", shard))
+            else:
+                tasks.append(Task(spec.name, spec))
+        return tasks
+
+    def run(self, specs):
+        """Distribute the specs; returns {module name: result count} in spec order.
+
+        Results themselves go to the installed result sink as each task completes.
+        """
+        self.tasks = self.split(specs)
+        self.server = ThreadingHTTPServer((self.host, self.port), CoordinatorHandler)
+        self.server.daemon_threads = True
+        self.server.coordinator = self
+        threading.Thread(target=self.server.serve_forever, name="coordinator", daemon=True).start()
+        print(f"🛰️  Coordinator listening on {self.url} with {len(self.tasks)} tasks")
+
+        # Spawned (not forked) so workers don't inherit the server's threads
+        context = multiprocessing.get_context("spawn")
+        processes = [context.Process(target=run_worker, args=(self.url, f"local-{i + 1}"), daemon=True)
+                     for i in range(self.local_workers)]
+        for process in processes:
+            process.start()
+
+        try:
+            with self.condition:
+                while not all(task.state == "done" for task in self.tasks):
+                    self.condition.wait(timeout=1.0)
+                    self.reap_expired()
+                self.finished = True
+        finally:
+            for process in processes:
+                process.join(timeout=Config.DISTRIBUTED_LEASE_TIMEOUT)
+                if process.is_alive():
+                    process.terminate()
+            self.server.shutdown()
+            self.server.server_close()
+
+        counts = {}
+        for task in self.tasks:
+            counts[task.spec.name] = counts.get(task.spec.name, 0) + task.result_count
+        return counts
+
+    def reap_expired(self):
+        """Requeue tasks whose worker stopped sending heartbeats (lock held)"""
+        now = time.monotonic()
+        for task in self.tasks:
+            if task.state != "running" or now - task.heartbeat <= self.lease_timeout:
+                continue
+            print(f"⚠️  Worker {task.worker} lost while running {task.id}")
+            self.workers[task.worker]["lost"] = True
+            if task.attempt < self.max_attempts:
+                task.state, task.worker, task.buffer = "pending", None, []
+                self.reassigned += 1
+            else:
+                self.fail(task, f"Worker lost after {task.attempt} attempts")
+
+        outstanding = [task for task in self.tasks if task.state != "done"]
+        if outstanding and now - self.last_contact > Config.DISTRIBUTED_IDLE_TIMEOUT:
+            for task in outstanding:
+                self.fail(task, "No distributed worker available")
+
+    def fail(self, task, message):
+        task.state = "done"
+        crash_result(task.spec, message)
+        task.result_count = 1
+
+    def touch(self, worker_id):
+        """Record that a worker is alive (lock held)"""
+        self.last_contact = time.monotonic()
+        worker = self.workers.setdefault(worker_id, {"tasks": 0, "lost": False, "host": None})
+        worker["last_seen"] = self.last_contact
+        return worker
+
+    def find(self, payload):
+        """Return the task if the payload belongs to its current attempt (lock held)"""
+        for task in self.tasks:
+            if (task.id == payload.get("task") and task.state == "running"
+                    and task.worker == payload.get("worker") and task.attempt == payload.get("attempt")):
+                return task
+        return None
+
+    def on_claim(self, payload):
+        with self.condition:
+            worker = self.touch(payload["worker"])
+            worker["host"] = payload.get("host")
+            if self.finished:
+                return {"done": True}
+            running = [task for task in self.tasks if task.state == "running"]
+            pending = [task for task in self.tasks if task.state == "pending"]
+            if any(task.spec.exclusive for task in running):
+                return {"wait": True}
+            task = next((task for task in pending if not task.spec.exclusive), None)
+            if task is None and pending and not running:
+                task = pending[0]
+            if task is None:
+                return {"wait": True}
+            task.state, task.worker = "running", payload["worker"]
+            task.attempt += 1
+            task.heartbeat = time.monotonic()
+            worker["tasks"] += 1
+            return {"task": task.id, "attempt": task.attempt, "spec": vars(task.spec), "base_url": Config.BASE_URL,
+                    "settings": self.settings}
+
+    def on_heartbeat(self, payload):
+        with self.condition:
+            self.touch(payload["worker"])
+            task = self.find(payload)
+            if task is not None:
+                task.heartbeat = time.monotonic()
+            return {"ok": task is not None}
+
+    def on_result(self, payload):
+        with self.condition:
+            self.touch(payload["worker"])
+            task = self.find(payload)
+            if task is None:
+                return {"ok": False}
+            task.heartbeat = time.monotonic()
+            # Results are numbered, so a retried POST is not buffered twice and a lost one is noticed
+            sequence = payload.get("seq", len(task.buffer))
+            if sequence == len(task.buffer):
+                task.buffer.append(payload["result"])
+            return {"ok": sequence <= len(task.buffer)}
+
+    def on_complete(self, payload):
+        with self.condition:
+            self.touch(payload["worker"])
+            task = self.find(payload)
+            if task is None:
+                # A reassigned attempt finishing late; its results are dropped
+                return {"ok": False}
+            for result in task.buffer:
+                emit_result(result)
+            task.result_count, task.buffer = len(task.buffer), []
+            task.state = "done"
+            self.condition.notify_all()
+            return {"ok": True}
+
+    def get_stats(self):
+        with self.condition:
+            return {
+                "tasks": len(self.tasks),
+                "reassigned": self.reassigned,
+                "workers": {worker_id: {"host": info["host"], "tasks": info["tasks"], "lost": info["lost"]}
+                            for worker_id, info in self.workers.items()},
+                "task_owners": {task.id: task.worker for task in self.tasks}
+            }
+
+
+class RemoteResultSink:
+    """Result sink that streams every result of a task back to the coordinator.
+
+    A result that can't be delivered abandons the attempt instead of
+    raising into the module (where it would read as a test failure): the
+    worker stops reporting, its lease runs out and the coordinator hands
+    the task to someone else.
+    """
+
+    def __init__(self, worker, task):
+        self.worker = worker
+        self.task = task
+        self.lock = threading.Lock()
+        self.total = 0
+        self.abandoned = False
+
+    def emit(self, result):
+        with self.lock:
+            if self.abandoned:
+                return
+            reply = self.worker.deliver("result", dict(self.task, seq=self.total, result=result))
+            if reply is None or not reply.get("ok"):
+                print(f"⚠️  Abandoning {self.task['task']}: the coordinator did not accept a result")
+                self.abandoned = True
+                return
+            self.total += 1
+
+    def close(self):
+        pass
+
+
+class DistributedWorker:
+    """Pull tasks from a coordinator and run them with local or remote browsers"""
+
+    def __init__(self, coordinator_url, worker_id=None, remote_url=None):
+        self.coordinator_url = coordinator_url.rstrip("/")
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+        self.remote_url = remote_url or Config.REMOTE_WEBDRIVER_URL
+
+    def call(self, endpoint, payload):
+        body = json.dumps(dict(payload, worker=self.worker_id), default=str).encode("utf-8")
+        request = urllib.request.Request(f"{self.coordinator_url}/{endpoint}", data=body,
+                                         headers={"Content-Type": "application/json"}, method="POST")
+        with urllib.request.urlopen(request, timeout=Config.DISTRIBUTED_LEASE_TIMEOUT) as response:
+            return json.loads(response.read())
+
+    def deliver(self, endpoint, payload):
+        """``call`` with a few retries; None if the coordinator stayed unreachable"""
+        delay = Config.DISTRIBUTED_HEARTBEAT / 10
+        for attempt in range(Config.DISTRIBUTED_RESULT_RETRIES):
+            try:
+                return self.call(endpoint, payload)
+            except OSError:
+                if attempt + 1 < Config.DISTRIBUTED_RESULT_RETRIES:
+                    time.sleep(delay)
+                    delay *= 2
+        return None
+
+    def claim(self):
+        """Ask for work, tolerating a coordinator that is briefly unreachable"""
+        for _ in range(Config.DISTRIBUTED_CONNECT_RETRIES):
+            try:
+                return self.call("claim", {"host": socket.gethostname()})
+            except OSError:
+                time.sleep(Config.DISTRIBUTED_HEARTBEAT)
+        return {"done": True}
+
+    def run(self):
+        from functools import partial
+        from utils.driver_pool import DriverPool, create_remote_driver
+        from utils.screenshot_manager import ScreenshotPipeline
+
+        driver_factory = partial(create_remote_driver, self.remote_url) if self.remote_url else None
+        driver_pool = DriverPool(max_size=1, driver_factory=driver_factory)
+        print(f"🛰️  Worker {self.worker_id} connected to {self.coordinator_url}")
+        try:
+            while True:
+                reply = self.claim()
+                if reply.get("done"):
+                    return
+                if reply.get("wait"):
+                    time.sleep(Config.DISTRIBUTED_HEARTBEAT / 5)
+                    continue
+                self.run_task(reply, driver_pool)
+        finally:
+            driver_pool.shutdown()
+            ScreenshotPipeline.shared().close()
+
+    def run_task(self, reply, driver_pool):
+        from utils.scheduler import run_module
+
+        if reply["base_url"] != Config.BASE_URL:
+            # Follow the coordinator's target (fixture storefront, replay proxy)
+            Config.set_base_url(reply["base_url"])
+        for name, value in reply.get("settings", {}).items():
+            # Module selection travels in the spec; tests, data sets and flags travel here
+            setattr(Config, name, value)
+        task = {"task": reply["task"], "attempt": reply["attempt"]}
+        sink = ResultSink.use(RemoteResultSink(self, task))
+        stopped = threading.Event()
+
+        def heartbeat():
+            while not stopped.wait(Config.DISTRIBUTED_HEARTBEAT) and not sink.abandoned:
+                try:
+                    self.call("heartbeat", task)
+                except OSError:
+                    pass
+
+        threading.Thread(target=heartbeat, name="heartbeat", daemon=True).start()
+        try:
+            run_module(ModuleSpec(**reply["spec"]), driver_pool)
+        finally:
+            stopped.set()
+            ResultSink.use(None)
+            if not sink.abandoned:
+                # If this fails too the lease expires and the task is reassigned
+                self.deliver("complete", task)
+
+
+def run_worker(coordinator_url, worker_id=None, remote_url=None):
+    """Process entry point for a worker"""
+    DistributedWorker(coordinator_url, worker_id, remote_url).run()
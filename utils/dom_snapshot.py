@@ -0,0 +1,57 @@
+# Batched DOM extraction: one execute_script call per page instead of
+# several WebDriver round trips per element
+
+CARD_SNAPSHOT_SCRIPT = """
+const [cardSelector, parts] = arguments;
+function describe(el) {
+    if (!el) {
+        return {present: false, visible: false, text: "", rect: null};
+    }
+    const rect = el.getBoundingClientRect();
+    const style = window.getComputedStyle(el);
+    const visible = rect.width > 0 && rect.height > 0 &&
+        style.visibility !== "hidden" && style.display !== "none" && style.opacity !== "0";
+    return {
+        present: true,
+        visible: visible,
+        text: (el.innerText || el.textContent || "").trim(),
+        rect: {x: rect.x, y: rect.y, width: rect.width, height: rect.height}
+    };
+}
+return Array.from(document.querySelectorAll(cardSelector), (card, index) => {
+    const snapshot = {index: index, card: describe(card), parts: {}};
+    for (const [name, selector] of Object.entries(parts)) {
+        snapshot.parts[name] = describe(card.querySelector(selector));
+    }
+    return snapshot;
+});
+"""
+
+# Required parts of a product card, as CSS selectors relative to the card
+PRODUCT_CARD_PARTS = {
+    "image": "img",
+    "title": ".product-title",
+    "price": ".price"
+}
+
+
+def snapshot_cards(driver, card_selector=".product-item", parts=None):
+    """Return presence, visibility, text and bounding box for every card.
+
+    The result is plain data (lists and dicts), so consistency rules can run
+    in Python without touching the browser again.
+    """
+    return driver.execute_script(CARD_SNAPSHOT_SCRIPT, card_selector, parts or PRODUCT_CARD_PARTS)
+
+
+def find_card_problems(snapshot):
+    """Return the list of missing or empty required parts for one card"""
+    problems = []
+    image = snapshot["parts"].get("image")
+    if not image or not image["present"] or not image["visible"]:
+        problems.append("image")
+    for name in ("title", "price"):
+        part = snapshot["parts"].get(name)
+        if not part or not part["present"] or not part["text"]:
+            problems.append(name)
+    return problems
@@ -0,0 +1,244 @@
+import threading
+import time
+from config.config import Config
+from utils.driver_tracer import CommandTracer
+from utils.resource_blocker import ResourceBlocker
+
+
+def chrome_options():
+    """Chrome options shared by local and remote sessions"""
+    from selenium.webdriver.chrome.options import Options
+
+    options = Options()
+    if Config.HEADLESS:
+        options.add_argument("--headless")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--window-size=1920,1080")
+    # Performance logging is enabled on every session so any pooled driver
+    # can serve PerformanceSnapshot
+    options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+    return options
+
+
+def configure_driver(driver):
+    # Modules wait explicitly (WebDriverWait, resolve_first_visible), so a
+    # missing element never stalls for the whole implicit wait
+    driver.implicitly_wait(Config.DRIVER_IMPLICIT_WAIT)
+    driver.set_page_load_timeout(Config.PAGE_LOAD_TIMEOUT)
+    return driver
+
+
+def create_chrome_driver():
+    """Launch a new Chrome WebDriver using the suite's browser settings"""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+
+    options = chrome_options()
+    if Config.CHROME_DRIVER_PATH:
+        driver = webdriver.Chrome(service=Service(Config.CHROME_DRIVER_PATH), options=options)
+    else:
+        driver = webdriver.Chrome(options=options)
+    return configure_driver(driver)
+
+
+def create_remote_driver(command_executor=None):
+    """Open a Chrome session on a Selenium Grid or remote chromedriver"""
+    from selenium import webdriver
+
+    driver = webdriver.Remote(command_executor=command_executor or Config.REMOTE_WEBDRIVER_URL,
+                              options=chrome_options())
+    return configure_driver(driver)
+
+
+class DriverLease:
+    """A WebDriver session checked out of the pool by one module"""
+
+    def __init__(self, driver, owner, wait_time, launch_time):
+        self.driver = driver
+        self.owner = owner
+        self.wait_time = wait_time
+        self.launch_time = launch_time
+        self.acquired_at = time.monotonic()
+        self.held_time = None
+        self.released = False
+
+    def to_dict(self):
+        return {
+            "owner": self.owner,
+            "wait_time": round(self.wait_time, 3),
+            "launch_time": round(self.launch_time, 3),
+            "held_time": round(self.held_time, 3) if self.held_time is not None else None
+        }
+
+
+class DriverPool:
+    """Bounded pool of reusable WebDriver sessions shared by the test modules"""
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, max_size=None, driver_factory=None, tracer=None, resource_blocker=None):
+        self.max_size = max_size or Config.DRIVER_POOL_MAX_SIZE
+        self.driver_factory = driver_factory or create_chrome_driver
+        if tracer is None and Config.TRACE_WEBDRIVER:
+            tracer = CommandTracer.shared()
+        self.tracer = tracer
+        if resource_blocker is None and Config.FAST_MODE:
+            resource_blocker = ResourceBlocker.shared()
+        self.resource_blocker = resource_blocker
+        self.idle_drivers = []
+        self.created_count = 0
+        self.recycled_count = 0
+        self.leases = []
+        self.condition = threading.Condition()
+
+    @classmethod
+    def shared(cls):
+        """Return the process-wide pool, creating it on first use"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def acquire(self, owner):
+        """Lease a healthy driver, blocking while the pool is at capacity"""
+        wait_start = time.monotonic()
+        driver = None
+        with self.condition:
+            while True:
+                while self.idle_drivers:
+                    candidate = self.idle_drivers.pop()
+                    if self.is_healthy(candidate):
+                        driver = candidate
+                        break
+                    self._discard(candidate)
+                if driver is not None or self.created_count < self.max_size:
+                    break
+                self.condition.wait()
+            if driver is None:
+                # Reserve the slot before launching outside the lock
+                self.created_count += 1
+        wait_time = time.monotonic() - wait_start
+
+        launch_time = 0.0
+        if driver is None:
+            launch_start = time.monotonic()
+            try:
+                driver = self.driver_factory()
+            except Exception:
+                with self.condition:
+                    self.created_count -= 1
+                    self.condition.notify()
+                raise
+            launch_time = time.monotonic() - launch_start
+            if self.tracer is not None:
+                self.tracer.attach(driver)
+
+        if self.resource_blocker is not None:
+            # Switch to the owner's block list (or back to loading everything)
+            self.resource_blocker.apply(driver, owner)
+
+        lease = DriverLease(driver, owner, wait_time, launch_time)
+        with self.condition:
+            self.leases.append(lease)
+        return lease
+
+    def release(self, lease):
+        """Return a leased driver to the pool after resetting its state"""
+        if lease.released:
+            return
+        lease.released = True
+        lease.held_time = time.monotonic() - lease.acquired_at
+        driver = lease.driver
+        reusable = self.reset_driver(driver)
+        with self.condition:
+            if reusable:
+                self.idle_drivers.append(driver)
+            else:
+                self._discard(driver)
+            self.condition.notify()
+
+    def record_page_savings(self, driver, url):
+        """Record requests fast mode blocked on the page just loaded"""
+        if self.resource_blocker is None:
+            return None
+        return self.resource_blocker.record_page(driver, url)
+
+    def is_healthy(self, driver):
+        """Check the session still responds to WebDriver commands"""
+        try:
+            driver.window_handles
+            return True
+        except Exception:
+            return False
+
+    def reset_driver(self, driver):
+        """Clear cookies, storage and extra tabs so the next lease starts clean"""
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+            driver.delete_all_cookies()
+            try:
+                driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+            except Exception:
+                pass  # about:blank and data: pages have no storage
+            driver.get("about:blank")
+            return True
+        except Exception:
+            return False
+
+    def _discard(self, driver):
+        """Quit a crashed or unusable driver and free its slot (lock held)"""
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        self.created_count -= 1
+        self.recycled_count += 1
+
+    def lease(self, owner):
+        """Context manager wrapper around acquire/release"""
+        return _LeaseContext(self, owner)
+
+    def get_stats(self):
+        """Summarise pool usage for the console and reports"""
+        with self.condition:
+            leases = [lease.to_dict() for lease in self.leases]
+            return {
+                "max_size": self.max_size,
+                "sessions_launched": sum(1 for l in self.leases if l.launch_time > 0),
+                "sessions_recycled": self.recycled_count,
+                "total_wait_time": round(sum(l["wait_time"] for l in leases), 3),
+                "total_launch_time": round(sum(l["launch_time"] for l in leases), 3),
+                "leases": leases
+            }
+
+    def shutdown(self):
+        """Quit every idle driver held by the pool"""
+        with self.condition:
+            while self.idle_drivers:
+                driver = self.idle_drivers.pop()
+                try:
+                    driver.quit()
+                except Exception:
+                    pass
+                self.created_count -= 1
+
+
+class _LeaseContext:
+    def __init__(self, pool, owner):
+        self.pool = pool
+        self.owner = owner
+        self.lease = None
+
+    def __enter__(self):
+        self.lease = self.pool.acquire(self.owner)
+        return self.lease
+
+    def __exit__(self, exc_type, exc, tb):
+        self.pool.release(self.lease)
+        return False
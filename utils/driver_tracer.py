@@ -0,0 +1,125 @@
+import os
+import sys
+import threading
+import time
+from config.config import Config
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODULES_DIR = os.path.join(PROJECT_ROOT, "modules")
+
+
+class CommandTracer:
+    """Time every WebDriver command a driver sends.
+
+    ``attach`` replaces the driver's ``execute`` method on the instance, so
+    driver calls and WebElement calls (which route through the parent
+    driver) are both traced without modules changing how they use the
+    driver. Each command is aggregated by command name, locator and calling
+    test, and by the project call stack for flamegraph output.
+    """
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.commands = {}
+        self.stacks = {}
+        self.round_trips = 0
+        self.total_time = 0.0
+
+    @classmethod
+    def shared(cls):
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def attach(self, driver):
+        """Wrap a driver's execute method; attaching twice is a no-op"""
+        if getattr(driver, "_command_tracer", None) is not None:
+            return driver
+        original_execute = driver.execute
+        tracer = self
+
+        def traced_execute(driver_command, params=None):
+            start = time.perf_counter()
+            try:
+                return original_execute(driver_command, params)
+            finally:
+                tracer.record(driver_command, params, time.perf_counter() - start)
+
+        driver.execute = traced_execute
+        driver._command_tracer = self
+        return driver
+
+    def project_stack(self):
+        """Return (project frames outermost first, innermost test-module frame)"""
+        frames = []
+        caller = ""
+        frame = sys._getframe(2)
+        while frame is not None:
+            filename = frame.f_code.co_filename
+            if filename.startswith(PROJECT_ROOT + os.sep) and filename != __file__:
+                label = f"{os.path.splitext(os.path.basename(filename))[0]}.{frame.f_code.co_name}"
+                frames.append(label)
+                if not caller and filename.startswith(MODULES_DIR):
+                    caller = label
+            frame = frame.f_back
+        frames.reverse()
+        return frames, caller
+
+    def record(self, command, params, elapsed):
+        locator = ""
+        if params and "using" in params:
+            locator = f"{params['using']}={params.get('value')}"
+        stack, caller = self.project_stack()
+        key = (command, locator, caller)
+        folded = ";".join(stack + [command])
+
+        with self.lock:
+            self.round_trips += 1
+            self.total_time += elapsed
+            stats = self.commands.get(key)
+            if stats is None:
+                stats = self.commands[key] = {"count": 0, "total": 0.0, "max": 0.0}
+            stats["count"] += 1
+            stats["total"] += elapsed
+            stats["max"] = max(stats["max"], elapsed)
+            self.stacks[folded] = self.stacks.get(folded, 0.0) + elapsed
+
+    def top_commands(self, limit=None):
+        """Return the most expensive (command, locator, caller) entries"""
+        with self.lock:
+            ranked = sorted(self.commands.items(), key=lambda item: item[1]["total"], reverse=True)
+        limit = limit or Config.TRACE_TOP_N
+        return [{"command": command, "locator": locator, "caller": caller,
+                 "count": stats["count"], "total": round(stats["total"], 4),
+                 "mean": round(stats["total"] / stats["count"], 4), "max": round(stats["max"], 4)}
+                for (command, locator, caller), stats in ranked[:limit]]
+
+    def get_summary(self):
+        return {"round_trips": self.round_trips, "total_time": round(self.total_time, 3),
+                "top_commands": self.top_commands()}
+
+    def write_profile(self, directory=None):
+        """Write a top-N text table and a collapsed-stack file for flamegraphs"""
+        directory = directory or Config.REPORT_DIR
+        table_path = os.path.join(directory, "webdriver_profile.txt")
+        folded_path = os.path.join(directory, "webdriver_profile.folded")
+
+        with open(table_path, 'w', encoding='utf-8') as f:
+            f.write(f"WebDriver round trips: {self.round_trips} ({self.total_time:.2f}s total)\n\n")
+            f.write(f"{'total':>9} {'count':>6} {'mean':>8} {'max':>8}  command / locator / caller\n")
+            for row in self.top_commands():
+                f.write(f"{row['total']:>8.3f}s {row['count']:>6} {row['mean']:>7.3f}s {row['max']:>7.3f}s  "
+                        f"{row['command']} {row['locator']} [{row['caller']}]\n")
+
+        with self.lock:
+            stacks = sorted(self.stacks.items())
+        with open(folded_path, 'w', encoding='utf-8') as f:
+            for stack, elapsed in stacks:
+                # flamegraph.pl expects integer sample counts; use microseconds
+                f.write(f"{stack} {max(1, int(elapsed * 1_000_000))}\n")
+
+        return table_path, folded_path
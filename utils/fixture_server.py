@@ -0,0 +1,306 @@
+import hashlib
+import html
+import json
+import random
+import secrets
+import struct
+import threading
+import time
+import zlib
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+from config.config import Config
+
+CATEGORIES = {
+    "electronics": ["Laptop", "Phone", "Camera", "Headphones", "Monitor", "Tablet"],
+    "books": ["Novel", "Cookbook", "Atlas", "Biography"],
+    "jewelry": ["Ring", "Necklace", "Bracelet", "Earrings"],
+    "gift-cards": ["Gift Card"]
+}
+ADJECTIVES = ["Classic", "Premium", "Compact", "Deluxe", "Essential", "Vintage", "Pro", "Ultra"]
+ANTIFORGERY_COOKIE = ".Nop.Antiforgery"
+
+
+def form_token(cookie_value):
+    """Form token paired with an antiforgery cookie, so clients must read it from the form"""
+    return hashlib.sha256(f"form:{cookie_value}".encode()).hexdigest()[:32]
+
+
+def solid_png(width=8, height=8, color=(200, 200, 200)):
+    """Build a tiny single-colour PNG without any imaging library"""
+    def chunk(kind, data):
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+    rows = b"".join(b"\x00" + bytes(color) * width for _ in range(height))
+    return (b"\x89PNG\r\n\x1a\n"
+            + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+            + chunk(b"IDAT", zlib.compress(rows))
+            + chunk(b"IEND", b""))
+
+
+class FixtureCatalog:
+    """Deterministic product catalog spread across the storefront categories"""
+
+    def __init__(self, size=None, seed=0):
+        size = size or Config.FIXTURE_CATALOG_SIZE
+        rng = random.Random(seed)
+        self.products = []
+        self.by_slug = {}
+        self.by_category = {category: [] for category in CATEGORIES}
+        # The functional add-to-cart test opens this product directly
+        self.add(1, "electronics", "Apple MacBook Pro 13-inch", "apple-macbook-pro-13-inch", "1800.00")
+        categories = list(CATEGORIES)
+        for product_id in range(2, size + 1):
+            category = categories[product_id % len(categories)]
+            nouns = CATEGORIES[category]
+            # Cycle nouns so even small catalogs contain every kind (e.g. "Laptop" for search)
+            name = f"{rng.choice(ADJECTIVES)} {nouns[product_id // len(categories) % len(nouns)]} {product_id}"
+            slug = name.lower().replace(" ", "-")
+            self.add(product_id, category, name, slug, f"{rng.randint(5, 2500)}.{rng.choice(['00', '49', '99'])}")
+
+    def add(self, product_id, category, name, slug, price):
+        product = {"id": product_id, "category": category, "name": name, "slug": slug, "price": price}
+        self.products.append(product)
+        self.by_slug[slug] = product
+        self.by_category[category].append(product)
+
+    def search(self, query):
+        query = query.lower().strip()
+        return [product for product in self.products if query and query in product["name"].lower()]
+
+
+class StorefrontHandler(BaseHTTPRequestHandler):
+    """Serves nopCommerce-shaped pages using the selectors the modules rely on"""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out as separate writes; with Nagle on, keep-alive
+    # clients wait ~40ms for the delayed ACK on every response
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass  # Keep benchmark output readable
+
+    @property
+    def storefront(self):
+        return self.server.storefront
+
+    def do_HEAD(self):
+        self.respond(head_only=True)
+
+    def do_GET(self):
+        self.respond()
+
+    def do_POST(self):
+        self.set_cookies = {}
+        length = int(self.headers.get("Content-Length") or 0)
+        form = parse_qs(self.rfile.read(length).decode("utf-8"))
+        path = urlparse(self.path).path
+        time.sleep(self.storefront.latency)
+        if path.startswith("/addproducttocart/") or path == "/login":
+            # Forms are only accepted with the token issued alongside the cookie
+            cookie = self.antiforgery_cookie()
+            if cookie is None or form.get("__RequestVerificationToken", [""])[0] != form_token(cookie):
+                self.send(400, self.page("Bad request", "<h1>Invalid anti-forgery token</h1>"))
+                return
+        if path.startswith("/addproducttocart/"):
+            body = json.dumps({"success": True,
+                               "message": "The product has been added to your shopping cart"}).encode()
+            self.send(200, body, "application/json")
+        elif path == "/login":
+            self.set_cookies[".Nop.Authentication"] = secrets.token_hex(16)
+            self.send(302, b"", headers={"Location": "/"})
+        else:
+            self.send(404, self.page("Page not found", "<h1>Page not found</h1>"))
+
+    def antiforgery_cookie(self):
+        morsel = SimpleCookie(self.headers.get("Cookie") or "").get(ANTIFORGERY_COOKIE)
+        return morsel.value if morsel else None
+
+    def antiforgery_input(self):
+        """Hidden token input for a form, issuing the antiforgery cookie on first visit"""
+        cookie = self.antiforgery_cookie()
+        if cookie is None:
+            cookie = self.set_cookies[ANTIFORGERY_COOKIE] = secrets.token_hex(16)
+        return f'<input name="__RequestVerificationToken" type="hidden" value="{form_token(cookie)}">'
+
+    def respond(self, head_only=False):
+        self.set_cookies = {}
+        parsed = urlparse(self.path)
+        query = parse_qs(parsed.query)
+        path = parsed.path.rstrip("/") or "/"
+        status, delay = self.storefront.links.get(path, (200, 0.0))
+        time.sleep(self.storefront.latency + delay)
+
+        if path.startswith("/images/"):
+            self.send(200, self.storefront.image, "image/png", head_only=head_only)
+            return
+        if path == "/robots.txt":
+            self.send(200, b"User-agent: *\nAllow: /\n", "text/plain", head_only=head_only)
+            return
+        if status >= 400:
+            self.send(status, self.page(f"Error {status}", f"<h1>Error {status}</h1>"), head_only=head_only)
+            return
+
+        catalog = self.storefront.catalog
+        if path == "/":
+            body = self.render_home()
+        elif path == "/login":
+            body = self.render_login()
+        elif path == "/search":
+            term = query.get("q", [""])[0]
+            body = self.page(f"Search: {term}", "<h1>Search</h1>" + self.render_grid(catalog.search(term)))
+        elif path == "/customer/info":
+            body = self.page("My account", "<h1>My account</h1>")
+        elif path.lstrip("/") in catalog.by_category:
+            page_number = int(query.get("pagenumber", ["1"])[0] or 1)
+            body = self.render_listing(path.lstrip("/"), page_number)
+        elif path.lstrip("/") in catalog.by_slug:
+            body = self.render_product(catalog.by_slug[path.lstrip("/")])
+        elif status == 200 and path in self.storefront.links:
+            body = self.page(path, f"<h1>{html.escape(path)}</h1>")
+        else:
+            self.send(404, self.page("Page not found", "<h1>Page not found</h1>"), head_only=head_only)
+            return
+
+        etag = '"' + hashlib.md5(body).hexdigest() + '"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send(304, b"", headers={"ETag": etag}, head_only=True)
+            return
+        self.send(200, body, headers={"ETag": etag}, head_only=head_only)
+
+    def send(self, status, body, content_type="text/html; charset=utf-8", headers=None, head_only=False):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        for name, value in getattr(self, "set_cookies", {}).items():
+            self.send_header("Set-Cookie", f"{name}={value}; Path=/; HttpOnly")
+        self.end_headers()
+        if not head_only:
+            self.wfile.write(body)
+
+    def page(self, title, content):
+        categories = "".join(f'<li><a href="/{slug}">{slug.replace("-", " ").title()}</a></li>'
+                             for slug in CATEGORIES)
+        footer_links = "".join(f'<li><a href="{path}">{path.strip("/")}</a></li>'
+                               for path in self.storefront.links)
+        return f"""<!DOCTYPE html>
+<html><head><title>{html.escape(title)}</title></head>
+<body>
+<div class="header">
+  <div class="header-links"><a href="/login" class="ico-login">Log in</a> <a href="/customer/info" class="ico-account">My account</a></div>
+  <div class="search-box">
+    <form action="/search" method="get">
+      <input id="small-searchterms" name="q" type="text" class="search-box-text">
+      <button type="submit" class="button-1 search-box-button">Search</button>
+    </form>
+  </div>
+</div>
+<ul class="top-menu">{categories}</ul>
+<div class="master-wrapper-content">{content}</div>
+<div class="footer"><ul class="footer-links">{footer_links}</ul></div>
+</body></html>""".encode("utf-8")
+
+    def render_card(self, product):
+        url = f"/{product['slug']}"
+        name = html.escape(product["name"])
+        return f"""
+<div class="product-item" data-productid="{product['id']}">
+  <div class="picture"><a href="{url}"><img src="/images/{product['id']}.png" alt="{name}" width="150" height="150"></a></div>
+  <div class="details">
+    <h2 class="product-title"><a href="{url}">{name}</a></h2>
+    <div class="prices"><span class="price actual-price">${product['price']}</span></div>
+  </div>
+</div>"""
+
+    def render_grid(self, products):
+        return '<div class="product-grid">' + "".join(self.render_card(p) for p in products) + "</div>"
+
+    def render_home(self):
+        featured = self.storefront.catalog.products[:Config.FIXTURE_PAGE_SIZE]
+        return self.page("Home", "<h1>Welcome to our store</h1>" + self.render_grid(featured))
+
+    def render_login(self):
+        return self.page("Log in", f"""
+<h1>Welcome, Please Sign In!</h1>
+<form method="post" action="/login">
+  <input id="Email" name="Email" type="email">
+  <input id="Password" name="Password" type="password">
+  <button type="submit" class="button-1 login-button">Log in</button>
+  {self.antiforgery_input()}
+</form>""")
+
+    def render_listing(self, category, page_number):
+        products = self.storefront.catalog.by_category[category]
+        page_size = Config.FIXTURE_PAGE_SIZE
+        start = (page_number - 1) * page_size
+        content = f"<h1>{category.replace('-', ' ').title()}</h1>" + self.render_grid(products[start:start + page_size])
+        if start + page_size < len(products):
+            content += (f'<div class="pager"><ul><li class="next-page">'
+                        f'<a href="/{category}?pagenumber={page_number + 1}">Next</a></li></ul></div>')
+        return self.page(category, content)
+
+    def render_product(self, product):
+        name = html.escape(product["name"])
+        return self.page(product["name"], f"""
+<form method="post" id="product-details-form">
+<div class="product-essential" data-productid="{product['id']}">
+  <div class="picture"><img src="/images/{product['id']}.png" alt="{name}" width="300" height="300"></div>
+  <div class="overview">
+    <div class="product-name"><h1>{name}</h1></div>
+    <div class="prices"><div class="product-price"><span class="price-value-{product['id']}">${product['price']}</span></div></div>
+    <div class="add-to-cart">
+      <input class="qty-input" type="text" name="addtocart_{product['id']}.EnteredQuantity" value="1">
+      <button type="button" id="add-to-cart-button-{product['id']}" class="button-1 add-to-cart-button">Add to cart</button>
+    </div>
+  </div>
+</div>
+{self.antiforgery_input()}
+</form>""")
+
+
+class FixtureStorefront:
+    """Local stand-in for the demo store, for offline and reproducible runs.
+
+    ``links`` maps extra paths to ``(status, delay_seconds)`` and is rendered
+    in every page footer so link checks see failing and slow links.
+    ``latency`` is added to every response.
+    """
+
+    def __init__(self, catalog_size=None, host=None, port=None, latency=None, links=None, seed=0):
+        self.catalog = FixtureCatalog(catalog_size, seed)
+        self.host = host or Config.FIXTURE_HOST
+        self.port = Config.FIXTURE_PORT if port is None else port
+        self.latency = Config.FIXTURE_LATENCY if latency is None else latency
+        self.links = Config.FIXTURE_LINKS if links is None else links
+        self.image = solid_png()
+        self.server = None
+        self.thread = None
+
+    @property
+    def url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self.server = ThreadingHTTPServer((self.host, self.port), StorefrontHandler)
+        self.server.daemon_threads = True
+        self.server.storefront = self
+        self.thread = threading.Thread(target=self.server.serve_forever, name="fixture-storefront", daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.thread.join()
+            self.server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+        return False
@@ -0,0 +1,101 @@
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from config.config import Config
+
+WHITESPACE = re.compile(r"\s+")
+
+
+def fingerprint(parts):
+    """Hash a sequence of strings after collapsing whitespace; None if there is nothing to hash"""
+    digest = hashlib.sha256()
+    count = 0
+    for part in parts:
+        digest.update(WHITESPACE.sub(" ", str(part)).strip().encode("utf-8"))
+        digest.update(b"\x00")
+        count += 1
+    return digest.hexdigest() if count else None
+
+
+def card_markup_fingerprint(content):
+    """Fingerprint the product-card markup of a listing page's HTML"""
+    from lxml import html as lxml_html
+    from utils.catalog_scraper import PRODUCT_ITEM_XPATH
+
+    tree = lxml_html.fromstring(content)
+    return fingerprint(lxml_html.tostring(card, encoding="unicode") for card in tree.xpath(PRODUCT_ITEM_XPATH))
+
+
+class VerdictCache:
+    """Verdicts of page-level checks, keyed by check, target and page fingerprint.
+
+    A passing verdict is reused while the page fingerprint is unchanged and
+    the verdict is younger than ``max_age``. Failures are stored too but
+    never reused, so anything that failed last time always reruns.
+    """
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, path=None, max_age=None):
+        self.path = path or Config.INCREMENTAL_CACHE_PATH
+        self.max_age = Config.INCREMENTAL_MAX_AGE if max_age is None else max_age
+        self.lock = threading.Lock()
+        self.entries = {}
+        self.checks = 0
+        self.skipped = 0
+        self.time_saved = 0.0
+        self.load()
+
+    @classmethod
+    def shared(cls):
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def save(self):
+        with self.lock:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.entries, f)
+            os.replace(tmp_path, self.path)
+
+    def reusable(self, check, target, page_fingerprint):
+        """Return the cached passing verdict for an unchanged page, counting the skip"""
+        with self.lock:
+            self.checks += 1
+            entry = self.entries.get(f"{check}|{target}")
+            if (page_fingerprint is None or entry is None or not entry["passed"]
+                    or entry["fingerprint"] != page_fingerprint
+                    or time.time() - entry["recorded_at"] > self.max_age):
+                return None
+            self.skipped += 1
+            self.time_saved += entry["duration"]
+            return entry
+
+    def store(self, check, target, page_fingerprint, passed, message, duration, **details):
+        if page_fingerprint is None:
+            return
+        with self.lock:
+            self.entries[f"{check}|{target}"] = {"fingerprint": page_fingerprint, "passed": passed,
+                                                 "message": message, "duration": round(duration, 3),
+                                                 "recorded_at": time.time(), **details}
+
+    def get_stats(self):
+        with self.lock:
+            return {"checks": self.checks, "skipped": self.skipped, "rerun": self.checks - self.skipped,
+                    "time_saved": round(self.time_saved, 2)}
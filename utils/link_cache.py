@@ -0,0 +1,105 @@
+import json
+import os
+import threading
+import time
+from config.config import Config
+
+
+class LinkStatusCache:
+    """On-disk cache of link check results shared across runs.
+
+    Entries younger than the TTL are served without any request; older
+    entries with an ETag or Last-Modified are revalidated with a conditional
+    request. Failed checks are stored but never served fresh, so broken
+    links are always re-checked.
+    """
+
+    def __init__(self, path=None, ttl=None, max_entries=None):
+        self.path = path or Config.LINK_CACHE_PATH
+        self.ttl = Config.LINK_CACHE_TTL if ttl is None else ttl
+        self.max_entries = max_entries or Config.LINK_CACHE_MAX_ENTRIES
+        self.entries = {}
+        self.lock = threading.Lock()
+        self.lookups = 0
+        self.fresh_hits = 0
+        self.revalidated = 0
+        self.load()
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            # A corrupt cache only costs us a cold run
+            self.entries = {}
+
+    def save(self):
+        """Evict expired and excess entries, then write the cache atomically"""
+        with self.lock:
+            now = time.time()
+            # Keep stale entries around for a while so they can be revalidated
+            max_age = self.ttl * Config.LINK_CACHE_STALE_FACTOR
+            entries = {url: entry for url, entry in self.entries.items()
+                       if now - entry["checked_at"] <= max_age}
+            if len(entries) > self.max_entries:
+                newest = sorted(entries.items(), key=lambda item: item[1]["checked_at"], reverse=True)
+                entries = dict(newest[:self.max_entries])
+            self.entries = entries
+
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(entries, f)
+            os.replace(tmp_path, self.path)
+
+    def lookup(self, url):
+        """Return (entry, is_fresh) for a URL; entry is None on a miss"""
+        with self.lock:
+            self.lookups += 1
+            entry = self.entries.get(url)
+            if entry is None:
+                return None, False
+            healthy = entry["status"] is not None and entry["status"] < 400
+            fresh = healthy and time.time() - entry["checked_at"] < self.ttl
+            if fresh:
+                self.fresh_hits += 1
+            return entry, fresh
+
+    def conditional_headers(self, entry):
+        """Build If-None-Match / If-Modified-Since headers for revalidation"""
+        headers = {}
+        if entry and entry["status"] is not None and entry["status"] < 400:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def mark_revalidated(self, url):
+        """Record a 304 response: the cached status is still valid"""
+        with self.lock:
+            self.revalidated += 1
+            self.entries[url]["checked_at"] = time.time()
+            return self.entries[url]["status"]
+
+    def store(self, url, status, final_url=None, etag=None, last_modified=None):
+        with self.lock:
+            self.entries[url] = {
+                "status": status,
+                "final_url": final_url,
+                "etag": etag,
+                "last_modified": last_modified,
+                "checked_at": time.time()
+            }
+
+    def get_stats(self):
+        hits = self.fresh_hits + self.revalidated
+        return {
+            "lookups": self.lookups,
+            "fresh_hits": self.fresh_hits,
+            "revalidated": self.revalidated,
+            "hit_rate": hits / self.lookups * 100 if self.lookups else 0.0,
+            "requests_saved": self.fresh_hits
+        }
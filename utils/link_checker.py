@@ -0,0 +1,134 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+from config.config import Config
+
+# Status codes some servers return for HEAD even though GET works
+HEAD_REJECTED_STATUSES = {400, 403, 405, 501}
+
+
+class TokenBucket:
+    """Thread-safe token bucket limiting request rate to a single host"""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = burst
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then consume it"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class LinkChecker:
+    """Check many URLs concurrently over pooled keep-alive connections.
+
+    Page fetches (crawling, scraping) and link checks draw on separate
+    per-host budgets, so a crawl doesn't starve the checks that follow it.
+    Each budget is a fixed LINK_CHECK_RATE_PER_HOST; ``workers`` only sets
+    how many hosts can be worked on at once.
+    """
+
+    def __init__(self, workers=None, rate_per_host=None, burst=None, timeout=None, cache=None):
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self.workers = workers or Config.LINK_CHECK_WORKERS
+        self.rate_per_host = rate_per_host or Config.LINK_CHECK_RATE_PER_HOST
+        self.burst = burst or Config.LINK_CHECK_BURST
+        self.timeout = timeout or Config.LINK_CHECK_TIMEOUT
+        self.request_exception = requests.RequestException
+        self.cache = cache
+
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = Config.CRAWL_USER_AGENT
+        adapter = HTTPAdapter(pool_connections=self.workers, pool_maxsize=self.workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self.buckets = {}
+        self.buckets_lock = threading.Lock()
+        self.head_fallbacks = 0
+        self.last_stats = {}
+
+    def _bucket_for(self, url, purpose="check"):
+        key = (purpose, urlparse(url).netloc)
+        with self.buckets_lock:
+            if key not in self.buckets:
+                self.buckets[key] = TokenBucket(self.rate_per_host, self.burst)
+            return self.buckets[key]
+
+    def check(self, url):
+        """Return the HTTP status for a URL, or None if the request failed"""
+        headers = {}
+        if self.cache is not None:
+            entry, fresh = self.cache.lookup(url)
+            if fresh:
+                return entry["status"]
+            headers = self.cache.conditional_headers(entry)
+
+        bucket = self._bucket_for(url)
+        try:
+            bucket.acquire()
+            response = self.session.head(url, timeout=self.timeout, allow_redirects=True, headers=headers)
+            if response.status_code in HEAD_REJECTED_STATUSES:
+                with self.buckets_lock:
+                    self.head_fallbacks += 1
+                bucket.acquire()
+                # stream=True so only headers are read, not the whole body
+                response = self.session.get(url, timeout=self.timeout, allow_redirects=True,
+                                            headers=headers, stream=True)
+                response.close()
+        except self.request_exception:
+            if self.cache is not None:
+                self.cache.store(url, None)
+            return None
+
+        if self.cache is None:
+            return response.status_code
+        if response.status_code == 304 and headers:
+            return self.cache.mark_revalidated(url)
+        self.cache.store(url, response.status_code, final_url=response.url,
+                         etag=response.headers.get("ETag"),
+                         last_modified=response.headers.get("Last-Modified"))
+        return response.status_code
+
+    def fetch(self, url):
+        """GET a page through the same pooled, rate-limited session"""
+        self._bucket_for(url, "fetch").acquire()
+        try:
+            return self.session.get(url, timeout=self.timeout)
+        except self.request_exception:
+            return None
+
+    def check_all(self, urls):
+        """Check every URL concurrently and return a {url: status} dict"""
+        start_time = time.monotonic()
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            statuses = dict(zip(urls, executor.map(self.check, urls)))
+        elapsed = time.monotonic() - start_time
+
+        self.last_stats = {
+            "checked": len(urls),
+            "elapsed": elapsed,
+            "links_per_second": len(urls) / elapsed if elapsed > 0 else 0.0,
+            "head_fallbacks": self.head_fallbacks
+        }
+        if self.cache is not None:
+            self.last_stats["cache"] = self.cache.get_stats()
+        return statuses
+
+    def close(self):
+        self.session.close()
@@ -0,0 +1,94 @@
+import time
+from config.config import Config
+
+# Evaluates every candidate locator in the page in one round trip and
+# returns [index, element] for the first visible match, or null
+RESOLVE_SCRIPT = """
+const candidates = arguments[0];
+function query(by, value) {
+    switch (by) {
+        case "id": {
+            const el = document.getElementById(value);
+            return el ? [el] : [];
+        }
+        case "name": return Array.from(document.getElementsByName(value));
+        case "class name": return Array.from(document.getElementsByClassName(value));
+        case "tag name": return Array.from(document.getElementsByTagName(value));
+        case "css selector": return Array.from(document.querySelectorAll(value));
+        case "link text":
+            return Array.from(document.querySelectorAll("a")).filter(a => a.textContent.trim() === value);
+        case "xpath": {
+            const found = [];
+            const snapshot = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            for (let i = 0; i < snapshot.snapshotLength; i++) {
+                found.push(snapshot.snapshotItem(i));
+            }
+            return found;
+        }
+    }
+    return [];
+}
+function visible(el) {
+    const style = window.getComputedStyle(el);
+    const rect = el.getBoundingClientRect();
+    return style.display !== "none" && style.visibility !== "hidden" && rect.width > 0 && rect.height > 0;
+}
+for (let i = 0; i < candidates.length; i++) {
+    let matches = [];
+    try {
+        matches = query(candidates[i][0], candidates[i][1]);
+    } catch (e) {
+        continue;  // Invalid selector for this page; try the next candidate
+    }
+    for (const el of matches) {
+        if (el.nodeType === 1 && visible(el)) {
+            return [i, el];
+        }
+    }
+}
+return null;
+"""
+
+
+class LocatorResolution:
+    """Outcome of resolving a set of fallback locators"""
+
+    def __init__(self, element, locator, index, latency, polls):
+        self.element = element
+        self.locator = locator
+        self.index = index
+        self.latency = latency
+        self.polls = polls
+
+    @property
+    def found(self):
+        return self.element is not None
+
+    def to_dict(self):
+        return {"locator": list(self.locator) if self.locator else None, "candidate_index": self.index,
+                "latency": round(self.latency, 4), "polls": self.polls}
+
+
+def resolve_first_visible(driver, candidates, timeout=None, poll_interval=None):
+    """Return the first visible element matching any candidate locator.
+
+    All candidates are checked together in a single execute_script call per
+    poll, so a missing candidate never costs an implicit wait. Polling stops
+    at the first match or after ``timeout`` seconds. Earlier candidates win
+    when several match in the same poll.
+    """
+    timeout = Config.LOCATOR_TIMEOUT if timeout is None else timeout
+    poll_interval = poll_interval or Config.LOCATOR_POLL_INTERVAL
+    candidates = [[by, value] for by, value in candidates]
+    start = time.monotonic()
+    deadline = start + timeout
+    polls = 0
+    while True:
+        polls += 1
+        match = driver.execute_script(RESOLVE_SCRIPT, candidates)
+        if match:
+            index, element = match
+            return LocatorResolution(element, tuple(candidates[index]), index, time.monotonic() - start, polls)
+        if time.monotonic() >= deadline:
+            return LocatorResolution(None, None, None, time.monotonic() - start, polls)
+        time.sleep(poll_interval)
@@ -0,0 +1,98 @@
+import math
+import os
+import sqlite3
+import statistics
+import time
+from config.config import Config
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS measurements (
+    id INTEGER PRIMARY KEY,
+    run_id TEXT NOT NULL,
+    page TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    value REAL NOT NULL,
+    recorded_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_measurements_page_metric_time
+    ON measurements (page, metric, recorded_at);
+CREATE INDEX IF NOT EXISTS idx_measurements_time ON measurements (recorded_at);
+"""
+
+
+class PerformanceHistory:
+    """SQLite store of per-run performance values with rolling baselines.
+
+    One row is written per (run, page, metric). The baseline for a page and
+    metric is the last ``Config.PERF_BASELINE_RUNS`` runs before the current
+    one; a value is flagged as a regression when it sits more than
+    ``Config.PERF_REGRESSION_Z`` standard deviations above the baseline mean
+    and is also at least ``Config.PERF_REGRESSION_MIN_DELTA`` slower in
+    relative terms, so tiny but consistent changes don't alert.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or Config.PERF_HISTORY_PATH
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self.connection = sqlite3.connect(self.path, check_same_thread=False)
+        self.connection.executescript(SCHEMA)
+        self.run_id = time.strftime("%Y%m%d_%H%M%S")
+
+    def record(self, page, metric, value, recorded_at=None):
+        with self.connection:
+            self.connection.execute(
+                "INSERT INTO measurements (run_id, page, metric, value, recorded_at) VALUES (?, ?, ?, ?, ?)",
+                (self.run_id, page, metric, value, recorded_at or time.time())
+            )
+
+    def history(self, page, metric, limit=None, exclude_current=False):
+        """Return values for a page and metric, oldest first"""
+        query = "SELECT value FROM measurements WHERE page = ? AND metric = ?"
+        params = [page, metric]
+        if exclude_current:
+            query += " AND run_id != ?"
+            params.append(self.run_id)
+        query += " ORDER BY recorded_at DESC"
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+        values = [row[0] for row in self.connection.execute(query, params)]
+        values.reverse()
+        return values
+
+    def compare_to_baseline(self, page, metric, value):
+        """Return baseline stats and whether ``value`` is a significant regression"""
+        baseline = self.history(page, metric, limit=Config.PERF_BASELINE_RUNS, exclude_current=True)
+        if len(baseline) < Config.PERF_BASELINE_MIN_RUNS:
+            return {"baseline_mean": None, "delta": None, "delta_pct": None,
+                    "z_score": None, "regression": False}
+
+        mean = statistics.fmean(baseline)
+        stdev = statistics.stdev(baseline) if len(baseline) > 1 else 0.0
+        delta = value - mean
+        delta_pct = delta / mean * 100 if mean else 0.0
+        if stdev > 0:
+            z_score = delta / stdev
+        else:
+            z_score = math.inf if delta > 0 else 0.0
+        regression = (z_score > Config.PERF_REGRESSION_Z
+                      and delta_pct >= Config.PERF_REGRESSION_MIN_DELTA * 100)
+        return {"baseline_mean": mean, "delta": delta, "delta_pct": delta_pct,
+                "z_score": z_score, "regression": regression}
+
+    def close(self):
+        self.connection.close()
+
+
+SPARK_CHARS = "▁▂▃▄▅▆▇█"
+
+
+def sparkline(values):
+    """Render a sequence of numbers as a unicode sparkline"""
+    if not values:
+        return ""
+    low, high = min(values), max(values)
+    spread = high - low
+    if spread == 0:
+        return SPARK_CHARS[0] * len(values)
+    return "".join(SPARK_CHARS[int((v - low) / spread * (len(SPARK_CHARS) - 1))] for v in values)
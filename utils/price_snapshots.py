@@ -0,0 +1,284 @@
+import bisect
+import json
+import os
+import re
+import struct
+import sys
+import threading
+import time
+import uuid
+from array import array
+from decimal import Decimal, InvalidOperation
+from config.config import Config
+
+PRICE_NUMBER = re.compile(r"\d(?:[\d.,'\s]*\d)?")
+# Decimal separator by locale, then by language; everything else in a number is grouping
+DECIMAL_SEPARATORS = {
+    "de_CH": ".", "fr_CH": ".", "it_CH": ".", "es_MX": ".",
+    "en": ".", "ja": ".", "zh": ".", "ko": ".", "hi": ".", "he": ".", "th": ".",
+    "de": ",", "fr": ",", "es": ",", "it": ",", "nl": ",", "pt": ",", "ru": ",", "pl": ",",
+    "sv": ",", "da": ",", "nb": ",", "fi": ",", "cs": ",", "tr": ",", "uk": ",", "el": ","
+}
+
+MAGIC = b"PSNP"
+HEADER = struct.Struct("<4sHHQ")  # magic, format version, scale, row count
+MISSING = -(2 ** 63)  # No price observed
+CENTS = Decimal("0.01")
+CONFIG_LOCALE = object()  # parse_price default: use Config.PRICE_LOCALE
+
+
+def guess_decimal_separator(number):
+    """Decimal separator of a number in an unknown locale, or None if it has no fraction"""
+    last = max(number.rfind("."), number.rfind(","))
+    if last < 0:
+        return None
+    separator = number[last]
+    if ("," if separator == "." else ".") in number:
+        return separator  # Both present: the last one is the decimal point
+    if number.count(separator) > 1 or len(number) - last - 1 == 3:
+        return None  # "1,234,567" or "1.800" reads as grouping
+    return separator
+
+
+def parse_price(text, locale=CONFIG_LOCALE):
+    """Parse a displayed price such as "$1,800.00" or "1.800,00 €" into an exact Decimal.
+
+    ``locale`` (default Config.PRICE_LOCALE, e.g. "de_DE") decides which
+    separator is the decimal point; with ``locale=None``, or when the text
+    doesn't follow the locale, it is guessed from the value. Returns None if
+    the text holds no usable number.
+    """
+    if not text:
+        return None
+    match = PRICE_NUMBER.search(text)
+    if not match:
+        return None
+    number = match.group()
+    locale = Config.PRICE_LOCALE if locale is CONFIG_LOCALE else locale
+    separator = None
+    if locale:
+        separator = DECIMAL_SEPARATORS.get(locale, DECIMAL_SEPARATORS.get(locale.split("_")[0], "."))
+        if number.count(separator) > 1 or not number.rpartition(separator)[2].isdigit():
+            # e.g. "1.800,00" under en_US: the site doesn't format prices the way Config says
+            separator = guess_decimal_separator(number)
+        elif separator not in number:
+            separator = None
+    else:
+        separator = guess_decimal_separator(number)
+
+    integer, fraction = (number.rsplit(separator, 1) if separator else (number, ""))
+    integer = re.sub(r"\D", "", integer) or "0"
+    fraction = re.sub(r"\D", "", fraction)
+    try:
+        return Decimal(f"{integer}.{fraction}") if fraction else Decimal(integer)
+    except InvalidOperation:
+        return None
+
+
+def units_to_decimal(units, scale):
+    """Stored units back to a Decimal, shown with cents unless more places are needed"""
+    if units == MISSING:
+        return None
+    value = Decimal(units).scaleb(-scale)
+    cents = value.quantize(CENTS)
+    return cents if cents == value else value.normalize()
+
+
+class PriceSnapshot:
+    """One run's price observations, held column-wise and sorted by SKU id.
+
+    ``sku_ids``, ``listing`` and ``detail`` are parallel int64 arrays; prices
+    are exact integers in units of 10**-scale, with MISSING where no price
+    was seen.
+    """
+
+    def __init__(self, entry, sku_ids, listing, detail):
+        self.id = entry["id"]
+        self.scope = entry["scope"]
+        self.created = entry["created"]
+        self.scale = entry["scale"]
+        self.sku_ids = sku_ids
+        self.listing = listing
+        self.detail = detail
+
+    def __len__(self):
+        return len(self.sku_ids)
+
+    def offset(self, sku_id):
+        """Row of a SKU id, or None"""
+        index = bisect.bisect_left(self.sku_ids, sku_id)
+        return index if index < len(self.sku_ids) and self.sku_ids[index] == sku_id else None
+
+    def column(self, name):
+        return {"listing": self.listing, "detail": self.detail}[name]
+
+    def to_decimal(self, units):
+        return units_to_decimal(units, self.scale)
+
+    def scaled(self, name, scale):
+        """A price column in units of 10**-scale (scale >= the snapshot's own)"""
+        factor = 10 ** (scale - self.scale)
+        values = self.column(name)
+        return values if factor == 1 else [value if value == MISSING else value * factor for value in values]
+
+
+class PriceSnapshotStore:
+    """Append-only store of per-run SKU price snapshots.
+
+    SKUs are interned once into ``skus.txt``, whose line numbers are the ids
+    every snapshot uses, so diffs compare integers rather than strings.
+    Each run adds one binary snapshot file of sorted id, listing and detail
+    price columns plus a line in ``manifest.jsonl``; nothing is rewritten.
+    Diffing builds id->price maps straight from the columns and does all
+    comparisons with set operations (``benchmark.py --price-diff`` times
+    it on a 100k-SKU catalog).
+    """
+
+    def __init__(self, root=None, scale=None):
+        self.root = root or Config.PRICE_SNAPSHOT_DIR
+        self.scale = Config.PRICE_SNAPSHOT_SCALE if scale is None else scale
+        self.lock = threading.Lock()
+        self.skus = None
+        self.sku_index = None
+
+    @property
+    def manifest_path(self):
+        return os.path.join(self.root, "manifest.jsonl")
+
+    @property
+    def skus_path(self):
+        return os.path.join(self.root, "skus.txt")
+
+    def load_skus(self):
+        """Read the SKU dictionary on first use (lock held)"""
+        if self.skus is not None:
+            return
+        self.skus = []
+        if os.path.exists(self.skus_path):
+            with open(self.skus_path, 'r', encoding='utf-8') as f:
+                self.skus = f.read().split("\n")[:-1]
+        self.sku_index = {sku: sku_id for sku_id, sku in enumerate(self.skus)}
+
+    def intern(self, skus):
+        """Ids for the given SKUs, appending unseen ones to the dictionary (lock held)"""
+        self.load_skus()
+        ids, new = [], []
+        for sku in skus:
+            sku = str(sku).replace("\n", " ")
+            sku_id = self.sku_index.get(sku)
+            if sku_id is None:
+                sku_id = self.sku_index[sku] = len(self.skus)
+                self.skus.append(sku)
+                new.append(sku)
+            ids.append(sku_id)
+        if new:
+            os.makedirs(self.root, exist_ok=True)
+            # Appended in one write so line numbers stay in step with the ids handed out
+            with open(self.skus_path, 'a', encoding='utf-8') as f:
+                f.write("".join(f"{sku}\n" for sku in new))
+        return ids
+
+    def to_units(self, price):
+        if price is None:
+            return MISSING
+        units = Decimal(price).scaleb(self.scale)
+        if units != units.to_integral_value():
+            raise ValueError(f"Price {price} has more than {self.scale} decimal places")
+        return int(units)
+
+    def record(self, scope, observations):
+        """Store ``(sku, listing_price, detail_price)`` observations as a new snapshot.
+
+        Prices are Decimals (or None). A SKU seen twice keeps its last
+        observation. Returns the new PriceSnapshot; raises ValueError for
+        a price with more than ``scale`` decimal places.
+        """
+        # Convert first so a price that can't be stored exactly leaves the store untouched
+        observations = [(sku, self.to_units(listing), self.to_units(detail)) for sku, listing, detail in observations]
+        with self.lock:
+            ids = self.intern(sku for sku, _, _ in observations)
+            rows = {}
+            for sku_id, (_, listing, detail) in zip(ids, observations):
+                rows[sku_id] = (listing, detail)
+            sku_ids = array("q", sorted(rows))
+            listing = array("q", (rows[sku_id][0] for sku_id in sku_ids))
+            detail = array("q", (rows[sku_id][1] for sku_id in sku_ids))
+
+            entry = {"id": f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}", "scope": scope,
+                     "created": time.time(), "scale": self.scale, "count": len(sku_ids)}
+            os.makedirs(self.root, exist_ok=True)
+            path = os.path.join(self.root, f"{entry['id']}.snap")
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(HEADER.pack(MAGIC, 1, self.scale, len(sku_ids)))
+                for column in (sku_ids, listing, detail):
+                    if sys.byteorder == "big":
+                        column = array("q", column)
+                        column.byteswap()
+                    column.tofile(f)
+            os.replace(tmp_path, path)
+            with open(self.manifest_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry) + "\n")
+        return PriceSnapshot(entry, sku_ids, listing, detail)
+
+    def snapshots(self, scope=None):
+        """Manifest entries, oldest first, optionally for one scope"""
+        if not os.path.exists(self.manifest_path):
+            return []
+        with open(self.manifest_path, 'r', encoding='utf-8') as f:
+            entries = [json.loads(line) for line in f if line.strip()]
+        return [entry for entry in entries if scope is None or entry["scope"] == scope]
+
+    def load(self, entry):
+        """Read a snapshot by manifest entry or id"""
+        if isinstance(entry, str):
+            entry = next(e for e in self.snapshots() if e["id"] == entry)
+        with open(os.path.join(self.root, f"{entry['id']}.snap"), 'rb') as f:
+            magic, version, scale, count = HEADER.unpack(f.read(HEADER.size))
+            if magic != MAGIC or version != 1:
+                raise ValueError(f"Not a price snapshot: {entry['id']}")
+            columns = []
+            for _ in range(3):
+                column = array("q")
+                column.fromfile(f, count)
+                if sys.byteorder == "big":
+                    column.byteswap()
+                columns.append(column)
+        return PriceSnapshot(dict(entry, scale=scale), *columns)
+
+    def latest(self, scope, before=None):
+        """Most recent snapshot of a scope, optionally older than the given snapshot id"""
+        entries = self.snapshots(scope)
+        if before is not None:
+            entries = [entry for entry in entries if entry["id"] != before]
+        return self.load(entries[-1]) if entries else None
+
+    def diff(self, old, new, column="listing"):
+        """Price changes, new SKUs and disappeared SKUs between two snapshots.
+
+        Changes only count SKUs with a price in both snapshots and list
+        ``(sku, old_price, new_price)``.
+        """
+        # Snapshots taken before a PRICE_SNAPSHOT_SCALE change are compared at the finer scale
+        scale = max(old.scale, new.scale)
+        old_prices = dict(zip(old.sku_ids, old.scaled(column, scale)))
+        new_prices = dict(zip(new.sku_ids, new.scaled(column, scale)))
+        removed = old_prices.keys() - new_prices.keys()
+        added = new_prices.keys() - old_prices.keys()
+        # Pairs only in the old snapshot are removed SKUs or changed prices
+        changed = {sku_id for sku_id, _ in old_prices.items() - new_prices.items()} - removed
+        changed = [sku_id for sku_id in sorted(changed)
+                   if old_prices[sku_id] != MISSING and new_prices[sku_id] != MISSING]
+
+        with self.lock:
+            self.load_skus()
+            skus = self.skus
+        return {
+            "old": old.id,
+            "new": new.id,
+            "column": column,
+            "changed": [(skus[sku_id], units_to_decimal(old_prices[sku_id], scale),
+                         units_to_decimal(new_prices[sku_id], scale)) for sku_id in changed],
+            "added": [skus[sku_id] for sku_id in sorted(added)],
+            "removed": [skus[sku_id] for sku_id in sorted(removed)]
+        }
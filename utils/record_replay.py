@@ -0,0 +1,265 @@
+import hashlib
+import json
+import os
+import threading
+import time
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+from config.config import Config
+
+# Headers that describe a single connection or that we recompute ourselves
+SKIPPED_HEADERS = {"connection", "keep-alive", "proxy-connection", "transfer-encoding", "upgrade",
+                   "content-length", "content-encoding", "strict-transport-security",
+                   "alt-svc", "content-security-policy"}
+TEXT_TYPES = ("text/", "application/json", "application/javascript", "application/xml")
+
+
+class ResponseArchive:
+    """Indexed on-disk store of recorded responses.
+
+    ``index.json`` maps a request key (method, path and query, plus a body
+    hash for POSTs) to status, headers and original latency. Bodies are
+    stored once per content hash under ``bodies/``, so pages repeated
+    across recordings share one file. Each new entry is also appended to
+    ``index.journal`` as it is recorded, so a recording that crashes before
+    ``save`` keeps its index; ``save`` folds the journal into ``index.json``.
+    """
+
+    def __init__(self, directory=None):
+        self.directory = directory or Config.REPLAY_ARCHIVE_DIR
+        self.index_path = os.path.join(self.directory, "index.json")
+        self.journal_path = os.path.join(self.directory, "index.journal")
+        self.bodies_dir = os.path.join(self.directory, "bodies")
+        self.lock = threading.Lock()
+        self.entries = {}
+        self.load()
+
+    @staticmethod
+    def key(method, path, body=b""):
+        if method in ("GET", "HEAD"):
+            # HEAD is answered from the GET recording
+            return f"GET {path}"
+        return f"{method} {path} {hashlib.sha1(body).hexdigest()[:12]}"
+
+    def load(self):
+        if os.path.exists(self.index_path):
+            try:
+                with open(self.index_path, 'r', encoding='utf-8') as f:
+                    self.entries = json.load(f)
+            except (OSError, ValueError):
+                self.entries = {}
+        if os.path.exists(self.journal_path):
+            with open(self.journal_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        key, entry = json.loads(line)
+                    except ValueError:
+                        continue  # Torn last line of a crashed recording
+                    self.entries[key] = entry
+
+    def save(self):
+        with self.lock:
+            os.makedirs(self.directory, exist_ok=True)
+            tmp_path = f"{self.index_path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.entries, f, indent=1)
+            os.replace(tmp_path, self.index_path)
+            if os.path.exists(self.journal_path):
+                os.remove(self.journal_path)
+
+    def get(self, key):
+        """Return (entry, body) or (None, None) if the request was never recorded"""
+        with self.lock:
+            entry = self.entries.get(key)
+        if entry is None:
+            return None, None
+        with open(os.path.join(self.bodies_dir, entry["body"]), 'rb') as f:
+            return entry, f.read()
+
+    def put(self, key, status, headers, body, elapsed):
+        digest = hashlib.sha1(body).hexdigest()
+        body_path = os.path.join(self.bodies_dir, digest)
+        if not os.path.exists(body_path):
+            os.makedirs(self.bodies_dir, exist_ok=True)
+            with open(body_path, 'wb') as f:
+                f.write(body)
+        entry = {"status": status, "headers": headers, "body": digest,
+                 "elapsed": round(elapsed, 4), "recorded_at": time.time()}
+        with self.lock:
+            self.entries[key] = entry
+            with open(self.journal_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps([key, entry]) + "\n")
+
+
+class RecordReplayHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True  # See StorefrontHandler
+
+    def log_message(self, format, *args):
+        pass
+
+    @property
+    def proxy(self):
+        return self.server.proxy
+
+    def do_GET(self):
+        self.handle_request()
+
+    def do_HEAD(self):
+        self.handle_request(head_only=True)
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        self.handle_request(body=self.rfile.read(length))
+
+    def handle_request(self, body=b"", head_only=False):
+        key = ResponseArchive.key(self.command, self.path, body)
+        if self.proxy.mode == "record":
+            status, headers, content = self.proxy.record(key, self.command, self.path, body, self.headers)
+        else:
+            status, headers, content = self.proxy.replay(key)
+
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, self.proxy.to_local(value))
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        if not head_only:
+            self.wfile.write(content)
+
+
+class RecordReplayProxy:
+    """Local stand-in origin that records live responses or replays them.
+
+    The suite is pointed at the proxy with ``Config.set_base_url``, so both
+    the browser and ``requests`` traffic for the site go through it over
+    plain HTTP. Absolute links to the real origin are rewritten to the proxy
+    on the way out. Bodies are archived exactly as the origin sent them, so
+    a recording replays on any port. ``latency`` is ``None`` to serve
+    immediately, ``"recorded"`` to reproduce the original response times, or
+    a number of seconds added to every response.
+    """
+
+    def __init__(self, mode=None, origin=None, archive_dir=None, latency=None, host=None, port=None):
+        self.mode = mode or Config.REPLAY_MODE
+        if self.mode not in ("record", "replay"):
+            raise ValueError(f"Unknown record/replay mode: {self.mode}")
+        parsed = urlparse(origin or Config.BASE_URL)
+        self.origin = f"{parsed.scheme}://{parsed.netloc}"
+        self.origin_host = parsed.netloc
+        self.archive = ResponseArchive(archive_dir)
+        self.latency = Config.REPLAY_LATENCY if latency is None else latency
+        self.host = host or Config.FIXTURE_HOST
+        self.port = Config.FIXTURE_PORT if port is None else port
+        # Never follow redirects; the browser should see them
+        self.opener = urllib.request.build_opener(_NoRedirect)
+        self.lock = threading.Lock()
+        self.stats = {"requests": 0, "recorded": 0, "replayed": 0, "misses": 0, "bytes_served": 0}
+        self.server = None
+        self.thread = None
+
+    @property
+    def url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def to_local(self, value):
+        return value.replace(self.origin, self.url).replace(f"//{self.origin_host}", f"//{self.url.split('//', 1)[1]}")
+
+    def local_body(self, headers, body):
+        content_type = dict((name.lower(), value) for name, value in headers).get("content-type", "")
+        if content_type.startswith(TEXT_TYPES):
+            return self.to_local(body.decode("utf-8", "replace")).encode("utf-8")
+        return body
+
+    def count(self, stat, served):
+        with self.lock:
+            self.stats["requests"] += 1
+            self.stats[stat] += 1
+            self.stats["bytes_served"] += served
+
+    def record(self, key, method, path, body, request_headers):
+        if method == "HEAD":
+            # HEAD shares the GET recording, so fetch the full response rather than overwrite it
+            method = "GET"
+        headers = {name: value.replace(self.url, self.origin) for name, value in request_headers.items()
+                   if name.lower() not in ("host", "accept-encoding", "connection", "content-length")}
+        headers["Accept-Encoding"] = "identity"
+        request = urllib.request.Request(self.origin + path, data=body or None, headers=headers, method=method)
+        start = time.monotonic()
+        try:
+            with self.opener.open(request, timeout=Config.PAGE_LOAD_TIMEOUT) as response:
+                status, response_headers, content = response.status, response.headers, response.read()
+        except urllib.error.HTTPError as e:
+            status, response_headers, content = e.code, e.headers, e.read()
+        except OSError as e:
+            self.count("misses", 0)
+            return 502, [("Content-Type", "text/plain")], f"Origin unreachable: {e}".encode()
+        elapsed = time.monotonic() - start
+
+        headers = [(name, self.strip_cookie_scope(name, value)) for name, value in response_headers.items()
+                   if name.lower() not in SKIPPED_HEADERS]
+        self.archive.put(key, status, headers, content, elapsed)
+        content = self.local_body(headers, content)
+        self.count("recorded", len(content))
+        return status, headers, content
+
+    def strip_cookie_scope(self, name, value):
+        """Cookies scoped to the real domain or HTTPS would be dropped by the browser"""
+        if name.lower() != "set-cookie":
+            return value
+        parts = [part for part in value.split(";")
+                 if not part.strip().lower().startswith("domain=") and part.strip().lower() != "secure"]
+        return ";".join(parts)
+
+    def replay(self, key):
+        entry, content = self.archive.get(key)
+        if entry is None:
+            self.count("misses", 0)
+            return 502, [("Content-Type", "text/plain")], f"Not in recording: {key}".encode()
+        if self.latency == "recorded":
+            time.sleep(entry["elapsed"])
+        elif self.latency:
+            time.sleep(float(self.latency))
+        headers = [tuple(header) for header in entry["headers"]]
+        content = self.local_body(headers, content)
+        self.count("replayed", len(content))
+        return entry["status"], headers, content
+
+    def get_stats(self):
+        with self.lock:
+            return dict(self.stats, mode=self.mode, archive=self.archive.directory,
+                        entries=len(self.archive.entries))
+
+    def start(self):
+        self.server = ThreadingHTTPServer((self.host, self.port), RecordReplayHandler)
+        self.server.daemon_threads = True
+        self.server.proxy = self
+        self.thread = threading.Thread(target=self.server.serve_forever, name="record-replay", daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        try:
+            if self.server is not None:
+                self.server.shutdown()
+                self.server.server_close()
+                self.thread.join()
+                self.server = None
+        finally:
+            if self.mode == "record":
+                self.archive.save()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+        return False
+
+
+class _NoRedirect(urllib.request.HTTPRedirectHandler):
+    def redirect_request(self, req, fp, code, msg, headers, newurl):
+        return None
@@ -1,88 +1,175 @@
 import os
 import json
+import heapq
+import shutil
+import tempfile
 from datetime import datetime
 from config.config import Config
+from utils.perf_history import sparkline
+from utils.screenshot_manager import thumbnail_path
 
 class ReportGenerator:
     def __init__(self):
         self.report_data = {}
     
-    def generate_summary_txt(self, test_results, total_time):
-        """Generate a simple text summary file"""
-        passed_tests = [t for t in test_results if t['status'] == 'PASS']
-        failed_tests = [t for t in test_results if t['status'] == 'FAIL']
-        
-        summary_content = f"""
-E-COMMERCE TESTING SUITE - EXECUTION SUMMARY
-============================================
-
-Execution Date: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
-Total Duration: {total_time:.2f} seconds
-
-TEST RESULTS SUMMARY:
-====================
-Total Tests Run: {len(test_results)}
-Tests Passed: {len(passed_tests)}
-Tests Failed: {len(failed_tests)}
-Success Rate: {(len(passed_tests)/len(test_results)*100 if test_results else 0):.1f}%
-
-DETAILED BREAKDOWN BY MODULE:
-=============================
-"""
-        # Group by module
-        modules = {}
-        for test in test_results:
-            module = test['module']
-            if module not in modules:
-                modules[module] = {'total': 0, 'passed': 0, 'failed': 0}
-            modules[module]['total'] += 1
-            if test['status'] == 'PASS':
-                modules[module]['passed'] += 1
+    def get_trend_rows(self, test):
+        """Return (metric, sparkline, median, delta text) rows for a performance result"""
+        baseline = test.get('metrics', {}).get('baseline', {})
+        rows = []
+        for metric, comparison in baseline.items():
+            trend = comparison['trend']
+            if comparison['delta_pct'] is None:
+                delta = "no baseline yet"
             else:
-                modules[module]['failed'] += 1
+                delta = f"{comparison['delta_pct']:+.1f}% vs baseline {comparison['baseline_mean']:.2f}s"
+                if comparison['regression']:
+                    delta += " (REGRESSION)"
+            rows.append((metric, sparkline(trend), trend[-1] if trend else 0.0, delta))
+        return rows
+    
+    def render_html_test(self, test):
+        """Render one result as an HTML block"""
+        status_class = "pass" if test['status'] == 'PASS' else "fail"
+        status_emoji = "✅" if test['status'] == 'PASS' else "❌"
         
-        for module, stats in modules.items():
-            success_rate = (stats['passed'] / stats['total'] * 100) if stats['total'] > 0 else 0
-            summary_content += f"{module}:\n"
-            summary_content += f"  - Total: {stats['total']}\n"
-            summary_content += f"  - Passed: {stats['passed']}\n"
-            summary_content += f"  - Failed: {stats['failed']}\n"
-            summary_content += f"  - Success Rate: {success_rate:.1f}%\n\n"
+        html_content = f"""
+                <div class="test-result {status_class}">
+                    <h4>{status_emoji} {test['test_name']}</h4>
+                    <p><strong>Status:</strong> {test['status']}</p>
+                    <p><strong>Message:</strong> {test['message']}</p>
+                    <p><strong>Time:</strong> {test['timestamp']}</p>
+                """
         
-        # Failed tests details
-        if failed_tests:
-            summary_content += "FAILED TESTS DETAILS:\n"
-            summary_content += "=====================\n"
-            for test in failed_tests:
-                summary_content += f"- {test['test_name']} ({test['module']})\n"
-                summary_content += f"  Reason: {test['message']}\n"
-                if test.get('screenshot'):
-                    summary_content += f"  Screenshot: {test['screenshot']}\n"
-                summary_content += "\n"
+        trend_rows = self.get_trend_rows(test)
+        if trend_rows:
+            html_content += '<table class="trend">'
+            for metric, spark, latest, delta in trend_rows:
+                delta_class = ' class="regression"' if "REGRESSION" in delta else ""
+                html_content += (f"<tr><td>{metric}</td><td>{spark}</td>"
+                                 f"<td>{latest:.2f}s</td><td{delta_class}>{delta}</td></tr>")
+            html_content += "</table>"
         
-        # Performance insights
-        summary_content += "PERFORMANCE INSIGHTS:\n"
-        summary_content += "=====================\n"
-        summary_content += f"Total execution time: {total_time:.2f} seconds\n"
-        if total_time > 120:
-            summary_content += "⚠️  Performance Note: Test execution took more than 2 minutes. Consider optimizing.\n"
-        else:
-            summary_content += "✅ Performance: Test execution within acceptable time frame.\n"
+        if test.get('screenshot'):
+            # Link the full frame behind its thumbnail when one was written
+            thumb = thumbnail_path(test['screenshot'])
+            preview = thumb if os.path.exists(thumb) else test['screenshot']
+            html_content += f"""
+                    <p><strong>Screenshot:</strong></p>
+                    <a href="../{test['screenshot']}"><img src="../{preview}" alt="Failure Screenshot" class="screenshot"></a>
+                    """
         
-        # Save summary file
-        summary_path = os.path.join(Config.REPORT_DIR, "test_summary.txt")
-        with open(summary_path, 'w', encoding='utf-8') as f:
-            f.write(summary_content)
+        html_content += "</div>"
+        return html_content
+    
+    def render_txt_failure(self, test):
+        """Render one failed result for the text summary"""
+        content = f"- {test['test_name']} ({test['module']})\n"
+        content += f"  Reason: {test['message']}\n"
+        if test.get('screenshot'):
+            content += f"  Screenshot: {test['screenshot']}\n"
+        return content + "\n"
+    
+    def render_txt_trends(self, test):
+        """Render a performance result's trend rows for the text summary"""
+        content = f"{test['test_name']}:\n"
+        for metric, spark, latest, delta in self.get_trend_rows(test):
+            content += f"  {metric:<26} {spark:<20} {latest:.2f}s  {delta}\n"
+        return content + "\n"
+    
+    def render_timing_rows(self, timing):
+        """Return (label, seconds, detail) rows for the slowest tests"""
+        rows = []
+        for test in timing['slowest_tests']:
+            phases = ", ".join(f"{name} {seconds:.2f}s" for name, seconds in (test['phases'] or {}).items())
+            rows.append((f"{test['test_name']} ({test['module']})", test['duration'], phases))
+        return rows
+    
+    def generate_reports(self, test_results, total_time, module_order=None):
+        """Render the HTML, text and JSON reports in a single pass.
+
+        ``test_results`` may be any iterable, including a lazy reader over a
+        ResultSink stream. Each result is rendered into per-section scratch
+        files as it is read, so memory stays flat however many results there
+        are; the final files are then assembled by copying those sections.
+        Module sections follow ``module_order`` when given, otherwise the
+        order in which modules first appear.
+        """
+        total = passed = failed = 0
+        modules = {}
+        slowest = []  # Min-heap holding only the N slowest tests
         
-        print(f"📄 Text summary generated: {summary_path}")
-        return summary_path
+        with tempfile.TemporaryDirectory(dir=Config.REPORT_DIR) as work_dir:
+            def scratch(name):
+                return open(os.path.join(work_dir, name), 'w+', encoding='utf-8')
+            
+            module_sections = {}
+            failures = scratch("failures.txt")
+            trends = scratch("trends.txt")
+            json_results = scratch("results.json")
+            
+            for test in test_results:
+                is_pass = test['status'] == 'PASS'
+                total += 1
+                passed += is_pass
+                failed += not is_pass
+                module = test['module']
+                if module not in modules:
+                    modules[module] = {'total': 0, 'passed': 0, 'failed': 0, 'duration': 0.0}
+                    module_sections[module] = scratch(f"module_{len(module_sections)}.html")
+                modules[module]['total'] += 1
+                modules[module]['passed' if is_pass else 'failed'] += 1
+                
+                duration = test.get('duration')
+                if duration is not None:
+                    modules[module]['duration'] += duration
+                    entry = (duration, total, test['test_name'], module, test.get('phases'))
+                    if len(slowest) < Config.REPORT_SLOWEST_TESTS:
+                        heapq.heappush(slowest, entry)
+                    else:
+                        heapq.heappushpop(slowest, entry)
+                
+                module_sections[module].write(self.render_html_test(test))
+                if not is_pass:
+                    failures.write(self.render_txt_failure(test))
+                if self.get_trend_rows(test):
+                    trends.write(self.render_txt_trends(test))
+                if total > 1:
+                    json_results.write(",\n")
+                json_results.write(json.dumps(test, default=str))
+            
+            success_rate = passed / total * 100 if total else 0
+            ordered = sorted(modules, key=lambda m: module_order.index(m) if module_order and m in module_order
+                             else len(module_order or []))
+            sections = [(module, module_sections[module]) for module in ordered]
+            timing = {
+                "slowest_tests": [{"test_name": name, "module": module, "duration": duration, "phases": phases}
+                                  for duration, _, name, module, phases in sorted(slowest, reverse=True)],
+                "slowest_modules": sorted(((module, stats['duration']) for module, stats in modules.items()),
+                                          key=lambda item: item[1], reverse=True)
+            }
+            for f in [failures, trends, json_results] + [f for _, f in sections]:
+                f.seek(0)
+            
+            report_path = self.write_html_report(sections, timing, total, passed, failed, success_rate, total_time)
+            self.write_summary_txt({m: modules[m] for m in ordered}, failures, trends, timing,
+                                   total, passed, failed, success_rate, total_time)
+            json_path = self.write_json_report(json_results, timing, total, passed, failed, success_rate, total_time)
+            
+            for f in [failures, trends, json_results] + [f for _, f in sections]:
+                f.close()
+        
+        print(f"📊 HTML report generated: {report_path}")
+        print(f"📄 JSON report generated: {json_path}")
+        return {"total": total, "passed": passed, "failed": failed,
+                "success_rate": success_rate, "modules": modules, "timing": timing}
     
     def generate_html_report(self, test_results, total_time):
-        """Generate comprehensive HTML report"""
-        passed_tests = [t for t in test_results if t['status'] == 'PASS']
-        failed_tests = [t for t in test_results if t['status'] == 'FAIL']
-        
-        html_content = f"""
+        """Generate comprehensive HTML, text and JSON reports"""
+        return self.generate_reports(test_results, total_time)
+    
+    def write_html_report(self, sections, timing, total, passed, failed, success_rate, total_time):
+        """Assemble the HTML report from the rendered module sections"""
+        header = f"""
         <!DOCTYPE html>
         <html lang="en">
         <head>
@@ -98,6 +185,9 @@ DETAILED BREAKDOWN BY MODULE:
                 .fail {{ background: #f8d7da; border: 1px solid #f5c6cb; }}
                 .module-header {{ background: #34495e; color: white; padding: 10px; margin-top: 20px; }}
                 .screenshot {{ max-width: 300px; margin: 10px 0; }}
+                .trend {{ font-family: monospace; border-collapse: collapse; }}
+                .trend td {{ padding: 2px 10px; }}
+                .regression {{ color: #dc3545; font-weight: bold; }}
                 .stats {{ display: flex; justify-content: space-around; margin: 20px 0; }}
                 .stat-card {{ background: white; padding: 15px; border-radius: 5px; text-align: center; flex: 1; margin: 0 10px; }}
                 .success {{ border-left: 5px solid #28a745; }}
@@ -114,95 +204,144 @@ DETAILED BREAKDOWN BY MODULE:
             <div class="stats">
                 <div class="stat-card success">
                     <h3>Total Tests</h3>
-                    <p style="font-size: 24px; font-weight: bold;">{len(test_results)}</p>
+                    <p style="font-size: 24px; font-weight: bold;">{total}</p>
                 </div>
                 <div class="stat-card success">
                     <h3>Passed</h3>
-                    <p style="font-size: 24px; font-weight: bold; color: #28a745;">{len(passed_tests)}</p>
+                    <p style="font-size: 24px; font-weight: bold; color: #28a745;">{passed}</p>
                 </div>
                 <div class="stat-card danger">
                     <h3>Failed</h3>
-                    <p style="font-size: 24px; font-weight: bold; color: #dc3545;">{len(failed_tests)}</p>
+                    <p style="font-size: 24px; font-weight: bold; color: #dc3545;">{failed}</p>
                 </div>
                 <div class="stat-card warning">
                     <h3>Success Rate</h3>
-                    <p style="font-size: 24px; font-weight: bold; color: #ffc107;">{(len(passed_tests)/len(test_results)*100 if test_results else 0):.1f}%</p>
+                    <p style="font-size: 24px; font-weight: bold; color: #ffc107;">{success_rate:.1f}%</p>
                 </div>
             </div>
             
             <div class="summary">
                 <h2>📊 Test Summary</h2>
-                <p><strong>Total Tests:</strong> {len(test_results)}</p>
-                <p><strong>Passed:</strong> <span style="color: green">{len(passed_tests)}</span></p>
-                <p><strong>Failed:</strong> <span style="color: red">{len(failed_tests)}</span></p>
-                <p><strong>Success Rate:</strong> {(len(passed_tests)/len(test_results)*100 if test_results else 0):.1f}%</p>
+                <p><strong>Total Tests:</strong> {total}</p>
+                <p><strong>Passed:</strong> <span style="color: green">{passed}</span></p>
+                <p><strong>Failed:</strong> <span style="color: red">{failed}</span></p>
+                <p><strong>Success Rate:</strong> {success_rate:.1f}%</p>
                 <p><strong>Total Time:</strong> {total_time:.2f} seconds</p>
             </div>
-            
-            <h2>📋 Detailed Test Results</h2>
         """
         
-        # Group tests by module
-        modules = {}
-        for test in test_results:
-            module = test['module']
-            if module not in modules:
-                modules[module] = []
-            modules[module].append(test)
-        
-        for module, tests in modules.items():
-            html_content += f'<div class="module-header"><h3>{module}</h3></div>'
-            
-            for test in tests:
-                status_class = "pass" if test['status'] == 'PASS' else "fail"
-                status_emoji = "✅" if test['status'] == 'PASS' else "❌"
-                
-                html_content += f"""
-                <div class="test-result {status_class}">
-                    <h4>{status_emoji} {test['test_name']}</h4>
-                    <p><strong>Status:</strong> {test['status']}</p>
-                    <p><strong>Message:</strong> {test['message']}</p>
-                    <p><strong>Time:</strong> {test['timestamp']}</p>
-                """
-                
-                if test.get('screenshot'):
-                    html_content += f"""
-                    <p><strong>Screenshot:</strong></p>
-                    <img src="../{test['screenshot']}" alt="Failure Screenshot" class="screenshot">
-                    """
-                
-                html_content += "</div>"
-        
-        html_content += """
+        report_path = os.path.join(Config.REPORT_DIR, "test_report.html")
+        with open(report_path, 'w', encoding='utf-8') as f:
+            f.write(header)
+            timing_rows = self.render_timing_rows(timing)
+            if timing_rows:
+                f.write('<h2>⏱️ Slowest Tests</h2><table class="trend">')
+                for label, seconds, phases in timing_rows:
+                    f.write(f"<tr><td>{label}</td><td>{seconds:.2f}s</td><td>{phases}</td></tr>")
+                f.write("</table><h3>Time by Module</h3><table class=\"trend\">")
+                for module, seconds in timing['slowest_modules']:
+                    f.write(f"<tr><td>{module}</td><td>{seconds:.2f}s</td></tr>")
+                f.write("</table>")
+            f.write("<h2>📋 Detailed Test Results</h2>")
+            for module, section in sections:
+                f.write(f'<div class="module-header"><h3>{module}</h3></div>')
+                shutil.copyfileobj(section, f)
+            f.write("""
             </div>
         </body>
         </html>
-        """
-        
-        # Save HTML report
-        report_path = os.path.join(Config.REPORT_DIR, "test_report.html")
-        with open(report_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        """)
+        return report_path
+    
+    def write_summary_txt(self, modules, failures, trends, timing, total, passed, failed, success_rate, total_time):
+        """Generate a simple text summary file"""
+        summary_content = f"""
+E-COMMERCE TESTING SUITE - EXECUTION SUMMARY
+============================================
+
+Execution Date: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+Total Duration: {total_time:.2f} seconds
+
+TEST RESULTS SUMMARY:
+====================
+Total Tests Run: {total}
+Tests Passed: {passed}
+Tests Failed: {failed}
+Success Rate: {success_rate:.1f}%
+
+DETAILED BREAKDOWN BY MODULE:
+=============================
+"""
+        for module, stats in modules.items():
+            module_rate = (stats['passed'] / stats['total'] * 100) if stats['total'] > 0 else 0
+            summary_content += f"{module}:\n"
+            summary_content += f"  - Total: {stats['total']}\n"
+            summary_content += f"  - Passed: {stats['passed']}\n"
+            summary_content += f"  - Failed: {stats['failed']}\n"
+            summary_content += f"  - Success Rate: {module_rate:.1f}%\n\n"
         
-        # Generate text summary
-        self.generate_summary_txt(test_results, total_time)
+        summary_path = os.path.join(Config.REPORT_DIR, "test_summary.txt")
+        with open(summary_path, 'w', encoding='utf-8') as f:
+            f.write(summary_content)
+            
+            # Failed tests details
+            if failed:
+                f.write("FAILED TESTS DETAILS:\n")
+                f.write("=====================\n")
+                shutil.copyfileobj(failures, f)
+            
+            # Performance trends against the rolling baseline
+            if trends.read(1):
+                trends.seek(0)
+                f.write("PERFORMANCE TRENDS:\n")
+                f.write("===================\n")
+                shutil.copyfileobj(trends, f)
+            
+            # Where the run's time went
+            timing_rows = self.render_timing_rows(timing)
+            if timing_rows:
+                f.write("SLOWEST TESTS:\n")
+                f.write("==============\n")
+                for label, seconds, phases in timing_rows:
+                    f.write(f"- {label}: {seconds:.2f}s" + (f" ({phases})" if phases else "") + "\n")
+                f.write("\nTIME BY MODULE:\n")
+                for module, seconds in timing['slowest_modules']:
+                    f.write(f"- {module}: {seconds:.2f}s\n")
+                f.write("\n")
+            
+            # Performance insights
+            f.write("PERFORMANCE INSIGHTS:\n")
+            f.write("=====================\n")
+            f.write(f"Total execution time: {total_time:.2f} seconds\n")
+            if total_time > 120:
+                f.write("⚠️  Performance Note: Test execution took more than 2 minutes. Consider optimizing.\n")
+            else:
+                f.write("✅ Performance: Test execution within acceptable time frame.\n")
         
-        # Also save JSON report for programmatic access
-        json_report = {
-            "summary": {
-                "total_tests": len(test_results),
-                "passed": len(passed_tests),
-                "failed": len(failed_tests),
-                "success_rate": (len(passed_tests)/len(test_results)*100 if test_results else 0),
-                "total_time": total_time,
-                "generated_at": datetime.now().isoformat()
-            },
-            "detailed_results": test_results
+        print(f"📄 Text summary generated: {summary_path}")
+        return summary_path
+    
+    def write_json_report(self, json_results, timing, total, passed, failed, success_rate, total_time):
+        """Save JSON report for programmatic access"""
+        summary = {
+            "total_tests": total,
+            "passed": passed,
+            "failed": failed,
+            "success_rate": success_rate,
+            "total_time": total_time,
+            "generated_at": datetime.now().isoformat()
         }
         
         json_path = os.path.join(Config.REPORT_DIR, "test_report.json")
         with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(json_report, f, indent=2)
-        
-        print(f"📊 HTML report generated: {report_path}")
-        print(f"📄 JSON report generated: {json_path}")
\ No newline at end of file
+            f.write('{\n"summary": ')
+            json.dump(summary, f, indent=2)
+            f.write(',\n"timing": ')
+            json.dump(timing, f, indent=2)
+            for key, value in self.report_data.items():
+                f.write(f",\n{json.dumps(key)}: ")
+                json.dump(value, f, indent=2, default=str)
+            f.write(',\n"detailed_results": [\n')
+            shutil.copyfileobj(json_results, f)
+            f.write("\n]\n}\n")
+        return json_path
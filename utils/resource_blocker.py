@@ -0,0 +1,109 @@
+import json
+import os
+import threading
+from config.config import Config
+from utils.browser_metrics import iter_performance_log
+
+
+class ResourceBlocker:
+    """Block resource categories per module with CDP ``Network.setBlockedURLs``.
+
+    Modules that only read DOM structure and text skip images, fonts, media
+    and tracker scripts. Each module name maps to a policy in
+    ``Config.FAST_MODE_POLICIES``. Modules without a policy, such as
+    Performance, load pages normally. Blocked requests are counted from the
+    performance log. Bytes avoided are estimated from transfer sizes learned
+    on unblocked loads and kept on disk between runs.
+    """
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, policies=None, size_cache_path=None):
+        self.policies = Config.FAST_MODE_POLICIES if policies is None else policies
+        self.path = size_cache_path or Config.RESOURCE_SIZE_CACHE_PATH
+        self.lock = threading.Lock()
+        self.sizes = {}
+        self.pages = []
+        self.load()
+
+    @classmethod
+    def shared(cls):
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.sizes = json.load(f)
+        except (OSError, ValueError):
+            self.sizes = {}
+
+    def save(self):
+        with self.lock:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.sizes, f)
+            os.replace(tmp_path, self.path)
+
+    def patterns_for(self, owner):
+        patterns = []
+        for category in self.policies.get(owner, []):
+            patterns.extend(Config.BLOCKED_RESOURCE_PATTERNS[category])
+        return patterns
+
+    def apply(self, driver, owner):
+        """Set the owner's block list on a driver; skipped if it is already active"""
+        patterns = self.patterns_for(owner)
+        if getattr(driver, "_blocked_url_patterns", []) == patterns:
+            return True
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+        except Exception:
+            return False  # Not a Chromium session; pages load unblocked
+        driver._blocked_url_patterns = patterns
+        return True
+
+    def learn_sizes(self, sizes):
+        """Remember the largest transfer size seen for each URL"""
+        with self.lock:
+            for url, size in sizes.items():
+                if size > self.sizes.get(url, 0):
+                    self.sizes[url] = size
+
+    def record_page(self, driver, url):
+        """Drain the performance log and record what blocking saved on a page"""
+        if not getattr(driver, "_blocked_url_patterns", None):
+            return None
+        request_urls = {}
+        blocked = []
+        for message in iter_performance_log(driver):
+            method = message.get("method")
+            params = message.get("params", {})
+            if method == "Network.requestWillBeSent":
+                request_urls[params.get("requestId")] = params.get("request", {}).get("url")
+            elif method == "Network.loadingFailed" and params.get("blockedReason"):
+                blocked.append(request_urls.get(params.get("requestId")))
+
+        with self.lock:
+            known = [self.sizes[blocked_url] for blocked_url in blocked if blocked_url in self.sizes]
+            page = {"url": url, "requests_blocked": len(blocked), "bytes_avoided": sum(known),
+                    "unknown_size": len(blocked) - len(known)}
+            self.pages.append(page)
+        return page
+
+    def get_summary(self):
+        with self.lock:
+            return {
+                "pages": len(self.pages),
+                "requests_blocked": sum(page["requests_blocked"] for page in self.pages),
+                "bytes_avoided": sum(page["bytes_avoided"] for page in self.pages),
+                "unknown_size": sum(page["unknown_size"] for page in self.pages),
+                "per_page": list(self.pages)
+            }
@@ -0,0 +1,102 @@
+import glob
+import json
+import os
+import threading
+import time
+from config.config import Config
+
+
+class ResultSink:
+    """Append-only JSONL stream of test results.
+
+    Every result is written and flushed as soon as a module logs it, so a
+    run that dies partway still leaves a complete record of what finished
+    (``python -m cli report --from`` renders it). Several processes may
+    append to the same file; each result is written as a single line in
+    one call.
+    """
+
+    _active = None
+
+    def __init__(self, path, rotate=False):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        if rotate:
+            rotate_stream(path)
+        self.file = open(path, 'a', encoding='utf-8')
+        self.lock = threading.Lock()
+
+    @classmethod
+    def install(cls, path, rotate=False):
+        """Make a sink the process-wide destination for emit_result.
+
+        With ``rotate`` a previous run's stream is kept aside (see
+        rotate_stream) and a fresh one started.
+        """
+        cls._active = cls(path, rotate=rotate)
+        return cls._active
+
+    @classmethod
+    def use(cls, sink):
+        """Make an existing sink (e.g. one forwarding to a coordinator) the destination"""
+        cls._active = sink
+        return sink
+
+    @classmethod
+    def active(cls):
+        return cls._active
+
+    def emit(self, result):
+        line = json.dumps(result, default=str) + "\n"
+        with self.lock:
+            self.file.write(line)
+            self.file.flush()
+
+    def close(self):
+        with self.lock:
+            self.file.close()
+        if ResultSink._active is self:
+            ResultSink._active = None
+
+
+def rotate_stream(path, keep=None):
+    """Move an existing stream to ``<name>.<timestamp>.jsonl``, keeping the newest ``keep`` of them.
+
+    Timestamps have microseconds plus a counter on collision, so rotations
+    within the same second never overwrite each other.
+    """
+    keep = Config.RESULTS_STREAM_KEEP if keep is None else keep
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        return None
+    root, ext = os.path.splitext(path)
+    mtime = os.path.getmtime(path)
+    stamp = f"{time.strftime('%Y%m%d-%H%M%S', time.localtime(mtime))}-{int(mtime * 1_000_000) % 1_000_000:06d}"
+    rotated = f"{root}.{stamp}{ext}"
+    counter = 1
+    while os.path.exists(rotated):
+        # Same microsecond (or a coarse filesystem clock): never overwrite an earlier stream
+        rotated = f"{root}.{stamp}-{counter}{ext}"
+        counter += 1
+    os.replace(path, rotated)
+    # Rotation keeps each stream's mtime, so the oldest come first
+    previous = sorted(glob.glob(f"{glob.escape(root)}.*{ext}"), key=lambda name: (os.path.getmtime(name), name))
+    for old in previous[:max(len(previous) - keep, 0)]:
+        os.remove(old)
+    return rotated
+
+
+def emit_result(result):
+    """Stream a result to the installed sink, if any"""
+    sink = ResultSink.active()
+    if sink is not None:
+        sink.emit(result)
+
+
+def iter_results(path):
+    """Lazily yield results from a JSONL stream, skipping a torn last line"""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
@@ -0,0 +1,104 @@
+import math
+import statistics
+from config.config import Config
+
+# Two-sided 95% Student's t critical values by degrees of freedom
+T_CRITICAL_95 = {1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365,
+                 8: 2.306, 9: 2.262, 10: 2.228, 12: 2.179, 15: 2.131, 20: 2.086, 30: 2.042}
+
+
+def t_critical(degrees_of_freedom):
+    """Conservative 95% t value: use the nearest tabulated df at or below"""
+    if degrees_of_freedom > 30:
+        return 1.96
+    usable = [df for df in T_CRITICAL_95 if df <= degrees_of_freedom]
+    return T_CRITICAL_95[max(usable)] if usable else T_CRITICAL_95[1]
+
+
+def percentile(values, pct):
+    """Linearly interpolated percentile of a list of numbers"""
+    ordered = sorted(values)
+    if not ordered:
+        return None
+    position = (len(ordered) - 1) * pct / 100
+    lower = math.floor(position)
+    upper = math.ceil(position)
+    if lower == upper:
+        return ordered[lower]
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def json_safe(data):
+    """Copy of nested dicts/lists with inf and NaN replaced by None, which strict JSON parsers accept"""
+    if isinstance(data, float):
+        return data if math.isfinite(data) else None
+    if isinstance(data, dict):
+        return {key: json_safe(value) for key, value in data.items()}
+    if isinstance(data, (list, tuple)):
+        return [json_safe(value) for value in data]
+    return data
+
+
+def summarize_samples(values):
+    """Return min/median/p95/p99/mean and a 95% confidence interval for the mean.
+
+    With a single sample (or a zero mean) the interval is infinite; pass the
+    summary through json_safe before serialising it.
+    """
+    if not values:
+        return None
+    mean = statistics.fmean(values)
+    if len(values) > 1:
+        half_width = t_critical(len(values) - 1) * statistics.stdev(values) / math.sqrt(len(values))
+    else:
+        half_width = float("inf")
+    return {
+        "samples": len(values),
+        "min": min(values),
+        "median": statistics.median(values),
+        "p95": percentile(values, 95),
+        "p99": percentile(values, 99),
+        "mean": mean,
+        "ci_low": mean - half_width,
+        "ci_high": mean + half_width,
+        "ci_relative": half_width / mean if mean else float("inf")
+    }
+
+
+class LoadTimeSampler:
+    """Repeat a measurement until its confidence interval is tight enough.
+
+    ``prepare`` runs before every iteration (e.g. clearing the cache) and
+    ``measure`` returns a dict of metric values. The first ``warmup``
+    iterations are discarded. Sampling stops after ``max_samples`` or once
+    the 95% CI of ``key_metric`` is within ``target_ci`` of its mean.
+    """
+
+    def __init__(self, min_samples=None, max_samples=None, warmup=None, target_ci=None, key_metric="load"):
+        self.min_samples = min_samples or Config.PERFORMANCE_MIN_SAMPLES
+        self.max_samples = max_samples or Config.PERFORMANCE_MAX_SAMPLES
+        self.warmup = Config.PERFORMANCE_WARMUP_SAMPLES if warmup is None else warmup
+        self.target_ci = target_ci or Config.PERFORMANCE_TARGET_CI
+        self.key_metric = key_metric
+
+    def run(self, measure, prepare=None):
+        """Collect samples and return ({metric: [values]}, last_sample)"""
+        samples = {}
+        last_sample = None
+        for iteration in range(self.warmup + self.max_samples):
+            if prepare:
+                prepare()
+            sample = measure()
+            if iteration < self.warmup:
+                continue
+            last_sample = sample
+            for name, value in sample.items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    samples.setdefault(name, []).append(value)
+
+            key_values = samples.get(self.key_metric, [])
+            if len(key_values) >= self.min_samples:
+                summary = summarize_samples(key_values)
+                if summary["ci_relative"] <= self.target_ci:
+                    break
+        return samples, last_sample
@@ -0,0 +1,131 @@
+import importlib
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from config.config import Config
+from utils.driver_pool import DriverPool
+from utils.result_sink import ResultSink, emit_result
+from utils.screenshot_manager import ScreenshotPipeline
+from utils.test_result import TestResult
+
+
+class ModuleSpec:
+    """Describes how to build and run one test module.
+
+    Specs only hold import paths and names so they can be sent to worker
+    processes as well as threads.
+    """
+
+    def __init__(self, name, banner, module_path, class_name, run_method, exclusive=False,
+                 kwargs=None, shardable=False, key=None, enabled_by=None):
+        self.name = name
+        # Short name for selecting the module on the command line
+        self.key = key or module_path.rsplit(".", 1)[-1]
+        self.banner = banner
+        self.module_path = module_path
+        self.class_name = class_name
+        self.run_method = run_method
+        self.exclusive = exclusive
+        # Extra constructor arguments, e.g. a shard of a data-driven module
+        self.kwargs = kwargs or {}
+        # Distributed runs may split the module with shard_index/shard_count
+        self.shardable = shardable
+        # Opt-in modules only run by default when this Config flag is set
+        self.enabled_by = enabled_by
+
+
+def crash_result(spec, message):
+    result = TestResult.create(spec.name, f"{spec.name} Execution", False, message).to_dict()
+    emit_result(result)
+    return result
+
+
+def run_module(spec, driver_pool=None, sink_path=None):
+    """Instantiate a module and run it, turning crashes into a FAIL result"""
+    print(f"\n{spec.banner}")
+    if sink_path and ResultSink.active() is None:
+        # Worker processes append to the parent's result stream
+        ResultSink.install(sink_path)
+    owns_pool = driver_pool is None
+    if owns_pool:
+        driver_pool = DriverPool.shared()
+    tester = None
+    try:
+        module_class = getattr(importlib.import_module(spec.module_path), spec.class_name)
+        tester = module_class(driver_pool, **spec.kwargs)
+        return getattr(tester, spec.run_method)()
+    except Exception as e:
+        print(f"❌ {spec.name} crashed: {str(e)}")
+        return [crash_result(spec, f"Module crashed: {str(e)}")]
+    finally:
+        # Hand back the session even if the module died before releasing it
+        if tester is not None and getattr(tester, "lease", None) is not None:
+            driver_pool.release(tester.lease)
+        if owns_pool:
+            # Worker processes never run atexit hooks, so close browsers here
+            # and finish writing any queued screenshots
+            driver_pool.shutdown()
+            ScreenshotPipeline.shared().close()
+
+
+def count_module_results(spec, driver_pool=None, sink_path=None):
+    """Run a module and return only how many results it produced; the results themselves are in the sink"""
+    return len(run_module(spec, driver_pool, sink_path) or [])
+
+
+class ModuleScheduler:
+    """Run independent test modules concurrently on a bounded set of workers.
+
+    Modules flagged ``exclusive`` (performance measurements) run on their own
+    after the concurrent batch so browser contention doesn't skew timings.
+    Results are merged back in spec order regardless of completion order.
+    """
+
+    def __init__(self, workers=None, mode=None, driver_pool=None):
+        self.workers = workers or Config.PARALLEL_WORKERS
+        self.mode = mode or Config.PARALLEL_MODE
+        self.driver_pool = driver_pool
+        self.coordinator_stats = None
+        if self.mode not in ("threads", "processes", "distributed"):
+            raise ValueError(f"Unknown scheduler mode: {self.mode}")
+
+    def _submit(self, executor, spec):
+        if self.mode == "processes":
+            # Each worker process owns its own pool and browsers
+            sink = ResultSink.active()
+            return executor.submit(count_module_results, spec, None, sink.path if sink else None)
+        return executor.submit(count_module_results, spec, self.driver_pool)
+
+    def run(self, specs):
+        """Execute all specs; returns {module name: result count} in spec order.
+
+        Results reach the report only through the result sink, so memory
+        doesn't grow with the number of results.
+        """
+        if self.mode == "distributed":
+            from utils.distributed import Coordinator
+            coordinator = Coordinator()
+            try:
+                return coordinator.run(specs)
+            finally:
+                self.coordinator_stats = coordinator.get_stats()
+
+        counts_by_index = {}
+        concurrent = [(i, spec) for i, spec in enumerate(specs) if not spec.exclusive]
+        exclusive = [(i, spec) for i, spec in enumerate(specs) if spec.exclusive]
+
+        if concurrent:
+            executor_class = ProcessPoolExecutor if self.mode == "processes" else ThreadPoolExecutor
+            with executor_class(max_workers=min(self.workers, len(concurrent))) as executor:
+                futures = {self._submit(executor, spec): (i, spec) for i, spec in concurrent}
+                for future in as_completed(futures):
+                    i, spec = futures[future]
+                    try:
+                        counts_by_index[i] = future.result()
+                    except Exception as e:
+                        # Only reachable if a worker process itself dies
+                        crash_result(spec, f"Worker failed: {str(e)}")
+                        counts_by_index[i] = 1
+
+        for i, spec in exclusive:
+            counts_by_index[i] = count_module_results(spec, self.driver_pool)
+
+        return {spec.name: counts_by_index.get(i, 0) for i, spec in enumerate(specs)}
@@ -1,16 +1,189 @@
+import base64
+import hashlib
+import io
 import os
-from datetime import datetime
+import queue
+import threading
+import time
 from config.config import Config
 
+EXTENSIONS = {"jpeg": "jpg", "webp": "webp", "png": "png"}
+
+
+def load_pillow():
+    """Pillow's Image module, imported on first use; None if Pillow is not installed.
+
+    Without Pillow frames are stored as captured PNGs, without thumbnails.
+    """
+    global _pillow
+    if _pillow is False:
+        try:
+            from PIL import Image
+        except ImportError:
+            Image = None
+        _pillow = Image
+    return _pillow
+
+
+_pillow = False
+
+
+def thumbnail_path(screenshot_path):
+    """Where the report thumbnail for a screenshot is written"""
+    name = os.path.splitext(os.path.basename(screenshot_path))[0]
+    return os.path.join(Config.SCREENSHOT_THUMB_DIR, f"{name}.jpg")
+
+
+class ScreenshotPipeline:
+    """Compress, deduplicate and thumbnail screenshots on a background thread.
+
+    ``submit`` only hashes the captured bytes and queues them; the final path
+    is decided up front so results can reference it straight away. Frames
+    with identical content share one file. Call ``flush`` or ``close``
+    before reading the files, e.g. when building reports.
+    """
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, image_format=None, quality=None, thumb_width=None):
+        self.format = (image_format or Config.SCREENSHOT_FORMAT).lower() if load_pillow() is not None else "png"
+        if self.format not in EXTENSIONS:
+            raise ValueError(f"Unsupported screenshot format: {self.format}")
+        self.quality = quality or Config.SCREENSHOT_QUALITY
+        self.thumb_width = thumb_width or Config.SCREENSHOT_THUMB_WIDTH
+        self.queue = queue.Queue()
+        self.lock = threading.Lock()
+        self.thread = None
+        self.paths = {}
+        self.stats = {"captured": 0, "duplicates": 0, "written": 0, "errors": 0,
+                      "raw_bytes": 0, "written_bytes": 0, "encode_time": 0.0}
+
+    @classmethod
+    def shared(cls):
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def submit(self, data, name, source_format="png"):
+        """Queue captured image bytes and return the path they will be written to"""
+        digest = hashlib.blake2b(data, digest_size=8).hexdigest()
+        with self.lock:
+            self.stats["captured"] += 1
+            self.stats["raw_bytes"] += len(data)
+            if digest in self.paths:
+                self.stats["duplicates"] += 1
+                return self.paths[digest]
+            path = os.path.join(Config.SCREENSHOT_DIR, f"{name}_{digest}.{EXTENSIONS[self.format]}")
+            self.paths[digest] = path
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._run, name="screenshot-writer", daemon=True)
+                self.thread.start()
+        self.queue.put((data, source_format, path))
+        return path
+
+    def _run(self):
+        while True:
+            job = self.queue.get()
+            try:
+                if job is None:
+                    return
+                self._write(*job)
+            except Exception as e:
+                with self.lock:
+                    self.stats["errors"] += 1
+                print(f"⚠️ Could not write screenshot: {str(e)}")
+            finally:
+                self.queue.task_done()
+
+    def _encode(self, image, image_format, quality):
+        buffer = io.BytesIO()
+        if image_format == "jpeg":
+            image.convert("RGB").save(buffer, "JPEG", quality=quality, optimize=True)
+        elif image_format == "webp":
+            image.save(buffer, "WEBP", quality=quality, method=4)
+        else:
+            image.save(buffer, "PNG", optimize=True)
+        return buffer.getvalue()
+
+    def _write(self, data, source_format, path):
+        if os.path.exists(path):
+            # Same frame as an earlier run of this test
+            with self.lock:
+                self.stats["duplicates"] += 1
+            return
+
+        start = time.perf_counter()
+        thumbnail = None
+        Image = load_pillow()
+        if Image is not None:
+            with Image.open(io.BytesIO(data)) as image:
+                if source_format != self.format or self.format == "png":
+                    data = self._encode(image, self.format, self.quality)
+                image.thumbnail((self.thumb_width, self.thumb_width * 4))
+                thumbnail = self._encode(image, "jpeg", self.quality)
+        encode_time = time.perf_counter() - start
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        if thumbnail is not None:
+            thumb_path = thumbnail_path(path)
+            os.makedirs(os.path.dirname(thumb_path), exist_ok=True)
+            with open(thumb_path, 'wb') as f:
+                f.write(thumbnail)
+
+        with self.lock:
+            self.stats["written"] += 1
+            self.stats["written_bytes"] += len(data)
+            self.stats["encode_time"] += encode_time
+
+    def flush(self):
+        """Block until every queued frame is on disk"""
+        self.queue.join()
+
+    def close(self):
+        """Drain the queue and stop the writer thread"""
+        with self.lock:
+            thread, self.thread = self.thread, None
+        if thread is not None:
+            self.queue.put(None)
+            thread.join()
+
+    def get_stats(self):
+        with self.lock:
+            stats = dict(self.stats)
+        stats["format"] = self.format
+        stats["pending"] = self.queue.qsize()
+        stats["encode_time"] = round(stats["encode_time"], 3)
+        return stats
+
+
 class ScreenshotManager:
-    def __init__(self, driver):
+    def __init__(self, driver, pipeline=None):
         self.driver = driver
-    
-    def capture_screenshot(self, test_name):
-        """Capture screenshot and save with descriptive name"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{test_name}_{timestamp}.png"
-        filepath = os.path.join(Config.SCREENSHOT_DIR, filename)
-        
-        self.driver.save_screenshot(filepath)
-        return filepath
\ No newline at end of file
+        self.pipeline = pipeline or ScreenshotPipeline.shared()
+
+    def capture_element(self, element):
+        """Capture just an element's box via CDP, encoded by the browser"""
+        rect = element.rect
+        params = {"format": self.pipeline.format, "captureBeyondViewport": True,
+                  "clip": {"x": rect["x"], "y": rect["y"], "width": rect["width"],
+                           "height": rect["height"], "scale": 1}}
+        if self.pipeline.format != "png":
+            params["quality"] = self.pipeline.quality
+        data = self.driver.execute_cdp_cmd("Page.captureScreenshot", params)["data"]
+        return base64.b64decode(data)
+
+    def capture_screenshot(self, test_name, element=None):
+        """Capture a screenshot (optionally clipped to an element) and queue it for writing"""
+        if element is not None:
+            try:
+                return self.pipeline.submit(self.capture_element(element), test_name, self.pipeline.format)
+            except Exception:
+                pass  # Element went stale or CDP is unavailable; fall back to the full viewport
+
+        return self.pipeline.submit(self.driver.get_screenshot_as_png(), test_name)
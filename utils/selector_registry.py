@@ -0,0 +1,109 @@
+import json
+import os
+import threading
+from config.config import Config
+from utils.locator import resolve_first_visible
+
+
+class SelectorRegistry:
+    """Central registry of fallback locators for each logical page element.
+
+    Every ``<NAME>_SELECTOR`` attribute on Config seeds the primary locator
+    for element ``NAME``; ``Config.SELECTOR_FALLBACKS`` adds alternatives.
+    The candidate that last matched on each page type is remembered on disk
+    and tried first on later runs. Elements whose primary locator keeps
+    missing are reported, since every fallback lookup costs time.
+    """
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, path=None):
+        self.path = path or Config.SELECTOR_CACHE_PATH
+        self.lock = threading.Lock()
+        self.elements = {}
+        for attribute in dir(Config):
+            if attribute.endswith("_SELECTOR"):
+                name = attribute[:-len("_SELECTOR")]
+                self.elements[name] = [tuple(getattr(Config, attribute))]
+        for name, fallbacks in Config.SELECTOR_FALLBACKS.items():
+            candidates = self.elements.setdefault(name, [])
+            for locator in fallbacks:
+                if tuple(locator) not in candidates:
+                    candidates.append(tuple(locator))
+
+        self.winners = {}
+        self.usage = {}
+        self.load()
+
+    @classmethod
+    def shared(cls):
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.winners = data.get("winners", {})
+            self.usage = data.get("usage", {})
+        except (OSError, ValueError):
+            self.winners, self.usage = {}, {}
+
+    def save(self):
+        with self.lock:
+            data = {"winners": self.winners, "usage": self.usage}
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp_path, self.path)
+
+    def candidates(self, name, page_type):
+        """Return the element's locators with the last winner for this page type first"""
+        if name not in self.elements:
+            raise KeyError(f"Unknown selector: {name}")
+        candidates = list(self.elements[name])
+        winner = self.winners.get(page_type, {}).get(name)
+        if winner and tuple(winner) in candidates:
+            candidates.remove(tuple(winner))
+            candidates.insert(0, tuple(winner))
+        return candidates
+
+    def resolve(self, driver, name, page_type, timeout=None):
+        """Resolve an element and learn which locator matched"""
+        resolution = resolve_first_visible(driver, self.candidates(name, page_type), timeout)
+        with self.lock:
+            stats = self.usage.setdefault(name, {"lookups": 0, "fallbacks": 0, "misses": 0})
+            stats["lookups"] += 1
+            if not resolution.found:
+                stats["misses"] += 1
+            else:
+                if resolution.locator != self.elements[name][0]:
+                    stats["fallbacks"] += 1
+                self.winners.setdefault(page_type, {})[name] = list(resolution.locator)
+        return resolution
+
+    def find(self, driver, name, page_type, timeout=None):
+        """Return the matched element, raising if no candidate matched"""
+        resolution = self.resolve(driver, name, page_type, timeout)
+        if not resolution.found:
+            raise Exception(f"No locator matched for {name} on {page_type} page")
+        return resolution.element
+
+    def fallback_report(self):
+        """Elements whose primary locator misses at least the configured rate"""
+        report = []
+        with self.lock:
+            for name, stats in self.usage.items():
+                if not stats["lookups"]:
+                    continue
+                rate = (stats["fallbacks"] + stats["misses"]) / stats["lookups"]
+                if rate >= Config.SELECTOR_FALLBACK_ALERT_RATE:
+                    report.append({"element": name, "primary": list(self.elements[name][0]) if name in self.elements else None,
+                                   "fallback_rate": round(rate * 100, 1), **stats})
+        return sorted(report, key=lambda item: item["fallback_rate"], reverse=True)
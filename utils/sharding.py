@@ -0,0 +1,160 @@
+import csv
+import itertools
+import json
+import os
+import threading
+import time
+from collections import deque
+from config.config import Config
+
+
+class WorkItem:
+    """One parameterised test invocation, e.g. ``search`` with ``query=laptop``"""
+
+    def __init__(self, test, params):
+        self.test = test
+        self.params = params
+
+    @property
+    def label(self):
+        return ", ".join(f"{name}={value}" for name, value in self.params.items())
+
+
+def load_data_set(source, column=None):
+    """Return a list of values from a list, or from a CSV or JSON file.
+
+    CSV files need a header row; ``column`` picks the column (default: the
+    first). JSON files hold a list of values or of objects, from which
+    ``column`` (default: the first key) is taken.
+    """
+    if not isinstance(source, str):
+        return list(source)
+    extension = os.path.splitext(source)[1].lower()
+    with open(source, 'r', encoding='utf-8', newline='') as f:
+        if extension == ".csv":
+            reader = csv.DictReader(f)
+            column = column or reader.fieldnames[0]
+            # Short rows leave trailing columns as None
+            values = ((row.get(column) or "").strip() for row in reader)
+            return [value for value in values if value]
+        if extension == ".json":
+            values = json.load(f)
+            if values and isinstance(values[0], dict):
+                column = column or next(iter(values[0]))
+                return [value[column] for value in values if column in value]
+            return values
+    raise ValueError(f"Unsupported data set format: {source}")
+
+
+def expand_matrix(test, **axes):
+    """Expand named value lists into one work item per combination"""
+    names = list(axes)
+    return [WorkItem(test, dict(zip(names, values)))
+            for values in itertools.product(*(axes[name] for name in names))]
+
+
+class ShardWorker:
+    """Per-thread context handed to work item handlers.
+
+    The browser is leased on first use, so items that only need HTTP never
+    hold a session.
+    """
+
+    def __init__(self, index, driver_pool, owner):
+        self.index = index
+        self.driver_pool = driver_pool
+        self.owner = owner
+        self.lease = None
+        self.items_run = 0
+        self.items_stolen = 0
+        self.busy_time = 0.0
+
+    @property
+    def driver(self):
+        if self.lease is None:
+            self.lease = self.driver_pool.acquire(self.owner)
+        return self.lease.driver
+
+    def release(self):
+        if self.lease is not None:
+            self.driver_pool.release(self.lease)
+            self.lease = None
+
+    def to_dict(self, wall_time):
+        return {"worker": self.index, "items": self.items_run, "stolen": self.items_stolen,
+                "busy_time": round(self.busy_time, 3),
+                "utilization": round(self.busy_time / wall_time * 100, 1) if wall_time else 0.0}
+
+
+class WorkStealingExecutor:
+    """Run work items on a fixed set of browser workers that steal when idle.
+
+    Items are dealt round-robin into one deque per worker. A worker takes
+    from the front of its own deque and, once that is empty, steals from the
+    back of the longest other deque, so slow items on one worker don't leave
+    the rest idle. Items take seconds each, so a single lock around the
+    deques costs nothing measurable.
+    """
+
+    def __init__(self, workers=None, driver_pool=None, owner="Data Driven"):
+        self.workers = workers or Config.DATA_DRIVEN_WORKERS
+        self.driver_pool = driver_pool
+        self.owner = owner
+        self.last_stats = None
+
+    def run(self, items, handler):
+        """Call ``handler(worker, item)`` for every item; returns outcomes in item order.
+
+        An outcome is the handler's return value, or the exception it raised.
+        """
+        items = list(items)
+        if not items:
+            return []
+        worker_count = min(self.workers, len(items))
+        queues = [deque() for _ in range(worker_count)]
+        for index, item in enumerate(items):
+            queues[index % worker_count].append((index, item))
+        lock = threading.Lock()
+        outcomes = [None] * len(items)
+        workers = [ShardWorker(i, self.driver_pool, self.owner) for i in range(worker_count)]
+
+        def next_item(worker):
+            with lock:
+                own = queues[worker.index]
+                if own:
+                    return own.popleft()
+                victim = max(queues, key=len)
+                if victim:
+                    worker.items_stolen += 1
+                    return victim.pop()
+                return None
+
+        def work(worker):
+            try:
+                while True:
+                    job = next_item(worker)
+                    if job is None:
+                        return
+                    index, item = job
+                    start = time.monotonic()
+                    try:
+                        outcomes[index] = handler(worker, item)
+                    except Exception as e:
+                        outcomes[index] = e
+                    worker.busy_time += time.monotonic() - start
+                    worker.items_run += 1
+            finally:
+                worker.release()
+
+        start = time.monotonic()
+        threads = [threading.Thread(target=work, args=(worker,), name=f"shard-{worker.index}")
+                   for worker in workers]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        wall_time = time.monotonic() - start
+
+        self.last_stats = {"items": len(items), "workers": worker_count, "wall_time": round(wall_time, 3),
+                           "per_worker": [worker.to_dict(wall_time) for worker in workers]}
+        return outcomes
@@ -0,0 +1,80 @@
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+
+class TestTimer:
+    """Monotonic timing for one test, split into named phases"""
+
+    __test__ = False  # Not a pytest test class
+
+    def __init__(self):
+        self.started_at = time.monotonic()
+        self.ended_at = None
+        self.phases = {}
+        self.retries = 0
+
+    @contextmanager
+    def phase(self, name):
+        """Time a block as ``setup``, ``action`` or ``assertion``"""
+        phase_start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.monotonic() - phase_start
+
+    def retry(self):
+        self.retries += 1
+
+    def stop(self):
+        if self.ended_at is None:
+            self.ended_at = time.monotonic()
+        return self.ended_at - self.started_at
+
+
+@dataclass(slots=True)
+class TestResult:
+    """Result record shared by every test module"""
+
+    __test__ = False
+
+    module: str
+    test_name: str
+    status: str
+    message: str
+    timestamp: str = field(default_factory=lambda: time.strftime("%Y-%m-%d %H:%M:%S"))
+    screenshot: str = None
+    started_at: float = None
+    ended_at: float = None
+    duration: float = None
+    phases: dict = None
+    retries: int = 0
+    session_id: str = None
+    metrics: dict = None
+
+    @classmethod
+    def create(cls, module, test_name, passed, message, timer=None, driver=None, **extra):
+        """Build a result, closing the test's timer and tagging the driver session"""
+        result = cls(module=module, test_name=test_name,
+                     status="PASS" if passed else "FAIL", message=message, **extra)
+        if timer is not None:
+            result.duration = round(timer.stop(), 4)
+            result.started_at = timer.started_at
+            result.ended_at = timer.ended_at
+            result.phases = {name: round(value, 4) for name, value in timer.phases.items()}
+            result.retries = timer.retries
+        if driver is not None:
+            result.session_id = getattr(driver, "session_id", None)
+        return result
+
+    def to_dict(self):
+        """Serialise compactly, omitting fields that were never set"""
+        data = {}
+        for name in self.__slots__:
+            value = getattr(self, name)
+            if value is None or (name == "retries" and not value):
+                continue
+            data[name] = value
+        # Reports always expect a screenshot key
+        data.setdefault("screenshot", None)
+        return data